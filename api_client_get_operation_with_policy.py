@@ -0,0 +1,25 @@
+from clients.gateway import build_grpc_gateway_clients, build_http_gateway_clients
+from clients.policies import CallPolicySchema, DEFAULT_CALL_POLICY, OperationPolicySchema, policy_stats
+
+# Дедлайны для всех операций, повторы для чтения, а для get_operation ещё и дублирующий запрос,
+# если ответа нет дольше 50 мс (примерно p95 операции)
+policy = CallPolicySchema(
+    default=DEFAULT_CALL_POLICY.default,
+    reads=DEFAULT_CALL_POLICY.reads,
+    operations={
+        "get_operation": OperationPolicySchema(deadline=2, attempt_timeout=1, max_attempts=3, hedge_delay=0.05)
+    }
+)
+
+for clients in (build_http_gateway_clients(policy=policy), build_grpc_gateway_clients(policy=policy)):
+    create_user_response = clients.users.create_user()
+    open_account_response = clients.accounts.open_credit_card_account(create_user_response.user.id)
+    account = open_account_response.account
+
+    make_operation_response = clients.operations.make_purchase_operation(account.cards[0].id, account.id)
+    for _ in range(100):
+        clients.operations.get_operation(make_operation_response.operation.id)
+
+# Сколько запросов реально ушло в шлюз сверх вызовов клиента
+for name, stats in sorted(policy_stats.snapshot().items()):
+    print(name, stats)
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from benchmarks.runner import ClientBenchmark
+from benchmarks.schema import BenchmarkReportSchema
+
+REPORT_PATH = Path("benchmark_clients.json")
+BASELINE_PATH = Path("benchmark_clients.baseline.json")
+
+# Накладные расходы каждого метода HTTP- и gRPC-клиентов без сети и настоящего шлюза:
+# ops_per_core — сколько вызовов в секунду способно выдать одно ядро генератора нагрузки
+report = ClientBenchmark().run()
+REPORT_PATH.write_text(report.model_dump_json(indent=2))
+
+for result in report.results:
+    print(
+        f"{result.name:<45} {result.ops_per_second:>9.0f} ops/s {result.cpu_per_call:>8.1f} us CPU "
+        f"{result.ops_per_core:>9.0f} ops/core {result.allocated_per_call:>8} B"
+    )
+
+# Отчёт с другого коммита (например, с основной ветки), с которым сравниваются результаты
+if BASELINE_PATH.exists():
+    baseline = BenchmarkReportSchema.model_validate_json(BASELINE_PATH.read_text())
+    print(f"\nCompared with {baseline.commit}:")
+    for comparison in report.compare(baseline):
+        print(f"{comparison.name:<45} CPU {comparison.cpu_change:+.1%} memory {comparison.allocated_change:+.1%}")
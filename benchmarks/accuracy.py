@@ -0,0 +1,119 @@
+from benchmarks.schema import LatencyAccuracyReportSchema, QuantileAccuracySchema
+from clients.gateway import build_grpc_gateway_clients
+from load.executor import OpenModelExecutor
+from load.schema import ArrivalDistribution, ArrivalProfileSchema, OpenModelReportSchema
+from stubs.gateway.faults import get_latency_quantile
+from stubs.gateway.schema import (
+    FaultProfileSchema,
+    GatewayStubSettingsSchema,
+    LatencyProfileSchema,
+    OperationFaultsSchema
+)
+from stubs.gateway.server import ThreadedGatewayStub
+from tools.metrics.aggregator import LatencyAggregator
+
+CHECK_NAME = "get_user"
+
+
+class LatencyAccuracyCheck:
+    """
+    Сверяет перцентили LatencyAggregator с точными квантилями распределения задержки (get_latency_quantile).
+
+    gRPC-заглушка в фоновом потоке добавляет к get_user задержку из profile, OpenModelExecutor
+    вызывает get_user по расписанию arrival. Сначала тот же прогон выполняется без задержки:
+    его медиана — накладные расходы клиента и заглушки, которые вычитаются из записанных перцентилей.
+
+    Перцентиль проходит проверку, если |measured - expected| <= tolerance * expected + slack.
+    Допуск покрывает выборочную ошибку хвостовых перцентилей, slack — разброс накладных расходов.
+
+    :param profile: Распределение задержки get_user.
+    :param arrival: Профиль поступления вызовов.
+    :param percentiles: Проверяемые перцентили.
+    :param tolerance: Допустимая относительная ошибка.
+    :param slack: Допустимая абсолютная ошибка в секундах.
+    :param seed: Зерно генератора задержек заглушки.
+    """
+
+    def __init__(
+            self,
+            profile: LatencyProfileSchema,
+            arrival: ArrivalProfileSchema = ArrivalProfileSchema(
+                rate=200,
+                duration=20,
+                distribution=ArrivalDistribution.POISSON,
+                seed=0
+            ),
+            percentiles: tuple[float, ...] = (50.0, 90.0, 99.0),
+            tolerance: float = 0.1,
+            slack: float = 0.002,
+            seed: int = 0
+    ):
+        self.profile = profile
+        self.arrival = arrival
+        self.percentiles = percentiles
+        self.tolerance = tolerance
+        self.slack = slack
+        self.seed = seed
+
+    def run_phase(
+            self,
+            faults: FaultProfileSchema,
+            aggregator: LatencyAggregator,
+            arrival: ArrivalProfileSchema
+    ) -> OpenModelReportSchema:
+        """
+        :param faults: Профиль сбоев заглушки.
+        :param aggregator: Агрегатор, в который пишутся задержки.
+        :param arrival: Профиль поступления вызовов.
+        :return: Итоги прогона.
+        """
+        settings = GatewayStubSettingsSchema(host="localhost", http_port=None, grpc_port=0, faults=faults)
+        with ThreadedGatewayStub(settings) as stub:
+            clients = build_grpc_gateway_clients(target=f"localhost:{stub.grpc_port}")
+            try:
+                user_id = clients.users.create_user().user.id
+                executor = OpenModelExecutor(CHECK_NAME, lambda: clients.users.get_user(user_id), aggregator)
+                return executor.run(arrival)
+            finally:
+                clients.users.channel.close()
+
+    def run(self) -> LatencyAccuracyReportSchema:
+        """
+        :return: Записанные и точные перцентили задержки.
+        """
+        # Накладные расходы почти постоянны, поэтому для их медианы хватает короткого прогона
+        baseline = LatencyAggregator()
+        self.run_phase(
+            FaultProfileSchema(),
+            baseline,
+            self.arrival.model_copy(update={"duration": min(self.arrival.duration, 5.0)})
+        )
+        overhead = baseline.histograms[f"{CHECK_NAME}.service"].percentiles((50.0,))[50.0]
+
+        aggregator = LatencyAggregator()
+        report = self.run_phase(
+            FaultProfileSchema(seed=self.seed, operations={CHECK_NAME: OperationFaultsSchema(latency=self.profile)}),
+            aggregator,
+            self.arrival
+        )
+        recorded = aggregator.histograms[f"{CHECK_NAME}.service"].percentiles(self.percentiles)
+
+        quantiles = []
+        for percentile in self.percentiles:
+            expected = int(get_latency_quantile(self.profile, percentile / 100) * 1_000_000)
+            measured = max(recorded[percentile] - overhead, 0)
+            allowed = self.tolerance * expected + self.slack * 1_000_000
+            quantiles.append(QuantileAccuracySchema(
+                percentile=percentile,
+                expected=expected,
+                measured=measured,
+                error=measured - expected,
+                ok=abs(measured - expected) <= allowed
+            ))
+
+        return LatencyAccuracyReportSchema(
+            profile=self.profile,
+            report=report,
+            overhead=overhead,
+            quantiles=quantiles
+        )
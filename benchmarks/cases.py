@@ -0,0 +1,129 @@
+from scenarios.flows import CREATE_USER_STEP
+from scenarios.schema import ScenarioSchema, ScenarioStepSchema
+
+# Количество операций на счете, по которому читаются get_operations и get_operations_summary
+HISTORY_OPERATIONS = 10
+
+# Сущности, которые читают и изменяют бенчмарки. Методы, создающие сущности, работают со своим
+# пользователем и счетом (writer_*), чтобы ответы читающих методов не росли по ходу прогона.
+CLIENT_BENCHMARK_SETUP_SCENARIO = ScenarioSchema(
+    name="client_benchmark_setup",
+    steps=[
+        CREATE_USER_STEP,
+        ScenarioStepSchema(
+            name="open_credit_card_account",
+            client="accounts",
+            method="open_credit_card_account",
+            inputs={"user_id": "user_id"},
+            outputs={"account_id": "account.id", "card_id": "account.cards.0.id"}
+        ),
+        ScenarioStepSchema(
+            name="make_purchase_operation",
+            client="operations",
+            method="make_purchase_operation",
+            inputs={"card_id": "card_id", "account_id": "account_id"},
+            outputs={"operation_id": "operation.id"}
+        ),
+        ScenarioStepSchema(
+            name="open_debit_card_account",
+            client="accounts",
+            method="open_debit_card_account",
+            inputs={"user_id": "user_id"},
+            outputs={"history_account_id": "account.id", "history_card_id": "account.cards.0.id"}
+        ),
+        *[
+            ScenarioStepSchema(
+                name=f"make_top_up_operation_{number}",
+                client="operations",
+                method="make_top_up_operation",
+                inputs={"card_id": "history_card_id", "account_id": "history_account_id"}
+            )
+            for number in range(HISTORY_OPERATIONS)
+        ],
+        ScenarioStepSchema(
+            name="create_writer_user",
+            client="users",
+            method="create_user",
+            outputs={"writer_user_id": "user.id"}
+        ),
+        ScenarioStepSchema(
+            name="open_writer_account",
+            client="accounts",
+            method="open_debit_card_account",
+            inputs={"user_id": "writer_user_id"},
+            outputs={"writer_account_id": "account.id", "writer_card_id": "account.cards.0.id"}
+        ),
+    ]
+)
+
+_WRITER_USER = {"user_id": "writer_user_id"}
+_WRITER_CARD = {"user_id": "writer_user_id", "account_id": "writer_account_id"}
+_WRITER_OPERATION = {"card_id": "writer_card_id", "account_id": "writer_account_id"}
+
+# Все высокоуровневые методы клиентов шлюза. Имена методов у HTTP- и gRPC-клиентов совпадают,
+# поэтому один список годится для обоих транспортов.
+CLIENT_BENCHMARK_CASES = [
+    ScenarioStepSchema(name="users.get_user", client="users", method="get_user", inputs={"user_id": "user_id"}),
+    ScenarioStepSchema(name="users.create_user", client="users", method="create_user"),
+    ScenarioStepSchema(
+        name="accounts.get_accounts",
+        client="accounts",
+        method="get_accounts",
+        inputs={"user_id": "user_id"}
+    ),
+    *[
+        ScenarioStepSchema(name=f"accounts.{method}", client="accounts", method=method, inputs=_WRITER_USER)
+        for method in (
+            "open_deposit_account",
+            "open_savings_account",
+            "open_debit_card_account",
+            "open_credit_card_account"
+        )
+    ],
+    *[
+        ScenarioStepSchema(name=f"cards.{method}", client="cards", method=method, inputs=_WRITER_CARD)
+        for method in ("issue_virtual_card", "issue_physical_card")
+    ],
+    *[
+        ScenarioStepSchema(
+            name=f"documents.{method}",
+            client="documents",
+            method=method,
+            inputs={"account_id": "account_id"}
+        )
+        for method in ("get_tariff_document", "get_contract_document")
+    ],
+    ScenarioStepSchema(
+        name="operations.get_operation",
+        client="operations",
+        method="get_operation",
+        inputs={"operation_id": "operation_id"}
+    ),
+    ScenarioStepSchema(
+        name="operations.get_operation_receipt",
+        client="operations",
+        method="get_operation_receipt",
+        inputs={"operation_id": "operation_id"}
+    ),
+    *[
+        ScenarioStepSchema(
+            name=f"operations.{method}",
+            client="operations",
+            method=method,
+            inputs={"account_id": "history_account_id"}
+        )
+        for method in ("get_operations", "get_operations_summary")
+    ],
+    *[
+        ScenarioStepSchema(name=f"operations.{method}", client="operations", method=method, inputs=_WRITER_OPERATION)
+        for method in (
+            "make_fee_operation",
+            "make_top_up_operation",
+            "make_cashback_operation",
+            "make_transfer_operation",
+            "make_purchase_operation",
+            "make_bill_payment_operation",
+            "make_cash_withdrawal_operation"
+        )
+    ],
+]
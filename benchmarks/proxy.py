@@ -0,0 +1,110 @@
+import asyncio
+import multiprocessing
+import socket
+from typing import Any
+
+# Индексы счетчиков: байты от клиента к серверу и от сервера к клиенту
+SENT = 0
+RECEIVED = 1
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, counters: Any, index: int) -> None:
+    try:
+        while data := await reader.read(65536):
+            counters[index] += len(data)
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _serve(sock: socket.socket, upstream_host: str, upstream_port: int, counters: Any) -> None:
+    async def handle(client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter) -> None:
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(upstream_host, upstream_port)
+        except OSError:
+            client_writer.close()
+            return
+
+        await asyncio.gather(
+            _pipe(client_reader, upstream_writer, counters, SENT),
+            _pipe(upstream_reader, client_writer, counters, RECEIVED)
+        )
+
+    server = await asyncio.start_server(handle, sock=sock)
+    async with server:
+        await server.serve_forever()
+
+
+def _run_proxy(sock: socket.socket, upstream_host: str, upstream_port: int, counters: Any) -> None:
+    try:
+        asyncio.run(_serve(sock, upstream_host, upstream_port, counters))
+    except KeyboardInterrupt:
+        pass
+
+
+class ByteCountingProxy:
+    """
+    TCP-прокси, считающий байты в обе стороны: всё, что уходит в сокет, включая HTTP-заголовки,
+    кадры HTTP/2 и служебный трафик gRPC, а не только тела запросов и ответов.
+
+    Прокси работает в отдельном процессе, чтобы его процессорное время не попадало в замеры клиента.
+    Процесс создаётся через fork, поэтому прокси нужно запускать до создания gRPC-каналов.
+
+    :param upstream: Адрес сервера в виде host:port.
+    :param host: Адрес, на котором слушает прокси (порт выбирает система).
+    """
+
+    def __init__(self, upstream: str, host: str = "localhost"):
+        upstream_host, _, upstream_port = upstream.rpartition(":")
+        self.upstream_host = upstream_host
+        self.upstream_port = int(upstream_port)
+        self.host = host
+        self.port: int | None = None
+        self.context = multiprocessing.get_context("fork")
+        # Пишет только процесс прокси, поэтому блокировка не нужна
+        self.counters = self.context.Array("q", 2, lock=False)
+        self.process: multiprocessing.Process | None = None
+
+    @property
+    def address(self) -> str:
+        """
+        :return: Адрес прокси в виде host:port, к которому нужно подключать клиентов.
+        """
+        return f"{self.host}:{self.port}"
+
+    def start(self) -> None:
+        # Сокет слушает уже после выхода из start(), поэтому клиенты могут подключаться сразу
+        sock = socket.create_server((self.host, 0))
+        self.port = sock.getsockname()[1]
+        self.process = self.context.Process(
+            target=_run_proxy,
+            args=(sock, self.upstream_host, self.upstream_port, self.counters),
+            name=f"byte-counting-proxy-{self.port}",
+            daemon=True
+        )
+        self.process.start()
+        sock.close()
+
+    def stop(self) -> None:
+        if self.process is None:
+            return
+
+        self.process.terminate()
+        self.process.join()
+        self.process = None
+
+    def get_counters(self) -> tuple[int, int]:
+        """
+        :return: (отправлено клиентами, получено клиентами) байт с момента запуска.
+        """
+        return self.counters[SENT], self.counters[RECEIVED]
+
+    def __enter__(self) -> "ByteCountingProxy":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
@@ -0,0 +1,196 @@
+import gc
+import platform
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from httpx import Request, Response
+
+from benchmarks.cases import CLIENT_BENCHMARK_CASES, CLIENT_BENCHMARK_SETUP_SCENARIO
+from benchmarks.schema import BenchmarkReportSchema, BenchmarkResultSchema
+from clients.gateway import build_grpc_gateway_clients, build_http_gateway_clients, GatewayClients
+from clients.http.decoding import HTTPDecodeMode
+from clients.instrumentation import Transport
+from scenarios.engine import ScenarioRunner
+from scenarios.schema import ScenarioStepSchema
+from stubs.gateway.schema import GatewayStubSettingsSchema
+from stubs.gateway.server import build_gateway_mock_transport, ThreadedGatewayStub
+from tools.fakers import fake
+from tools.metrics.aggregator import LatencyAggregator
+
+
+def get_commit() -> str | None:
+    """
+    :return: Хеш текущего git-коммита или None, если это не git-репозиторий.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class StubTimer:
+    """
+    Считает процессорное время, которое обработчик httpx.MockTransport провёл в потоке клиента.
+
+    MockTransport вызывает заглушку в том же потоке, поэтому её работу нужно вычесть из времени клиента.
+    gRPC-заглушка работает в своём потоке и в time.thread_time() клиента не попадает.
+    """
+
+    def __init__(self):
+        self.cpu = 0.0
+
+    def wrap(self, handler: Callable[[Request], Response]) -> Callable[[Request], Response]:
+        def timed(request: Request) -> Response:
+            start = time.thread_time()
+            try:
+                return handler(request)
+            finally:
+                self.cpu += time.thread_time() - start
+
+        return timed
+
+
+class ClientBenchmark:
+    """
+    Замеряет накладные расходы каждого метода клиентов шлюза на заглушке в том же процессе.
+
+    HTTP-клиенты работают через httpx.MockTransport, gRPC-клиенты — через gRPC-заглушку
+    в фоновом потоке. Клиенты создаются теми же фабриками, что и в нагрузке (с инструментированием
+    и проверкой контрактов), поэтому в замер входит всё, что клиент делает на вызов: генерация
+    данных, сборка и сериализация запроса, разбор и проверка ответа.
+
+    Каждый метод замеряется дважды: сначала время (iterations вызовов), затем память
+    (allocation_iterations вызовов под tracemalloc, который сильно замедляет вызовы).
+
+    :param cases: Методы клиентов; inputs — ключи контекста CLIENT_BENCHMARK_SETUP_SCENARIO.
+    :param iterations: Количество замеряемых вызовов каждого метода.
+    :param warmup: Количество вызовов для прогрева перед замером.
+    :param allocation_iterations: Количество вызовов для замера памяти.
+    :param decode_mode: Способ разбора ответов HTTP-клиентами.
+    :param seed: Зерно генератора тестовых данных.
+    """
+
+    def __init__(
+            self,
+            cases: list[ScenarioStepSchema] = CLIENT_BENCHMARK_CASES,
+            iterations: int = 2000,
+            warmup: int = 200,
+            allocation_iterations: int = 200,
+            decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE,
+            seed: int = 0
+    ):
+        self.cases = cases
+        self.iterations = iterations
+        self.warmup = warmup
+        self.allocation_iterations = allocation_iterations
+        self.decode_mode = decode_mode
+        self.seed = seed
+
+    def run_case(
+            self,
+            clients: GatewayClients,
+            case: ScenarioStepSchema,
+            context: dict[str, Any],
+            timer: StubTimer | None = None
+    ) -> BenchmarkResultSchema:
+        """
+        :param clients: Клиенты шлюза.
+        :param case: Метод клиента.
+        :param context: Контекст после CLIENT_BENCHMARK_SETUP_SCENARIO.
+        :param timer: Счетчик времени заглушки, которое нужно вычесть из времени клиента.
+        :return: Результат замера метода.
+        """
+        method = getattr(clients.get(case.client), case.method)
+        kwargs = {argument: context[key] for argument, key in case.inputs.items()}
+
+        for _ in range(self.warmup):
+            method(**kwargs)
+
+        gc.collect()
+        stub_cpu = timer.cpu if timer else 0.0
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        for _ in range(self.iterations):
+            method(**kwargs)
+
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start - ((timer.cpu - stub_cpu) if timer else 0.0)
+
+        gc.collect()
+        allocated = 0
+        tracemalloc.start()
+        try:
+            for _ in range(self.allocation_iterations):
+                current = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                method(**kwargs)
+                allocated += tracemalloc.get_traced_memory()[1] - current
+        finally:
+            tracemalloc.stop()
+
+        cpu_per_call = cpu / self.iterations * 1_000_000
+        return BenchmarkResultSchema(
+            name=f"{clients.transport}:{case.name}",
+            transport=clients.transport,
+            client=case.client,
+            method=case.method,
+            iterations=self.iterations,
+            ops_per_second=self.iterations / wall,
+            cpu_per_call=cpu_per_call,
+            ops_per_core=1_000_000 / cpu_per_call if cpu_per_call > 0 else 0.0,
+            allocated_per_call=allocated // max(self.allocation_iterations, 1)
+        )
+
+    def run_clients(self, clients: GatewayClients, timer: StubTimer | None = None) -> list[BenchmarkResultSchema]:
+        """
+        :param clients: Клиенты шлюза, подключенные к заглушке.
+        :param timer: Счетчик времени заглушки (для MockTransport).
+        :return: Результаты по всем методам.
+        """
+        fake.seed(self.seed)
+        context = ScenarioRunner(CLIENT_BENCHMARK_SETUP_SCENARIO, clients, LatencyAggregator()).run_once()
+        return [self.run_case(clients, case, context, timer) for case in self.cases]
+
+    def run_http(self) -> list[BenchmarkResultSchema]:
+        timer = StubTimer()
+        transport = build_gateway_mock_transport()
+        transport.handler = timer.wrap(transport.handler)
+
+        clients = build_http_gateway_clients(decode_mode=self.decode_mode, transport=transport)
+        try:
+            return self.run_clients(clients, timer)
+        finally:
+            clients.users.client.close()
+
+    def run_grpc(self) -> list[BenchmarkResultSchema]:
+        settings = GatewayStubSettingsSchema(host="localhost", http_port=None, grpc_port=0)
+        with ThreadedGatewayStub(settings) as stub:
+            clients = build_grpc_gateway_clients(target=f"localhost:{stub.grpc_port}")
+            try:
+                return self.run_clients(clients)
+            finally:
+                clients.users.channel.close()
+
+    def run(self, transports: tuple[Transport, ...] = (Transport.HTTP, Transport.GRPC)) -> BenchmarkReportSchema:
+        """
+        :param transports: Транспорты, клиенты которых нужно замерить.
+        :return: Отчёт с результатами и коммитом, на котором они получены.
+        """
+        results = []
+        if Transport.HTTP in transports:
+            results.extend(self.run_http())
+        if Transport.GRPC in transports:
+            results.extend(self.run_grpc())
+
+        return BenchmarkReportSchema(
+            commit=get_commit(),
+            python=platform.python_version(),
+            results=results
+        )
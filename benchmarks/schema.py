@@ -0,0 +1,169 @@
+from pydantic import BaseModel
+
+from clients.instrumentation import Transport
+from load.schema import ArrivalProfileSchema, OpenModelReportSchema
+from stubs.gateway.schema import LatencyProfileSchema
+from tools.metrics.aggregator import OperationLatencyReport
+
+
+class BenchmarkResultSchema(BaseModel):
+    """
+    Накладные расходы одного метода клиента шлюза.
+
+    ops_per_second  — вызовов в секунду по настенным часам вместе с работой заглушки.
+    cpu_per_call    — процессорное время клиента на вызов в микросекундах (без работы заглушки).
+    ops_per_core    — сколько вызовов в секунду способно выдать одно ядро генератора: 1e6 / cpu_per_call.
+    allocated_per_call — средний пиковый прирост памяти за вызов в байтах (tracemalloc).
+    """
+    name: str
+    transport: Transport
+    client: str
+    method: str
+    iterations: int
+    ops_per_second: float
+    cpu_per_call: float
+    ops_per_core: float
+    allocated_per_call: int
+
+
+class BenchmarkComparisonSchema(BaseModel):
+    """
+    Сравнение метода с базовым прогоном; изменения — в долях (0.1 — на 10% больше).
+    """
+    name: str
+    cpu_per_call: float
+    baseline_cpu_per_call: float
+    cpu_change: float
+    allocated_per_call: int
+    baseline_allocated_per_call: int
+    allocated_change: float
+
+
+class BenchmarkReportSchema(BaseModel):
+    """
+    Результаты прогона бенчмарков клиентов.
+
+    commit и python сохраняются вместе с результатами, чтобы отчёты разных коммитов
+    можно было сравнивать через compare().
+    """
+    commit: str | None = None
+    python: str
+    results: list[BenchmarkResultSchema]
+
+    def compare(self, baseline: "BenchmarkReportSchema") -> list[BenchmarkComparisonSchema]:
+        """
+        :param baseline: Отчёт, с которым сравнивается текущий (например, с основной ветки).
+        :return: Сравнение по методам, которые есть в обоих отчётах.
+        """
+        baseline_results = {result.name: result for result in baseline.results}
+        comparisons = []
+        for result in self.results:
+            previous = baseline_results.get(result.name)
+            if previous is None:
+                continue
+
+            comparisons.append(BenchmarkComparisonSchema(
+                name=result.name,
+                cpu_per_call=result.cpu_per_call,
+                baseline_cpu_per_call=previous.cpu_per_call,
+                cpu_change=result.cpu_per_call / previous.cpu_per_call - 1,
+                allocated_per_call=result.allocated_per_call,
+                baseline_allocated_per_call=previous.allocated_per_call,
+                allocated_change=(
+                    result.allocated_per_call / previous.allocated_per_call - 1
+                    if previous.allocated_per_call else 0.0
+                )
+            ))
+
+        return comparisons
+
+
+class TransportPhaseSchema(BaseModel):
+    """
+    Фаза прогона одного транспорта с заданной частотой поступления итераций сценария.
+
+    duration — фактическая длительность фазы (с ожиданием последних ответов) в секундах.
+    requests — количество вызовов шлюза, включая неуспешные.
+    cpu_per_request — процессорное время всего процесса клиента на вызов в микросекундах.
+    """
+    rate: float
+    duration: float
+    report: OpenModelReportSchema
+    requests: int
+    iterations_per_second: float
+    requests_per_second: float
+    cpu_per_request: float
+
+
+class WireUsageSchema(BaseModel):
+    """
+    Трафик на один вызов в байтах.
+
+    sent/received — всё, что прошло через TCP-соединения (заголовки, кадры HTTP/2, служебный трафик).
+    payload_sent/payload_received — только тела запросов и ответов (RequestRecord).
+    """
+    iterations: int
+    requests: int
+    sent_per_request: float
+    received_per_request: float
+    payload_sent_per_request: float
+    payload_received_per_request: float
+
+
+class TransportRunSchema(BaseModel):
+    """
+    Результаты одного транспорта.
+
+    latency    — задержки итераций сценария и каждого шага в фазе load.
+    saturation — фаза с частотой заведомо выше возможностей: её пропускная способность и есть предельная.
+    """
+    transport: Transport
+    load: TransportPhaseSchema
+    latency: list[OperationLatencyReport]
+    saturation: TransportPhaseSchema | None = None
+    wire: WireUsageSchema | None = None
+
+
+class TransportComparisonSchema(BaseModel):
+    """
+    Сравнение транспортов на одном и том же сценарии и профиле поступления.
+    """
+    commit: str | None = None
+    scenario: str
+    profile: ArrivalProfileSchema
+    runs: list[TransportRunSchema]
+
+    def get(self, transport: Transport) -> TransportRunSchema | None:
+        """
+        :param transport: Транспорт.
+        :return: Результаты транспорта или None, если он не запускался.
+        """
+        return next((run for run in self.runs if run.transport == transport), None)
+
+
+class QuantileAccuracySchema(BaseModel):
+    """
+    Перцентиль задержки, записанный LatencyAggregator, против точного значения профиля (в микросекундах).
+
+    measured — перцентиль гистограммы за вычетом медианы накладных расходов (прогон без задержки).
+    error    — measured - expected; ok — ошибка в пределах допуска.
+    """
+    percentile: float
+    expected: int
+    measured: int
+    error: int
+    ok: bool
+
+
+class LatencyAccuracyReportSchema(BaseModel):
+    """
+    Проверка точности гистограмм задержек на заглушке с известным распределением задержки.
+    """
+    profile: LatencyProfileSchema
+    report: OpenModelReportSchema
+    overhead: int
+    quantiles: list[QuantileAccuracySchema]
+
+    @property
+    def ok(self) -> bool:
+        return all(quantile.ok for quantile in self.quantiles)
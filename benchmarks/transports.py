@@ -0,0 +1,252 @@
+import time
+from contextlib import ExitStack
+from typing import Any, Callable
+
+from benchmarks.proxy import ByteCountingProxy
+from benchmarks.runner import get_commit
+from benchmarks.schema import TransportComparisonSchema, TransportPhaseSchema, TransportRunSchema, WireUsageSchema
+from clients.gateway import build_grpc_gateway_clients, build_http_gateway_clients, GatewayClients
+from clients.http.gateway.client import HIGH_CONCURRENCY_HTTP_TRANSPORT_PROFILE, HTTPTransportProfile
+from clients.instrumentation import instrumentation, MemorySink, Transport
+from load.schema import ArrivalProfileSchema
+from scenarios.engine import ScenarioRunner
+from scenarios.schema import ScenarioSchema
+from tools.fakers import fake
+from tools.metrics.aggregator import LatencyAggregator
+
+
+class TransportComparison:
+    """
+    Прогоняет один и тот же сценарий через HTTP- и gRPC-клиентов шлюза с одинаковой частотой
+    поступления итераций и собирает результаты для сравнения.
+
+    Для каждого транспорта по очереди выполняются фазы:
+    1. load — открытая модель с профилем profile: задержки и процессорное время клиента на вызов.
+    2. saturation — открытая модель с частотой заведомо выше возможностей клиента или шлюза:
+       достигнутая пропускная способность и есть предельная.
+    3. wire — wire_iterations итераций подряд через ByteCountingProxy: байты на вызов в TCP-соединениях.
+       Прокси добавляет задержку, поэтому в фазах load и saturation клиенты подключаются напрямую.
+
+    Процессорное время считается по всему процессу, поэтому шлюз (или заглушка) должен работать
+    в другом процессе. Фейковые данные генерируются с одним и тем же зерном для обоих транспортов.
+
+    :param scenario: Сценарий — смесь операций, одинаковая для обоих транспортов.
+    :param profile: Профиль поступления итераций для фазы load.
+    :param saturation: Профиль для фазы saturation. None — фаза не выполняется.
+    :param http_address: Адрес http-gateway в виде host:port.
+    :param grpc_address: Адрес grpc-gateway в виде host:port.
+    :param http_profile: Профиль транспорта HTTP-клиентов (base_url заменяется на http_address).
+    :param grpc_pool_size: Количество HTTP/2-соединений gRPC-клиентов.
+    :param max_in_flight: Максимальное количество одновременно выполняющихся итераций.
+    :param warmup: Количество итераций для прогрева соединений перед замерами.
+    :param wire_iterations: Количество итераций фазы wire. 0 — фаза не выполняется.
+    :param contexts: Источник начального контекста каждой итерации (например, SeedsDataset.sampler()).
+    :param seed: Зерно генератора тестовых данных.
+    """
+
+    def __init__(
+            self,
+            scenario: ScenarioSchema,
+            profile: ArrivalProfileSchema,
+            saturation: ArrivalProfileSchema | None = None,
+            http_address: str = "localhost:8003",
+            grpc_address: str = "localhost:9003",
+            http_profile: HTTPTransportProfile = HIGH_CONCURRENCY_HTTP_TRANSPORT_PROFILE,
+            grpc_pool_size: int = 1,
+            max_in_flight: int = 100,
+            warmup: int = 20,
+            wire_iterations: int = 100,
+            contexts: Callable[[], dict[str, Any]] | None = None,
+            seed: int = 0
+    ):
+        self.scenario = scenario
+        self.profile = profile
+        self.saturation = saturation
+        self.addresses = {Transport.HTTP: http_address, Transport.GRPC: grpc_address}
+        self.http_profile = http_profile
+        self.grpc_pool_size = grpc_pool_size
+        self.max_in_flight = max_in_flight
+        self.warmup = warmup
+        self.wire_iterations = wire_iterations
+        self.contexts = contexts
+        self.seed = seed
+
+    def build_clients(self, transport: Transport, address: str) -> GatewayClients:
+        """
+        :param transport: Транспорт.
+        :param address: Адрес шлюза (или прокси) в виде host:port.
+        :return: Клиенты шлюза.
+        """
+        if transport == Transport.GRPC:
+            return build_grpc_gateway_clients(pool_size=self.grpc_pool_size, target=address)
+
+        return build_http_gateway_clients(self.http_profile.model_copy(update={"base_url": f"http://{address}"}))
+
+    def close_clients(self, clients: GatewayClients) -> None:
+        if clients.transport == Transport.GRPC:
+            clients.users.channel.close()
+        else:
+            clients.users.client.close()
+
+    def run_iteration(self, runner: ScenarioRunner) -> dict[str, Any]:
+        return runner.run_once(self.contexts() if self.contexts else None)
+
+    def run_phase(self, clients: GatewayClients, profile: ArrivalProfileSchema) -> tuple[
+        TransportPhaseSchema, LatencyAggregator
+    ]:
+        """
+        :param clients: Клиенты шлюза.
+        :param profile: Профиль поступления итераций.
+        :return: Итоги фазы и агрегатор с задержками итераций и шагов.
+        """
+        aggregator = LatencyAggregator()
+        runner = ScenarioRunner(self.scenario, clients, aggregator)
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        report = runner.run(profile, max_in_flight=self.max_in_flight, contexts=self.contexts)
+        duration = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+        requests = sum(
+            aggregator.histograms[name].total_count
+            for name, *_ in runner.steps
+            if name in aggregator.histograms
+        )
+        phase = TransportPhaseSchema(
+            rate=profile.rate if profile.target_rate is None else max(profile.rate, profile.target_rate),
+            duration=duration,
+            report=report,
+            requests=requests,
+            iterations_per_second=report.completed / duration,
+            requests_per_second=requests / duration,
+            cpu_per_request=cpu / requests * 1_000_000 if requests else 0.0
+        )
+        return phase, aggregator
+
+    def run_wire(self, transport: Transport, proxy: ByteCountingProxy) -> WireUsageSchema:
+        """
+        :param transport: Транспорт.
+        :param proxy: Прокси перед шлюзом этого транспорта.
+        :return: Трафик на вызов.
+        """
+        clients = self.build_clients(transport, proxy.address)
+        runner = ScenarioRunner(self.scenario, clients, LatencyAggregator())
+        sink = MemorySink(maxlen=None)
+        instrumentation.subscribe(sink)
+        try:
+            sent_start, received_start = proxy.get_counters()
+            for _ in range(self.wire_iterations):
+                self.run_iteration(runner)
+            sent, received = proxy.get_counters()
+        finally:
+            instrumentation.unsubscribe(sink)
+            self.close_clients(clients)
+
+        requests = len(sink.records) or 1
+        return WireUsageSchema(
+            iterations=self.wire_iterations,
+            requests=len(sink.records),
+            sent_per_request=(sent - sent_start) / requests,
+            received_per_request=(received - received_start) / requests,
+            payload_sent_per_request=sum(record.request_bytes for record in sink.records) / requests,
+            payload_received_per_request=sum(record.response_bytes for record in sink.records) / requests
+        )
+
+    def run_transport(self, transport: Transport, proxy: ByteCountingProxy | None = None) -> TransportRunSchema:
+        """
+        :param transport: Транспорт.
+        :param proxy: Прокси для фазы wire. None — фаза не выполняется.
+        :return: Результаты транспорта.
+        """
+        fake.seed(self.seed)
+        clients = self.build_clients(transport, self.addresses[transport])
+        try:
+            runner = ScenarioRunner(self.scenario, clients, LatencyAggregator())
+            for _ in range(self.warmup):
+                self.run_iteration(runner)
+
+            load, aggregator = self.run_phase(clients, self.profile)
+            saturation = None if self.saturation is None else self.run_phase(clients, self.saturation)[0]
+        finally:
+            self.close_clients(clients)
+
+        return TransportRunSchema(
+            transport=transport,
+            load=load,
+            latency=aggregator.snapshot().report(),
+            saturation=saturation,
+            wire=None if proxy is None else self.run_wire(transport, proxy)
+        )
+
+    def run(self, transports: tuple[Transport, ...] = (Transport.HTTP, Transport.GRPC)) -> TransportComparisonSchema:
+        """
+        :param transports: Транспорты в порядке запуска.
+        :return: Результаты всех транспортов.
+        """
+        with ExitStack() as stack:
+            # Прокси создаются через fork, поэтому запускаются раньше любых gRPC-каналов
+            proxies = {
+                transport: stack.enter_context(ByteCountingProxy(self.addresses[transport]))
+                for transport in transports
+            } if self.wire_iterations > 0 else {}
+
+            runs = [self.run_transport(transport, proxies.get(transport)) for transport in transports]
+
+        return TransportComparisonSchema(
+            commit=get_commit(),
+            scenario=self.scenario.name,
+            profile=self.profile,
+            runs=runs
+        )
+
+
+def format_transport_comparison(comparison: TransportComparisonSchema) -> str:
+    """
+    :param comparison: Результаты сравнения.
+    :return: Таблица, в которой транспорты идут колонками, а метрики — строками.
+    """
+    rows: list[tuple[str, list[str]]] = []
+
+    def add(title: str, get_value: Callable[[TransportRunSchema], Any], template: str = "{:.1f}") -> None:
+        values = [get_value(run) for run in comparison.runs]
+        if any(value is not None for value in values):
+            rows.append((title, ["-" if value is None else template.format(value) for value in values]))
+
+    add("load: iterations/s", lambda run: run.load.iterations_per_second)
+    add("load: requests/s", lambda run: run.load.requests_per_second)
+    add("load: failed iterations", lambda run: run.load.report.failed, "{}")
+    add("load: dropped iterations", lambda run: run.load.report.dropped, "{}")
+    add("load: client CPU, us/request", lambda run: run.load.cpu_per_request)
+
+    names = [report.name.partition(":")[2] for report in comparison.runs[0].latency] if comparison.runs else []
+    for name in names:
+        if name.endswith(".service"):
+            continue
+
+        for percentile in ("p50", "p90", "p99", "p99.9"):
+            add(
+                f"latency {name} {percentile}, ms",
+                lambda run: next(
+                    (
+                        report.percentiles.get(percentile) / 1000
+                        for report in run.latency
+                        if report.name == f"{run.transport}:{name}" and percentile in report.percentiles
+                    ),
+                    None
+                ),
+                "{:.2f}"
+            )
+
+    add("saturation: iterations/s", lambda run: run.saturation and run.saturation.iterations_per_second)
+    add("saturation: requests/s", lambda run: run.saturation and run.saturation.requests_per_second)
+    add("saturation: client CPU, us/request", lambda run: run.saturation and run.saturation.cpu_per_request)
+    add("wire: sent, B/request", lambda run: run.wire and run.wire.sent_per_request)
+    add("wire: received, B/request", lambda run: run.wire and run.wire.received_per_request)
+    add("payload: sent, B/request", lambda run: run.wire and run.wire.payload_sent_per_request)
+    add("payload: received, B/request", lambda run: run.wire and run.wire.payload_received_per_request)
+
+    width = max([len(title) for title, _ in rows] + [10])
+    lines = [f"{'':<{width}} " + " ".join(f"{run.transport:>12}" for run in comparison.runs)]
+    lines.extend(f"{title:<{width}} " + " ".join(f"{value:>12}" for value in values) for title, values in rows)
+    return "\n".join(lines)
@@ -0,0 +1,35 @@
+import sys
+
+from benchmarks.accuracy import LatencyAccuracyCheck
+from load.schema import ArrivalDistribution, ArrivalProfileSchema
+from stubs.gateway.schema import LatencyDistribution, LatencyProfileSchema
+
+# Проверка гистограмм задержек по известному эталону: заглушка задерживает get_user по профилю,
+# а записанные LatencyAggregator перцентили сравниваются с точными квантилями распределения
+PROFILES = [
+    LatencyProfileSchema(distribution=LatencyDistribution.LOGNORMAL, latency=0.01, sigma=0.5),
+    LatencyProfileSchema(
+        distribution=LatencyDistribution.BIMODAL,
+        latency=0.01,
+        sigma=0.3,
+        slow_latency=0.1,
+        slow_ratio=0.05
+    ),
+]
+
+failed = False
+for profile in PROFILES:
+    report = LatencyAccuracyCheck(
+        profile,
+        arrival=ArrivalProfileSchema(rate=200, duration=20, distribution=ArrivalDistribution.POISSON, seed=0)
+    ).run()
+    failed = failed or not report.ok
+
+    print(f"{profile.distribution} (overhead {report.overhead} us, {report.report.completed} calls)")
+    for quantile in report.quantiles:
+        print(
+            f"  p{quantile.percentile:g}: expected {quantile.expected:>8} us measured {quantile.measured:>8} us "
+            f"error {quantile.error:+8} us {'ok' if quantile.ok else 'FAIL'}"
+        )
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,31 @@
+from queue import SimpleQueue
+from typing import Any, Callable, Iterable, Iterator
+
+
+def iter_completed(submit: Callable[[Any], Any], items: Iterable[Any], window: int = 100) -> Iterator[Any]:
+    """
+    Запускает submit(item) для каждого элемента, держа в полёте не больше window вызовов,
+    и возвращает завершённые future в порядке завершения.
+
+    Подходит для grpc.Future (stub.Method.future) и concurrent.futures.Future (executor.submit):
+    у обоих есть add_done_callback. Ошибка вызова не прерывает итерацию — она остаётся
+    в future и поднимается при future.result().
+
+    :param submit: Функция, запускающая вызов и возвращающая future.
+    :param items: Аргументы вызовов (читаются лениво, по мере освобождения окна).
+    :param window: Максимальное количество одновременных вызовов.
+    :return: Итератор по завершённым future.
+    """
+    completed = SimpleQueue()
+    in_flight = 0
+    for item in items:
+        if in_flight >= window:
+            yield completed.get()
+            in_flight -= 1
+
+        submit(item).add_done_callback(completed.put)
+        in_flight += 1
+
+    while in_flight:
+        yield completed.get()
+        in_flight -= 1
@@ -0,0 +1,132 @@
+from typing import Any
+
+from httpx import BaseTransport
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.grpc.pool import GRPCChannelPoolStrategy
+from clients.http.decoding import HTTPDecodeMode
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import build_gateway_http_client, HTTPTransportProfile
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.instrumentation import Transport
+from clients.policies import CallPolicySchema, CallPolicyStats, policy_stats
+
+
+class GatewayClients:
+    """
+    Набор клиентов шлюза одного транспорта.
+
+    HTTP- и gRPC-клиенты имеют одинаковые имена высокоуровневых методов, а их ответы —
+    одинаковую структуру полей (response.account.cards[0].id), поэтому код поверх
+    GatewayClients не зависит от транспорта.
+    """
+
+    def __init__(
+            self,
+            transport: Transport,
+            users: Any,
+            accounts: Any,
+            cards: Any,
+            operations: Any,
+            documents: Any
+    ):
+        self.transport = transport
+        self.users = users
+        self.accounts = accounts
+        self.cards = cards
+        self.operations = operations
+        self.documents = documents
+
+    def get(self, name: str) -> Any:
+        """
+        :param name: Имя клиента: users, accounts, cards, operations или documents.
+        :return: Клиент соответствующего сервиса.
+        """
+        return getattr(self, name)
+
+
+def build_http_gateway_clients(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE,
+        transport: BaseTransport | None = None,
+        policy: CallPolicySchema | None = None,
+        stats: CallPolicyStats = policy_stats
+) -> GatewayClients:
+    """
+    Создаёт HTTP-клиенты всех сервисов шлюза поверх одного httpx.Client (общий пул соединений).
+
+    :param profile: Профиль транспорта httpx.Client.
+    :param decode_mode: Способ разбора ответов.
+    :param transport: Транспорт httpx вместо сетевого (например, httpx.MockTransport заглушки).
+    :param policy: Дедлайны, повторы и дублирующие запросы по операциям.
+    :param stats: Счетчики повторов и дублирующих запросов.
+    :return: Набор HTTP-клиентов.
+    """
+    client = build_gateway_http_client(profile, transport=transport, policy=policy, stats=stats)
+    return GatewayClients(
+        transport=Transport.HTTP,
+        users=UsersGatewayHTTPClient(client=client, decode_mode=decode_mode),
+        accounts=AccountsGatewayHTTPClient(client=client, decode_mode=decode_mode),
+        cards=CardsGatewayHTTPClient(client=client, decode_mode=decode_mode),
+        operations=OperationsGatewayHTTPClient(client=client, decode_mode=decode_mode),
+        documents=DocumentsGatewayHTTPClient(client=client, decode_mode=decode_mode)
+    )
+
+
+def build_grpc_gateway_clients(
+        pool_size: int = 1,
+        strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN,
+        target: str = "localhost:9003",
+        policy: CallPolicySchema | None = None,
+        stats: CallPolicyStats = policy_stats
+) -> GatewayClients:
+    """
+    Создаёт gRPC-клиенты всех сервисов шлюза поверх одного канала (или пула каналов).
+
+    :param pool_size: Количество HTTP/2-соединений.
+    :param strategy: Стратегия выбора соединения в пуле.
+    :param target: Адрес grpc-gateway.
+    :param policy: Дедлайны, повторы и дублирующие запросы по операциям.
+    :param stats: Счетчики повторов и дублирующих запросов.
+    :return: Набор gRPC-клиентов.
+    """
+    channel = build_gateway_grpc_client(
+        pool_size=pool_size,
+        strategy=strategy,
+        target=target,
+        policy=policy,
+        stats=stats
+    )
+    return GatewayClients(
+        transport=Transport.GRPC,
+        users=UsersGatewayGRPCClient(channel=channel),
+        accounts=AccountsGatewayGRPCClient(channel=channel),
+        cards=CardsGatewayGRPCClient(channel=channel),
+        operations=OperationsGatewayGRPCClient(channel=channel),
+        documents=DocumentsGatewayGRPCClient(channel=channel)
+    )
+
+
+def build_gateway_clients(
+        transport: Transport,
+        policy: CallPolicySchema | None = None,
+        stats: CallPolicyStats = policy_stats
+) -> GatewayClients:
+    """
+    :param transport: Транспорт шлюза.
+    :param policy: Дедлайны, повторы и дублирующие запросы по операциям.
+    :param stats: Счетчики повторов и дублирующих запросов.
+    :return: Набор клиентов с настройками по умолчанию для выбранного транспорта.
+    """
+    if transport == Transport.GRPC:
+        return build_grpc_gateway_clients(policy=policy, stats=stats)
+
+    return build_http_gateway_clients(policy=policy, stats=stats)
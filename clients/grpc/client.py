@@ -3,14 +3,29 @@ import grpc.experimental.gevent as grpc_gevent
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
 from grpc import Channel
+# Асинхронный канал grpc.aio для работы поверх asyncio
+from grpc.aio import Channel as AsyncChannel
 
-# Инициализируем поддержку gevent в gRPC.
-# Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
-# Без этой инициализации gRPC будет использовать потоковую модель (threading),
-# что приведёт к блокировке greenlet'ов и нарушит конкурентное выполнение.
-# Инициализация позволяет gRPC использовать совместимую с gevent реализацию
-# для работы с сокетами, таймерами и I/O, даже если код написан в синхронном стиле.
-grpc_gevent.init_gevent()
+_gevent_initialized = False
+
+
+def setup_gevent() -> None:
+    """
+    Инициализирует поддержку gevent в gRPC (однократно за процесс).
+
+    Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
+    Без этой инициализации gRPC будет использовать потоковую модель (threading),
+    что приведёт к блокировке greenlet'ов и нарушит конкурентное выполнение.
+    Инициализация позволяет gRPC использовать совместимую с gevent реализацию
+    для работы с сокетами, таймерами и I/O, даже если код написан в синхронном стиле.
+
+    Вызывается при создании синхронного канала, а не при импорте модуля,
+    чтобы не ломать asyncio-клиенты (grpc.aio), которым патч gevent не нужен.
+    """
+    global _gevent_initialized
+    if not _gevent_initialized:
+        grpc_gevent.init_gevent()
+        _gevent_initialized = True
 
 
 class GRPCClient:
@@ -29,3 +44,20 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента (grpc.aio).
+
+    Хранит общий асинхронный канал, от него наследуются асинхронные клиенты сервисов.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал (grpc.aio.Channel).
+                        Должен использоваться в том же event loop, в котором создан.
+        """
+        self.channel = channel
@@ -1,7 +1,8 @@
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from clients.grpc.gateway.client import build_async_gateway_grpc_client, build_gateway_grpc_client
 from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
 from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
 from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
@@ -111,3 +112,95 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     :return: Инициализированный клиент для AccountsGatewayService.
     """
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+class AsyncAccountsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для работы со счетами.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными счетов пользователя.
+        """
+        return await self.stub.GetAccounts(request)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого депозитного счета.
+        """
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого сберегательного счета.
+        """
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого дебетового счета.
+        """
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого кредитного счета.
+        """
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        request = GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
+def build_async_accounts_gateway_grpc_client(target: str = "localhost:9003") -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient.
+
+    :param target: Адрес grpc-gateway.
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=build_async_gateway_grpc_client(target=target))
@@ -1,7 +1,8 @@
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from clients.grpc.gateway.client import build_async_gateway_grpc_client, build_gateway_grpc_client
 from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
 from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest, \
     IssuePhysicalCardResponse
@@ -77,3 +78,72 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     :return: Инициализированный клиент для CardsGatewayService.
     """
     return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с CardsGatewayService.
+    Предоставляет высокоуровневые методы для создания карт
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода  через gRPC.
+
+        :param request: gRPC-запрос с данными для выпуска виртуальной карты.
+        :return: Ответ от сервиса с информацией о созданной карте
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода  через gRPC.
+
+        :param request: gRPC-запрос с данными для выпуска физической карты.
+        :return: Ответ от сервиса с информацией о созданной карте
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Создание виртуальной карты
+
+        :param account_id: Идентификатор аккаунта пользователя.
+        :param user_id: Идентификатор пользователя.
+
+        :return: Ответ с информацией о созданной карте
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Создание физической карты
+
+        :param account_id: Идентификатор аккаунта пользователя.
+        :param user_id: Идентификатор пользователя.
+
+        :return: Ответ с информацией о созданной карте
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_async_cards_gateway_grpc_client(target: str = "localhost:9003") -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    :param target: Адрес grpc-gateway.
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_async_gateway_grpc_client(target=target))
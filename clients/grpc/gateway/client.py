@@ -1,11 +1,83 @@
-from grpc import Channel, insecure_channel
+from grpc import Channel, insecure_channel, intercept_channel
+from grpc.aio import Channel as AsyncChannel, insecure_channel as async_insecure_channel
 
+from clients.grpc.client import setup_gevent
+from clients.grpc.instrumentation import AsyncInstrumentationInterceptor, InstrumentationInterceptor
+from clients.grpc.policies import GRPCPolicyChannel
+from clients.grpc.pool import build_grpc_channel_pool, GRPCChannelPoolStrategy
+from clients.grpc.validation import AsyncContractValidationInterceptor, ContractValidationInterceptor
+from clients.instrumentation import instrumentation
+from clients.policies import CallPolicySchema, CallPolicyStats, policy_stats
+from clients.validation import contract_validator
 
-def build_gateway_grpc_client() -> Channel:
+
+def build_gateway_grpc_client(
+        pool_size: int = 1,
+        strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN,
+        instrument: bool = True,
+        validate_contracts: bool = True,
+        target: str = "localhost:9003",
+        policy: CallPolicySchema | None = None,
+        stats: CallPolicyStats = policy_stats
+) -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
-    :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
+    :param pool_size: Количество HTTP/2-соединений. Если больше 1, возвращается GRPCChannelPool,
+                      который можно передать в конструктор любого *GatewayGRPCClient.
+    :param strategy: Стратегия выбора соединения в пуле (ROUND_ROBIN или LEAST_IN_FLIGHT).
+    :param instrument: Подключить перехватчик, отправляющий записи о вызовах в instrumentation.
+    :param validate_contracts: Подключить перехватчик выборочной проверки ответов (contract_validator).
+                               Подключается, только если выборка уже включена (sample_rate > 0).
+    :param target: Адрес grpc-gateway.
+    :param policy: Дедлайны, повторы и дублирующие запросы по операциям (clients.policies).
+                   Без политики вызовы не ограничены по времени.
+    :param stats: Счетчики повторов и дублирующих запросов канала с политикой.
+    :return: gRPC-канал (Channel), настроенный на адрес target.
+    """
+    # gevent должен быть инициализирован до создания первого синхронного канала
+    setup_gevent()
+
+    if pool_size > 1:
+        channel = build_grpc_channel_pool(target, size=pool_size, strategy=strategy)
+    else:
+        # Создаём небезопасное (без TLS) соединение с gRPC-сервером (по умолчанию localhost:9003)
+        channel = insecure_channel(target)
+
+    if policy is not None:
+        # Политика под перехватчиками: инструментирование видит один вызов со всеми повторами
+        channel = GRPCPolicyChannel(channel, policy, stats)
+
+    interceptors = []
+    if instrument:
+        interceptors.append(InstrumentationInterceptor(instrumentation))
+    # Выключенная проверка не должна добавлять перехватчик в каждый вызов
+    if validate_contracts and contract_validator.sample_rate:
+        interceptors.append(ContractValidationInterceptor(contract_validator))
+
+    return intercept_channel(channel, *interceptors) if interceptors else channel
+
+
+def build_async_gateway_grpc_client(
+        instrument: bool = True,
+        validate_contracts: bool = True,
+        target: str = "localhost:9003"
+) -> AsyncChannel:
+    """
+    Фабричная функция (билдер) для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Канал нужно создавать внутри работающего event loop, в котором он будет использоваться.
+
+    :param instrument: Подключить перехватчик, отправляющий записи о вызовах в instrumentation.
+    :param validate_contracts: Подключить перехватчик выборочной проверки ответов (contract_validator).
+                               Подключается, только если выборка уже включена (sample_rate > 0).
+    :param target: Адрес grpc-gateway.
+    :return: Асинхронный gRPC-канал (grpc.aio.Channel), настроенный на адрес target.
     """
-    # Создаём небезопасное (без TLS) соединение с gRPC-сервером по адресу localhost:9003
-    return insecure_channel("localhost:9003")
+    interceptors = []
+    if instrument:
+        interceptors.append(AsyncInstrumentationInterceptor(instrumentation))
+    if validate_contracts and contract_validator.sample_rate:
+        interceptors.append(AsyncContractValidationInterceptor(contract_validator))
+
+    return async_insecure_channel(target, interceptors=interceptors or None)
@@ -1,7 +1,8 @@
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from clients.grpc.gateway.client import build_async_gateway_grpc_client, build_gateway_grpc_client
 from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
 from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
     GetContractDocumentRequest,
@@ -63,3 +64,56 @@ def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     :return: Инициализированный клиент для DocumentsGatewayService.
     """
     return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+class AsyncDocumentsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с DocumentsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к DocumentsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = DocumentsGatewayServiceStub(channel)
+
+    async def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа тарифа.
+        """
+        return await self.stub.GetTariffDocument(request)
+
+    async def get_contract_document_api(self, request: GetContractDocumentRequest) -> GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа контракта.
+        """
+        return await self.stub.GetContractDocument(request)
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        request = GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        request = GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
+def build_async_documents_gateway_grpc_client(target: str = "localhost:9003") -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient.
+
+    :param target: Адрес grpc-gateway.
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=build_async_gateway_grpc_client(target=target))
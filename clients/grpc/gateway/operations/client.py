@@ -1,7 +1,13 @@
-from grpc import Channel
+from typing import Iterable, Iterator
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from google.protobuf.message import Message
+from grpc import Channel, Future
+from grpc.aio import Channel as AsyncChannel
+
+from clients.futures import iter_completed
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from clients.grpc.gateway.client import build_async_gateway_grpc_client, build_gateway_grpc_client
+from clients.grpc.gateway.operations.templates import MakeOperationGRPCTemplates
 from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
 from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
     GetOperationResponse,
@@ -67,6 +73,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         super().__init__(channel)
 
         self.stub = OperationsGatewayServiceStub(channel)
+        self.templates: MakeOperationGRPCTemplates | None = None
 
     def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
         """
@@ -242,6 +249,46 @@ class OperationsGatewayGRPCClient(GRPCClient):
             account_id=account_id)
         return self.make_cash_withdrawal_operation_api(request)
 
+    def submit_many(self, operation: str, requests: Iterable[Message], window: int = 100) -> Iterator[Future]:
+        """
+        Отправляет запросы одного метода конкурентно через stub.Method.future(...).
+
+        :param operation: Имя операции в snake_case, например make_purchase_operation.
+        :param requests: gRPC-запросы (читаются лениво).
+        :param window: Максимальное количество одновременных вызовов.
+        :return: Итератор по завершённым grpc.Future в порядке завершения.
+        """
+        method = getattr(self.stub, "".join(part.title() for part in operation.split("_")))
+        return iter_completed(method.future, requests, window)
+
+    def make_operations(
+            self,
+            operation: str,
+            card_id: str,
+            account_id: str,
+            count: int,
+            window: int = 100
+    ) -> Iterator[Future]:
+        """
+        Создаёт count операций по одной карте конкурентно (например, для наполнения истории операций
+        перед get_operations / get_operations_summary).
+
+        Запросы собираются из шаблона (MakeOperationGRPCTemplates), а не поле за полем.
+
+        :param operation: Имя операции, например make_purchase_operation.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :param count: Количество операций.
+        :param window: Максимальное количество одновременных вызовов.
+        :return: Итератор по завершённым grpc.Future в порядке завершения.
+        """
+        if self.templates is None:
+            self.templates = MakeOperationGRPCTemplates(self.channel)
+
+        method = self.templates.callables[operation]
+        requests = (self.templates.serialize(operation, card_id, account_id) for _ in range(count))
+        return iter_completed(method.future, requests, window)
+
 
 def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
@@ -250,3 +297,204 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     :return: Инициализированный клиент для OperationsGatewayService.
     """
     return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
+
+
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для работы с операциями
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос с ID операции
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос с ID операции
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.GetOperationsSummary(request)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashbackOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequest) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeBillPaymentOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequest) -> (
+            MakeCashWithdrawalOperationResponse
+    ):
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта и ID карты
+        :return: Ответ от сервиса с данными об операции
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        request = MakeFeeOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id)
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id)
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        request = MakeCashbackOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id)
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id)
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category(),
+            account_id=account_id)
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
+        request = MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id)
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id)
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_async_operations_gateway_grpc_client(target: str = "localhost:9003") -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+
+    :param target: Адрес grpc-gateway.
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_async_gateway_grpc_client(target=target))
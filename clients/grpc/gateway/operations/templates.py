@@ -0,0 +1,130 @@
+from typing import Any
+
+from grpc import Channel, Future
+
+from clients.grpc.templates import build_raw_unary_callable, GRPCRequestTemplate
+from contracts.services.gateway.operations.operations_gateway_service_pb2 import DESCRIPTOR
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+    MakeBillPaymentOperationRequest,
+    MakeBillPaymentOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest,
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
+    MakeCashbackOperationRequest,
+    MakeCashbackOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
+    MakeFeeOperationRequest,
+    MakeFeeOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationRequest,
+    MakePurchaseOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationRequest,
+    MakeTopUpOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationRequest,
+    MakeTransferOperationResponse
+)
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+SERVICE_NAME = DESCRIPTOR.services_by_name["OperationsGatewayService"].full_name
+
+# Имя операции -> (gRPC-метод, класс запроса, класс ответа)
+MAKE_OPERATION_METHODS = {
+    "make_fee_operation": ("MakeFeeOperation", MakeFeeOperationRequest, MakeFeeOperationResponse),
+    "make_top_up_operation": ("MakeTopUpOperation", MakeTopUpOperationRequest, MakeTopUpOperationResponse),
+    "make_cashback_operation": ("MakeCashbackOperation", MakeCashbackOperationRequest, MakeCashbackOperationResponse),
+    "make_transfer_operation": ("MakeTransferOperation", MakeTransferOperationRequest, MakeTransferOperationResponse),
+    "make_purchase_operation": ("MakePurchaseOperation", MakePurchaseOperationRequest, MakePurchaseOperationResponse),
+    "make_bill_payment_operation": (
+        "MakeBillPaymentOperation",
+        MakeBillPaymentOperationRequest,
+        MakeBillPaymentOperationResponse
+    ),
+    "make_cash_withdrawal_operation": (
+        "MakeCashWithdrawalOperation",
+        MakeCashWithdrawalOperationRequest,
+        MakeCashWithdrawalOperationResponse
+    ),
+}
+
+
+class MakeOperationGRPCTemplates:
+    """
+    Шаблоны запросов make_*_operation для горячего цикла нагрузки.
+
+    card_id и account_id сериализуются один раз на пару (например, из пула сущностей seeds),
+    а статус, сумма и категория дописываются к готовым байтам. Запрос уходит через
+    unary-вызов без сериализатора, поэтому protobuf-сообщение на каждый вызов не создаётся.
+
+    :param channel: gRPC-канал (в том числе с перехватчиками или GRPCChannelPool).
+    """
+
+    def __init__(self, channel: Channel):
+        self.templates: dict[str, GRPCRequestTemplate] = {}
+        self.callables: dict[str, Any] = {}
+        for operation, (method, request_type, response_type) in MAKE_OPERATION_METHODS.items():
+            variable_fields = ("status", "amount")
+            if "category" in request_type.DESCRIPTOR.fields_by_name:
+                variable_fields += ("category",)
+
+            self.templates[operation] = GRPCRequestTemplate(request_type, ("card_id", "account_id"), variable_fields)
+            self.callables[operation] = build_raw_unary_callable(channel, f"/{SERVICE_NAME}/{method}", response_type)
+
+    def values(self, operation: str) -> tuple:
+        """
+        :param operation: Имя операции, например make_purchase_operation.
+        :return: Случайные значения переменных полей запроса (статус, сумма и, если есть, категория).
+        """
+        if len(self.templates[operation].variable_fields) == 3:
+            return fake.proto_enum(OperationStatus), fake.amount(), fake.category()
+
+        return fake.proto_enum(OperationStatus), fake.amount()
+
+    def message(self, operation: str, card_id: str, account_id: str) -> Any:
+        """
+        :param operation: Имя операции.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: Сообщение запроса, собранное из прототипа через CopyFrom.
+        """
+        return self.templates[operation].message((card_id, account_id), *self.values(operation))
+
+    def serialize(self, operation: str, card_id: str, account_id: str) -> bytes:
+        """
+        :param operation: Имя операции.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: Сериализованный запрос.
+        """
+        return self.templates[operation].serialize((card_id, account_id), *self.values(operation))
+
+    def call(self, operation: str, card_id: str, account_id: str) -> Any:
+        """
+        Выполняет операцию с заранее сериализованным запросом.
+
+        :param operation: Имя операции.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: Ответ сервиса.
+        """
+        return self.callables[operation](self.serialize(operation, card_id, account_id))
+
+    def future(self, operation: str, card_id: str, account_id: str) -> Future:
+        """
+        Асинхронный (grpc.Future) вариант call().
+
+        :param operation: Имя операции.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: grpc.Future с ответом сервиса.
+        """
+        return self.callables[operation].future(self.serialize(operation, card_id, account_id))
@@ -0,0 +1,114 @@
+import re
+from functools import lru_cache
+from time import perf_counter
+from typing import Any
+
+from grpc import StatusCode, UnaryUnaryClientInterceptor
+from grpc.aio import AioRpcError, UnaryUnaryClientInterceptor as AsyncUnaryUnaryClientInterceptor
+
+from clients.instrumentation import Instrumentation, RequestRecord, Transport
+
+
+@lru_cache(maxsize=None)
+def get_operation_name(method: str | bytes) -> str:
+    """
+    Переводит полное имя gRPC-метода в логическое имя операции.
+
+    Например: "/contracts.services.gateway.operations.OperationsGatewayService/MakePurchaseOperation"
+    -> "make_purchase_operation". Имена совпадают с методами HTTP-клиентов,
+    поэтому вызовы по разным транспортам попадают в одну и ту же операцию.
+
+    :param method: Полное имя метода из client_call_details.
+    :return: Имя операции в snake_case.
+    """
+    if isinstance(method, bytes):
+        method = method.decode()
+
+    name = method.rsplit("/", 1)[-1]
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def get_request_size(request: Any) -> int:
+    """
+    :param request: protobuf-сообщение или уже сериализованный запрос (см. clients.grpc.templates).
+    :return: Размер запроса в байтах.
+    """
+    return len(request) if isinstance(request, bytes) else request.ByteSize()
+
+
+class InstrumentationInterceptor(UnaryUnaryClientInterceptor):
+    """
+    Клиентский перехватчик gRPC, который отправляет RequestRecord в Instrumentation.
+
+    Запись формируется в done-колбэке вызова, поэтому перехватчик работает и для
+    блокирующих вызовов, и для stub.Method.future(...), не дожидаясь ответа сам.
+
+    :param instrumentation: Точка подписки на записи о вызовах.
+    """
+
+    def __init__(self, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not self.instrumentation.subscribers:
+            return continuation(client_call_details, request)
+
+        start = perf_counter()
+        operation = get_operation_name(client_call_details.method)
+        call = continuation(client_call_details, request)
+
+        def emit(done_call: Any) -> None:
+            end = perf_counter()
+            code = done_call.code()
+            ok = code == StatusCode.OK
+            self.instrumentation.emit(RequestRecord(
+                operation=operation,
+                transport=Transport.GRPC,
+                status=code.name,
+                ok=ok,
+                request_bytes=get_request_size(request),
+                response_bytes=done_call.result().ByteSize() if ok else 0,
+                start=start,
+                end=end
+            ))
+
+        call.add_done_callback(emit)
+        return call
+
+
+class AsyncInstrumentationInterceptor(AsyncUnaryUnaryClientInterceptor):
+    """
+    Клиентский перехватчик grpc.aio, который отправляет RequestRecord в Instrumentation.
+
+    :param instrumentation: Точка подписки на записи о вызовах.
+    """
+
+    def __init__(self, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not self.instrumentation.subscribers:
+            return await continuation(client_call_details, request)
+
+        start = perf_counter()
+        operation = get_operation_name(client_call_details.method)
+        try:
+            response = await (await continuation(client_call_details, request))
+        except AioRpcError as error:
+            self._emit(operation, error.code(), request, None, start)
+            raise
+
+        self._emit(operation, StatusCode.OK, request, response, start)
+        return response
+
+    def _emit(self, operation: str, code: StatusCode, request: Any, response: Any, start: float) -> None:
+        self.instrumentation.emit(RequestRecord(
+            operation=operation,
+            transport=Transport.GRPC,
+            status=code.name,
+            ok=code == StatusCode.OK,
+            request_bytes=get_request_size(request),
+            response_bytes=response.ByteSize() if response is not None else 0,
+            start=start,
+            end=perf_counter()
+        ))
@@ -0,0 +1,139 @@
+from typing import Any
+
+from grpc import Channel, Future, RpcError, StatusCode
+
+from clients.grpc.instrumentation import get_operation_name
+from clients.instrumentation import Transport
+from clients.policies import CallPolicyExecutor, CallPolicySchema, CallPolicyStats, PolicyCall, policy_stats
+
+# Статусы, после которых запрос можно повторить: шлюз его не обработал или не успел ответить
+RETRYABLE_GRPC_STATUS_CODES = frozenset({
+    StatusCode.UNAVAILABLE,
+    StatusCode.DEADLINE_EXCEEDED,
+    StatusCode.RESOURCE_EXHAUSTED,
+    StatusCode.ABORTED,
+})
+
+
+class _GRPCPolicyCall(PolicyCall):
+    def __init__(self, callable: Any, request: Any, kwargs: dict[str, Any]):
+        self.callable = callable
+        self.request = request
+        self.kwargs = kwargs
+
+    def get_kwargs(self, timeout: float | None) -> dict[str, Any]:
+        if timeout is None:
+            return self.kwargs
+
+        requested = self.kwargs.get("timeout")
+        return {**self.kwargs, "timeout": timeout if requested is None else min(requested, timeout)}
+
+    def attempt(self, timeout: float | None) -> tuple[Any, Any]:
+        return self.callable.with_call(self.request, **self.get_kwargs(timeout))
+
+    def submit(self, timeout: float | None) -> Future:
+        return self.callable.future(self.request, **self.get_kwargs(timeout))
+
+    def resolve(self, future: Any) -> tuple[Any, BaseException | None]:
+        # Завершённый grpc.Future — это и есть объект вызова, как второй элемент with_call()
+        error = future.exception()
+        return (None, error) if error is not None else ((future.result(), future), None)
+
+    def is_retryable(self, result: Any, error: BaseException | None) -> bool:
+        return isinstance(error, RpcError) and error.code() in RETRYABLE_GRPC_STATUS_CODES
+
+
+class _PolicyMultiCallable:
+    """
+    grpc.UnaryUnaryMultiCallable, выполняющий __call__ и with_call по политике операции.
+
+    future() получает только ограничение времени: повторы и дублирование потребовали бы
+    ждать ответ, а future() должен возвращаться сразу.
+    """
+
+    def __init__(self, callable: Any, executor: CallPolicyExecutor, operation: str):
+        self.callable = callable
+        self.executor = executor
+        self.operation = operation
+
+    def __call__(self, request: Any, timeout=None, metadata=None, credentials=None, wait_for_ready=None,
+                 compression=None) -> Any:
+        return self.with_call(request, timeout, metadata, credentials, wait_for_ready, compression)[0]
+
+    def with_call(self, request: Any, timeout=None, metadata=None, credentials=None, wait_for_ready=None,
+                  compression=None) -> tuple[Any, Any]:
+        kwargs = dict(
+            timeout=timeout,
+            metadata=metadata,
+            credentials=credentials,
+            wait_for_ready=wait_for_ready,
+            compression=compression
+        )
+        return self.executor.execute(self.operation, _GRPCPolicyCall(self.callable, request, kwargs))
+
+    def future(self, request: Any, timeout=None, metadata=None, credentials=None, wait_for_ready=None,
+               compression=None) -> Future:
+        policy = self.executor.policy.get(self.operation)
+        limit = policy.attempt_timeout or policy.deadline
+        if limit is not None:
+            timeout = limit if timeout is None else min(timeout, limit)
+
+        return self.callable.future(
+            request,
+            timeout=timeout,
+            metadata=metadata,
+            credentials=credentials,
+            wait_for_ready=wait_for_ready,
+            compression=compression
+        )
+
+
+class GRPCPolicyChannel(Channel):
+    """
+    gRPC-канал, выполняющий унарные вызовы по политикам CallPolicySchema поверх другого канала
+    (обычного или GRPCChannelPool).
+
+    Канал нужно оборачивать перехватчиками (intercept_channel), а не наоборот: тогда инструментирование
+    видит один вызов со всеми повторами, а сами повторы и дублирующие запросы учитываются в CallPolicyStats.
+    Дублирующий запрос отправляется через future(), а проигравший запрос отменяется.
+
+    :param channel: Канал, через который выполняются попытки.
+    :param policy: Политики вызовов.
+    :param stats: Счетчики повторов и дублирующих запросов.
+    """
+
+    def __init__(self, channel: Channel, policy: CallPolicySchema, stats: CallPolicyStats = policy_stats):
+        self.channel = channel
+        self.executor = CallPolicyExecutor(policy, Transport.GRPC, stats)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return _PolicyMultiCallable(
+            self.channel.unary_unary(method, request_serializer, response_deserializer, _registered_method),
+            self.executor,
+            get_operation_name(method)
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,184 @@
+import threading
+from enum import StrEnum
+from itertools import count
+from typing import Any, Callable, Sequence
+
+from grpc import Channel, Future, insecure_channel
+
+
+class GRPCChannelPoolStrategy(StrEnum):
+    ROUND_ROBIN = "ROUND_ROBIN"
+    LEAST_IN_FLIGHT = "LEAST_IN_FLIGHT"
+
+
+class _PooledMultiCallable:
+    """
+    Мультиколлабл, который на каждый вызов выбирает под-канал пула.
+
+    Реализует интерфейс grpc.UnaryUnaryMultiCallable (__call__, with_call, future),
+    а для стриминговых методов — только __call__.
+    """
+
+    def __init__(self, pool: "GRPCChannelPool", callables: list[Any]):
+        self.pool = pool
+        self.callables = callables
+
+    def __call__(self, request: Any, *args, **kwargs) -> Any:
+        index = self.pool.acquire()
+        try:
+            call = self.callables[index](request, *args, **kwargs)
+        except BaseException:
+            self.pool.release(index)
+            raise
+
+        # Стриминговые вызовы возвращают объект, живущий дольше __call__:
+        # слот освобождается, когда RPC действительно завершится.
+        if isinstance(call, Future):
+            call.add_done_callback(lambda _: self.pool.release(index))
+        else:
+            self.pool.release(index)
+
+        return call
+
+    def with_call(self, request: Any, *args, **kwargs) -> Any:
+        index = self.pool.acquire()
+        try:
+            return self.callables[index].with_call(request, *args, **kwargs)
+        finally:
+            self.pool.release(index)
+
+    def future(self, request: Any, *args, **kwargs) -> Future:
+        index = self.pool.acquire()
+        try:
+            future = self.callables[index].future(request, *args, **kwargs)
+        except BaseException:
+            self.pool.release(index)
+            raise
+
+        future.add_done_callback(lambda _: self.pool.release(index))
+        return future
+
+
+class GRPCChannelPool(Channel):
+    """
+    Пул из нескольких gRPC-каналов к одному адресу.
+
+    Один канал — это одно HTTP/2-соединение, которое упирается в max-concurrent-streams
+    и обслуживается одним ядром на стороне сервера. Пул открывает N под-каналов с разными
+    channel args (иначе gRPC переиспользует одно и то же соединение) и раздаёт их по вызовам.
+
+    Пул реализует интерфейс grpc.Channel, поэтому передаётся в любой *GatewayGRPCClient
+    вместо обычного канала: stub создаётся один раз, а под-канал выбирается на каждый RPC.
+
+    :param channels: Под-каналы пула.
+    :param strategy: Стратегия выбора под-канала.
+    """
+
+    def __init__(
+            self,
+            channels: Sequence[Channel],
+            strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN
+    ):
+        if not channels:
+            raise ValueError("GRPCChannelPool requires at least one channel")
+
+        self.channels = list(channels)
+        self.strategy = strategy
+        self.in_flight = [0] * len(self.channels)
+        self._counter = count()
+        # acquire() вызывается из потоков вызывающих, release() — ещё и из done-колбэков gRPC
+        self._lock = threading.Lock()
+
+    def acquire(self) -> int:
+        """
+        Выбирает под-канал для очередного вызова и увеличивает его счётчик запросов в работе.
+
+        :return: Индекс выбранного под-канала.
+        """
+        with self._lock:
+            if self.strategy == GRPCChannelPoolStrategy.LEAST_IN_FLIGHT:
+                index = min(range(len(self.in_flight)), key=self.in_flight.__getitem__)
+            else:
+                index = next(self._counter) % len(self.channels)
+
+            self.in_flight[index] += 1
+
+        return index
+
+    def release(self, index: int) -> None:
+        """
+        Отмечает завершение вызова на под-канале.
+
+        :param index: Индекс под-канала, полученный из acquire().
+        """
+        with self._lock:
+            self.in_flight[index] -= 1
+
+    def _multi_callable(self, factory: Callable[[Channel], Any]) -> _PooledMultiCallable:
+        return _PooledMultiCallable(self, [factory(channel) for channel in self.channels])
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self._multi_callable(
+            lambda channel: channel.unary_unary(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self._multi_callable(
+            lambda channel: channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self._multi_callable(
+            lambda channel: channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self._multi_callable(
+            lambda channel: channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def build_grpc_channel_pool(
+        target: str,
+        size: int,
+        strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN,
+        options: Sequence[tuple[str, Any]] = ()
+) -> GRPCChannelPool:
+    """
+    Создаёт пул из size небезопасных (без TLS) каналов к target.
+
+    :param target: Адрес gRPC-сервера, например "localhost:9003".
+    :param size: Количество под-каналов (отдельных HTTP/2-соединений).
+    :param strategy: Стратегия выбора под-канала.
+    :param options: Дополнительные channel args для всех под-каналов.
+    :return: Пул каналов.
+    """
+    channels = [
+        insecure_channel(target, options=[
+            *options,
+            # Уникальный аргумент и локальный пул сабканалов не дают gRPC склеить каналы в одно соединение
+            ("grpc.channel_pool_index", index),
+            ("grpc.use_local_subchannel_pool", 1),
+        ])
+        for index in range(size)
+    ]
+    return GRPCChannelPool(channels, strategy=strategy)
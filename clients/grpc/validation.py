@@ -0,0 +1,52 @@
+from typing import Any
+
+from grpc import StatusCode, UnaryUnaryClientInterceptor
+from grpc.aio import UnaryUnaryClientInterceptor as AsyncUnaryUnaryClientInterceptor
+
+from clients.grpc.instrumentation import get_operation_name
+from clients.validation import ContractValidator
+
+
+class ContractValidationInterceptor(UnaryUnaryClientInterceptor):
+    """
+    Клиентский перехватчик gRPC, передающий успешные ответы в ContractValidator.
+
+    :param validator: Выборочная проверка контрактов.
+    """
+
+    def __init__(self, validator: ContractValidator):
+        self.validator = validator
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        call = continuation(client_call_details, request)
+        if not self.validator.sample_rate:
+            return call
+
+        operation = get_operation_name(client_call_details.method)
+
+        def validate(done_call: Any) -> None:
+            if done_call.code() == StatusCode.OK:
+                self.validator.validate_message(operation, done_call.result())
+
+        call.add_done_callback(validate)
+        return call
+
+
+class AsyncContractValidationInterceptor(AsyncUnaryUnaryClientInterceptor):
+    """
+    Клиентский перехватчик grpc.aio, передающий успешные ответы в ContractValidator.
+
+    :param validator: Выборочная проверка контрактов.
+    """
+
+    def __init__(self, validator: ContractValidator):
+        self.validator = validator
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        call = await continuation(client_call_details, request)
+        if not self.validator.sample_rate:
+            return call
+
+        response = await call
+        self.validator.validate_message(get_operation_name(client_call_details.method), response)
+        return response
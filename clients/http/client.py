@@ -1,6 +1,24 @@
-from typing import Any
+from typing import Any, TypedDict, TypeVar
 
-from httpx import Client, URL, QueryParams, Response
+from httpx import AsyncClient, Client, URL, QueryParams, Response
+from pydantic import BaseModel
+
+from clients.http.decoding import decode_response, DecodedResponse, HTTPDecodeMode
+from clients.validation import contract_validator
+
+T = TypeVar("T", bound=BaseModel)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class HTTPClientExtensions(TypedDict, total=False):
+    """
+    Расширения запроса httpx, которые читают event hooks клиента.
+
+    operation — логическое имя операции (например, make_purchase_operation),
+    под которым вызов попадает в инструментирование и метрики.
+    """
+    operation: str
 
 
 class HTTPClient:
@@ -8,27 +26,128 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param decode_mode: способ разбора ответов высокоуровневыми методами (см. HTTPDecodeMode)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE) -> None:
         self.client = client
+        self.decode_mode = decode_mode
+
+    def decode(self, response: Response, schema: type[T]) -> DecodedResponse[T]:
+        """
+        Разбирает тело ответа в схему согласно decode_mode.
+
+        В режимах без валидации ответ выборочно проверяется contract_validator.
 
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+        :param response: Ответ сервера.
+        :param schema: Pydantic-схема ответа.
+        :return: Экземпляр схемы (TrustedModel в режиме TRUSTED, dict в режиме RAW).
+        """
+        if self.decode_mode != HTTPDecodeMode.VALIDATE and contract_validator.sample_rate:
+            operation = response.request.extensions.get("operation", response.request.url.path)
+            contract_validator.validate_json(operation, schema, response.content)
+
+        return decode_response(response.content, schema, self.decode_mode)
+
+    def get(
+            self,
+            url: URL | str,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
         """
         Выполняет GET-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Расширения запроса (логическое имя операции и т.п.).
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url=url, params=params)
+        return self.client.get(url=url, params=params, extensions=extensions)
 
-    def post(self, url: URL | str, json: Any | None = None) -> Response:
+    def post(
+            self,
+            url: URL | str,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None,
+            content: bytes | None = None
+    ) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
+        :param extensions: Расширения запроса (логическое имя операции и т.п.).
+        :param content: Уже закодированное JSON-тело (вместо json), например из JSONBodyTemplate.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json)
\ No newline at end of file
+        if content is not None:
+            return self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
+        return self.client.post(url=url, json=json, extensions=extensions)
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param decode_mode: способ разбора ответов высокоуровневыми методами (см. HTTPDecodeMode)
+    """
+
+    def __init__(self, client: AsyncClient, decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE) -> None:
+        self.client = client
+        self.decode_mode = decode_mode
+
+    def decode(self, response: Response, schema: type[T]) -> DecodedResponse[T]:
+        """
+        Разбирает тело ответа в схему согласно decode_mode.
+
+        В режимах без валидации ответ выборочно проверяется contract_validator.
+
+        :param response: Ответ сервера.
+        :param schema: Pydantic-схема ответа.
+        :return: Экземпляр схемы (TrustedModel в режиме TRUSTED, dict в режиме RAW).
+        """
+        if self.decode_mode != HTTPDecodeMode.VALIDATE and contract_validator.sample_rate:
+            operation = response.request.extensions.get("operation", response.request.url.path)
+            contract_validator.validate_json(operation, schema, response.content)
+
+        return decode_response(response.content, schema, self.decode_mode)
+
+    async def get(
+            self,
+            url: URL | str,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Расширения запроса (логическое имя операции и т.п.).
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: URL | str,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None,
+            content: bytes | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Расширения запроса (логическое имя операции и т.п.).
+        :param content: Уже закодированное JSON-тело (вместо json), например из JSONBodyTemplate.
+        :return: Объект Response с данными ответа.
+        """
+        if content is not None:
+            return await self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
+        return await self.client.post(url=url, json=json, extensions=extensions)
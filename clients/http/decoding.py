@@ -0,0 +1,129 @@
+import json
+from enum import StrEnum
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Callable, get_args, get_origin, TypeAlias, TypeVar, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен, без него используется стандартный json
+    orjson = None
+
+T = TypeVar("T", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+
+class HTTPDecodeMode(StrEnum):
+    """
+    Способ разбора ответа высокоуровневыми методами HTTP-клиентов.
+
+    VALIDATE — полная валидация pydantic (model_validate_json прямо из байтов ответа, без response.text).
+    TRUSTED  — без валидации: разобранный JSON оборачивается в TrustedModel с теми же атрибутами,
+               что у схемы (response.account.cards[0].id). Даты и enum остаются строками.
+    RAW      — только разбор JSON (orjson, если установлен): результат — dict с ключами как в ответе.
+    """
+    VALIDATE = "VALIDATE"
+    TRUSTED = "TRUSTED"
+    RAW = "RAW"
+
+
+def loads(content: bytes) -> Any:
+    """
+    :param content: Тело ответа.
+    :return: Разобранный JSON.
+    """
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+class TrustedModel:
+    """
+    Доступ к разобранному JSON через атрибуты pydantic-схемы без её валидации и сборки.
+
+    Значения читаются из dict только при обращении: нагрузочному сценарию, которому нужен
+    один id из ответа, не приходится строить всё дерево моделей. Это быстрее, чем
+    model_construct по всем вложенным схемам, и быстрее полной валидации pydantic-core.
+
+    :param schema: Pydantic-схема ответа.
+    :param data: Разобранный JSON с ключами по alias.
+    """
+    __slots__ = ("schema", "data", "fields")
+
+    def __init__(self, schema: type[BaseModel], data: dict[str, Any]):
+        self.schema = schema
+        self.data = data
+        self.fields = _get_fields(schema)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            alias, converter = self.fields[name]
+        except KeyError:
+            raise AttributeError(f"{self.schema.__name__} has no field '{name}'") from None
+
+        value = self.data[alias] if alias in self.data else self.data[name]
+        return value if converter is None else converter(value)
+
+    def __repr__(self) -> str:
+        return f"TrustedModel[{self.schema.__name__}]({self.data!r})"
+
+    def validate(self) -> BaseModel:
+        """
+        :return: Полностью провалидированный экземпляр схемы.
+        """
+        return self.schema.model_validate(self.data)
+
+
+# Результат разбора ответа: экземпляр схемы (VALIDATE), TrustedModel (TRUSTED) или dict (RAW)
+DecodedResponse: TypeAlias = T | TrustedModel | dict[str, Any]
+
+
+def _get_converter(annotation: Any) -> Converter | None:
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        # X | None: конвертируем по первой схеме из объединения
+        for argument in get_args(annotation):
+            converter = _get_converter(argument)
+            if converter is not None:
+                return lambda value: None if value is None else converter(value)
+        return None
+
+    if origin is list:
+        arguments = get_args(annotation)
+        converter = _get_converter(arguments[0]) if arguments else None
+        if converter is None:
+            return None
+        return lambda value: [converter(item) for item in value]
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: TrustedModel(annotation, value)
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_fields(schema: type[BaseModel]) -> dict[str, tuple[str, Converter | None]]:
+    return {
+        name: (field.alias or name, _get_converter(field.annotation))
+        for name, field in schema.model_fields.items()
+    }
+
+
+def decode_response(content: bytes, schema: type[T], mode: HTTPDecodeMode) -> DecodedResponse[T]:
+    """
+    Разбирает тело ответа в соответствии с режимом.
+
+    :param content: Тело ответа (response.content).
+    :param schema: Pydantic-схема ответа.
+    :param mode: Режим разбора.
+    :return: Экземпляр схемы (VALIDATE), TrustedModel (TRUSTED) или dict (RAW).
+    """
+    if mode == HTTPDecodeMode.VALIDATE:
+        return schema.model_validate_json(content)
+
+    data = loads(content)
+    if mode == HTTPDecodeMode.RAW:
+        return data
+
+    return TrustedModel(schema, data)
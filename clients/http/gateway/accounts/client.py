@@ -1,6 +1,7 @@
 from httpx import Response, QueryParams
 
-from clients.http.client import HTTPClient
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse, HTTPDecodeMode
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -13,7 +14,11 @@ from clients.http.gateway.accounts.schema import (
     OpenCreditCardAccountRequestSchema,
     OpenCreditCardAccountResponseSchema
 )
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.client import (
+    build_async_gateway_http_client,
+    build_gateway_http_client,
+    HTTPTransportProfile
+)
 
 
 class AccountsGatewayHTTPClient(HTTPClient):
@@ -30,7 +35,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.get(
             "/api/v1/accounts",
-            params=QueryParams(**query.model_dump(by_alias=True))
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(operation="get_accounts")
         )
 
     def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
@@ -42,7 +48,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_deposit_account")
         )
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
@@ -54,7 +61,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_savings_account")
         )
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
@@ -66,7 +74,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_debit_card_account")
         )
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
@@ -78,40 +87,154 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_credit_card_account")
         )
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+    def get_accounts(self, user_id: str) -> DecodedResponse[GetAccountsResponseSchema]:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetAccountsResponseSchema)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+    def open_deposit_account(self, user_id: str) -> DecodedResponse[OpenDepositAccountResponseSchema]:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenDepositAccountResponseSchema)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+    def open_savings_account(self, user_id: str) -> DecodedResponse[OpenSavingsAccountResponseSchema]:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenSavingsAccountResponseSchema)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+    def open_debit_card_account(self, user_id: str) -> DecodedResponse[OpenDebitCardAccountResponseSchema]:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenDebitCardAccountResponseSchema)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+    def open_credit_card_account(self, user_id: str) -> DecodedResponse[OpenCreditCardAccountResponseSchema]:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenCreditCardAccountResponseSchema)
 
 
-def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param profile: Профиль транспорта httpx.Client (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(client=build_gateway_http_client(profile), decode_mode=decode_mode)
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema):
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Pydantic-модель с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            "/api/v1/accounts",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(operation="get_accounts")
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-deposit-account",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_deposit_account")
+        )
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-savings-account",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_savings_account")
+        )
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-debit-card-account",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_debit_card_account")
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            "/api/v1/accounts/open-credit-card-account",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="open_credit_card_account")
+        )
+
+    async def get_accounts(self, user_id: str) -> DecodedResponse[GetAccountsResponseSchema]:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.decode(response, GetAccountsResponseSchema)
+
+    async def open_deposit_account(self, user_id: str) -> DecodedResponse[OpenDepositAccountResponseSchema]:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.decode(response, OpenDepositAccountResponseSchema)
+
+    async def open_savings_account(self, user_id: str) -> DecodedResponse[OpenSavingsAccountResponseSchema]:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.decode(response, OpenSavingsAccountResponseSchema)
+
+    async def open_debit_card_account(self, user_id: str) -> DecodedResponse[OpenDebitCardAccountResponseSchema]:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.decode(response, OpenDebitCardAccountResponseSchema)
+
+    async def open_credit_card_account(self, user_id: str) -> DecodedResponse[OpenCreditCardAccountResponseSchema]:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.decode(response, OpenCreditCardAccountResponseSchema)
+
+
+def build_async_accounts_gateway_http_client(
+        profile: HTTPTransportProfile | None = None
+) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
 
+    :param profile: Профиль транспорта httpx.AsyncClient (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_async_gateway_http_client(profile), decode_mode=decode_mode)
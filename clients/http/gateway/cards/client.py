@@ -1,13 +1,18 @@
 from httpx import Response
 
-from clients.http.client import HTTPClient
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse, HTTPDecodeMode
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema,
     IssuePhysicalCardRequestSchema,
     IssuePhysicalCardResponseSchema
 )
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.client import (
+    build_async_gateway_http_client,
+    build_gateway_http_client,
+    HTTPTransportProfile
+)
 
 
 class CardsGatewayHTTPClient(HTTPClient):
@@ -24,7 +29,8 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-virtual-card",
-            json=request.model_dump(by_alias=True)
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="issue_virtual_card")
         )
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
@@ -36,24 +42,94 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-physical-card",
-            json=request.model_dump(by_alias=True)
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="issue_physical_card")
         )
 
-    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+    def issue_virtual_card(self, user_id: str, account_id: str) -> DecodedResponse[IssueVirtualCardResponseSchema]:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.decode(response, IssueVirtualCardResponseSchema)
 
-    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+    def issue_physical_card(self, user_id: str, account_id: str) -> DecodedResponse[IssuePhysicalCardResponseSchema]:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.decode(response, IssuePhysicalCardResponseSchema)
 
 
-def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
+def build_cards_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param profile: Профиль транспорта httpx.Client (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(client=build_gateway_http_client(profile), decode_mode=decode_mode)
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Pydantic-модель с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/cards/issue-virtual-card",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="issue_virtual_card")
+        )
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Pydantic-модель с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/cards/issue-physical-card",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="issue_physical_card")
+        )
+
+    async def issue_virtual_card(
+            self,
+            user_id: str,
+            account_id: str
+    ) -> DecodedResponse[IssueVirtualCardResponseSchema]:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.decode(response, IssueVirtualCardResponseSchema)
+
+    async def issue_physical_card(
+            self,
+            user_id: str,
+            account_id: str
+    ) -> DecodedResponse[IssuePhysicalCardResponseSchema]:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.decode(response, IssuePhysicalCardResponseSchema)
+
+
+def build_async_cards_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :param profile: Профиль транспорта httpx.AsyncClient (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_async_gateway_http_client(profile), decode_mode=decode_mode)
@@ -1,10 +1,190 @@
-from httpx import Client
+import os
 
+from httpx import AsyncClient, AsyncHTTPTransport, BaseTransport, Client, HTTPTransport, Limits, Timeout
+from pydantic import BaseModel, ConfigDict
 
-def build_gateway_http_client() -> Client:
+from clients.http.instrumentation import (
+    AsyncHTTPInstrumentationTransport,
+    HTTPInstrumentationHooks,
+    HTTPInstrumentationTransport
+)
+from clients.http.policies import HTTPPolicyTransport
+from clients.http.pool import pool_monitor
+from clients.instrumentation import instrumentation
+from clients.policies import CallPolicySchema, CallPolicyStats, policy_stats
+
+
+class HTTPTransportProfile(BaseModel):
+    """
+    Профиль транспорта для httpx.Client: лимиты пула соединений, keep-alive и HTTP/2.
+
+    Значения по умолчанию совпадают с настройками httpx.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    base_url: str = "http://localhost:8003"
+    timeout: float = 100
+    pool_timeout: float | None = None
+    http2: bool = False
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    shared: bool = False
+    track_pool_wait: bool = True
+    instrument: bool = True
+
+
+DEFAULT_HTTP_TRANSPORT_PROFILE = HTTPTransportProfile()
+
+# Профиль для 1k+ виртуальных пользователей: соединения не закрываются между запросами,
+# а все *GatewayHTTPClient воркера работают через один пул.
+HIGH_CONCURRENCY_HTTP_TRANSPORT_PROFILE = HTTPTransportProfile(
+    max_connections=1000,
+    max_keepalive_connections=1000,
+    keepalive_expiry=60,
+    shared=True
+)
+
+# Профиль с мультиплексированием запросов в HTTP/2 (требуется пакет h2).
+HTTP2_TRANSPORT_PROFILE = HTTPTransportProfile(
+    http2=True,
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=60,
+    shared=True
+)
+
+instrumentation_hooks = HTTPInstrumentationHooks(instrumentation)
+
+# Общие клиенты живут в пределах процесса: после fork дочерний воркер открывает свой пул.
+_shared_clients: dict[HTTPTransportProfile, Client] = {}
+_shared_async_clients: dict[HTTPTransportProfile, AsyncClient] = {}
+os.register_at_fork(after_in_child=_shared_clients.clear)
+os.register_at_fork(after_in_child=_shared_async_clients.clear)
+
+
+def _build_event_hooks(profile: HTTPTransportProfile) -> dict[str, list]:
+    hooks: dict[str, list] = {"request": [], "response": []}
+    if profile.track_pool_wait:
+        hooks["request"].append(pool_monitor.on_request)
+    if profile.instrument:
+        hooks["request"].append(instrumentation_hooks.on_request)
+        hooks["response"].append(instrumentation_hooks.on_response)
+
+    return hooks
+
+
+def _build_async_event_hooks(profile: HTTPTransportProfile) -> dict[str, list]:
+    hooks: dict[str, list] = {"request": [], "response": []}
+    if profile.track_pool_wait:
+        hooks["request"].append(pool_monitor.on_async_request)
+    if profile.instrument:
+        hooks["request"].append(instrumentation_hooks.on_async_request)
+        hooks["response"].append(instrumentation_hooks.on_async_response)
+
+    return hooks
+
+
+def _create_client(
+        profile: HTTPTransportProfile,
+        transport: BaseTransport | None = None,
+        policy: CallPolicySchema | None = None,
+        stats: CallPolicyStats = policy_stats
+) -> Client:
+    limits = Limits(
+        max_connections=profile.max_connections,
+        max_keepalive_connections=profile.max_keepalive_connections,
+        keepalive_expiry=profile.keepalive_expiry
+    )
+    if policy is not None or profile.instrument:
+        # Лимиты и HTTP/2 задаются транспорту, который httpx.Client создал бы сам
+        transport = transport or HTTPTransport(http2=profile.http2, limits=limits)
+    if policy is not None:
+        transport = HTTPPolicyTransport(transport, policy, stats)
+    if profile.instrument:
+        # Над политикой: ошибка попадает в инструментирование один раз, после всех повторов
+        transport = HTTPInstrumentationTransport(transport, instrumentation_hooks)
+
+    return Client(
+        http2=profile.http2,
+        limits=limits,
+        timeout=Timeout(profile.timeout, pool=profile.pool_timeout),
+        base_url=profile.base_url,
+        transport=transport,
+        event_hooks=_build_event_hooks(profile)
+    )
+
+
+def _create_async_client(profile: HTTPTransportProfile) -> AsyncClient:
+    limits = Limits(
+        max_connections=profile.max_connections,
+        max_keepalive_connections=profile.max_keepalive_connections,
+        keepalive_expiry=profile.keepalive_expiry
+    )
+    transport = None
+    if profile.instrument:
+        transport = AsyncHTTPInstrumentationTransport(
+            AsyncHTTPTransport(http2=profile.http2, limits=limits),
+            instrumentation_hooks
+        )
+
+    return AsyncClient(
+        http2=profile.http2,
+        limits=limits,
+        timeout=Timeout(profile.timeout, pool=profile.pool_timeout),
+        base_url=profile.base_url,
+        transport=transport,
+        event_hooks=_build_async_event_hooks(profile)
+    )
+
+
+def build_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        transport: BaseTransport | None = None,
+        policy: CallPolicySchema | None = None,
+        stats: CallPolicyStats = policy_stats
+) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    Если в профиле указан shared=True, то для одинаковых профилей возвращается один и тот же
+    клиент, и все gateway-клиенты процесса используют общий пул соединений.
+
+    :param profile: Профиль транспорта. По умолчанию DEFAULT_HTTP_TRANSPORT_PROFILE.
+    :param transport: Транспорт httpx вместо сетевого, например httpx.MockTransport заглушки
+                      (stubs.gateway.server.build_gateway_mock_transport). Такой клиент никогда не общий.
+    :param policy: Дедлайны, повторы и дублирующие запросы по операциям (clients.policies).
+                   Без политики запросы ограничены только таймаутом профиля. Клиент с политикой никогда не общий.
+    :param stats: Счетчики повторов и дублирующих запросов клиента с политикой.
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
\ No newline at end of file
+    profile = profile or DEFAULT_HTTP_TRANSPORT_PROFILE
+    if transport is not None or policy is not None or not profile.shared:
+        return _create_client(profile, transport, policy, stats)
+
+    client = _shared_clients.get(profile)
+    if client is None or client.is_closed:
+        client = _shared_clients[profile] = _create_client(profile)
+
+    return client
+
+
+def build_async_gateway_http_client(profile: HTTPTransportProfile | None = None) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Общий клиент (shared=True) привязан к event loop, в котором был выполнен первый запрос,
+    поэтому его нужно использовать в пределах одного loop.
+
+    :param profile: Профиль транспорта. По умолчанию DEFAULT_HTTP_TRANSPORT_PROFILE.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    profile = profile or DEFAULT_HTTP_TRANSPORT_PROFILE
+    if not profile.shared:
+        return _create_async_client(profile)
+
+    client = _shared_async_clients.get(profile)
+    if client is None or client.is_closed:
+        client = _shared_async_clients[profile] = _create_async_client(profile)
+
+    return client
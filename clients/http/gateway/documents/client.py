@@ -1,7 +1,12 @@
 from httpx import Response
 
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse, HTTPDecodeMode
+from clients.http.gateway.client import (
+    build_async_gateway_http_client,
+    build_gateway_http_client,
+    HTTPTransportProfile
+)
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
     GetContractDocumentResponseSchema
@@ -20,7 +25,10 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/documents/tariff-document/{account_id}")
+        return self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(operation="get_tariff_document")
+        )
 
     def get_contract_document_api(self, account_id: str) -> Response:
         """
@@ -29,21 +37,80 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/documents/contract-document/{account_id}")
+        return self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(operation="get_contract_document")
+        )
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+    def get_tariff_document(self, account_id: str) -> DecodedResponse[GetTariffDocumentResponseSchema]:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetTariffDocumentResponseSchema)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+    def get_contract_document(self, account_id: str) -> DecodedResponse[GetContractDocumentResponseSchema]:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetContractDocumentResponseSchema)
 
 
-def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param profile: Профиль транспорта httpx.Client (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(client=build_gateway_http_client(profile), decode_mode=decode_mode)
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тариф по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(operation="get_tariff_document")
+        )
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракт по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(operation="get_contract_document")
+        )
+
+    async def get_tariff_document(self, account_id: str) -> DecodedResponse[GetTariffDocumentResponseSchema]:
+        response = await self.get_tariff_document_api(account_id)
+        return self.decode(response, GetTariffDocumentResponseSchema)
+
+    async def get_contract_document(self, account_id: str) -> DecodedResponse[GetContractDocumentResponseSchema]:
+        response = await self.get_contract_document_api(account_id)
+        return self.decode(response, GetContractDocumentResponseSchema)
+
+
+def build_async_documents_gateway_http_client(
+        profile: HTTPTransportProfile | None = None
+) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :param profile: Профиль транспорта httpx.AsyncClient (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_async_gateway_http_client(profile), decode_mode=decode_mode)
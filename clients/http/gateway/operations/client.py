@@ -1,7 +1,16 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
 from httpx import Response, QueryParams
 
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+from clients.futures import iter_completed
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse, HTTPDecodeMode
+from clients.http.gateway.client import (
+    build_async_gateway_http_client,
+    build_gateway_http_client,
+    HTTPTransportProfile
+)
 from clients.http.gateway.operations.schema import (
     GetOperationsQuerySchema,
     GetOperationResponseSchema,
@@ -12,6 +21,7 @@ from clients.http.gateway.operations.schema import (
     MakeOperationRequestSchema,
     MakePurchaseOperationRequestSchema
 )
+from clients.http.gateway.operations.templates import MakeOperationHTTPTemplates
 
 
 class OperationsGatewayHTTPClient(HTTPClient):
@@ -19,6 +29,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
     Клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
     """
 
+    templates: MakeOperationHTTPTemplates | None = None
+
     def get_operation_api(self, operation_id: str) -> Response:
         """
         Получение информации об операции по operation_id.
@@ -26,7 +38,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param operation_id: Идентификатор операции.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(url=f'/api/v1/operations/{operation_id}')
+        return self.get(url=f'/api/v1/operations/{operation_id}',
+                        extensions=HTTPClientExtensions(operation="get_operation")
+                        )
 
     def get_operation_receipt_api(self, operation_id: str) -> Response:
         """
@@ -35,7 +49,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param operation_id: Идентификатор операции.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(url=f'/api/v1/operations/operation-receipt/{operation_id}')
+        return self.get(url=f'/api/v1/operations/operation-receipt/{operation_id}',
+                        extensions=HTTPClientExtensions(operation="get_operation_receipt")
+                        )
 
     def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
         """
@@ -45,7 +61,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(url='/api/v1/operations',
-                        params=QueryParams(**query.model_dump(by_alias=True))
+                        params=QueryParams(**query.model_dump(by_alias=True)),
+                        extensions=HTTPClientExtensions(operation="get_operations")
                         )
 
     def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
@@ -56,7 +73,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(url='/api/v1/operations/operations-summary',
-                        params=QueryParams(**query.model_dump(by_alias=True))
+                        params=QueryParams(**query.model_dump(by_alias=True)),
+                        extensions=HTTPClientExtensions(operation="get_operations_summary")
                         )
 
     def make_fee_operation_api(self, request: MakeOperationRequestSchema) -> Response:
@@ -67,7 +85,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-fee-operation',
-                         json=request.model_dump(by_alias=True)
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_fee_operation")
                          )
 
     def make_top_up_operation_api(self, request: MakeOperationRequestSchema) -> Response:
@@ -78,7 +97,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-top-up-operation',
-                         json=request.model_dump(by_alias=True)
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_top_up_operation")
                          )
 
     def make_cashback_operation_api(self, request: MakeOperationRequestSchema) -> Response:
@@ -89,7 +109,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-cashback-operation',
-                         json=request.model_dump(by_alias=True)
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_cashback_operation")
                          )
 
     def make_transfer_operation_api(self, request: MakeOperationRequestSchema) -> Response:
@@ -100,7 +121,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-transfer-operation',
-                         json=request.model_dump(by_alias=True)
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_transfer_operation")
                          )
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
@@ -111,7 +133,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-purchase-operation',
-                         json=request.model_dump(by_alias=True)
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_purchase_operation")
                          )
 
     def make_bill_payment_operation_api(self, request: MakeOperationRequestSchema) -> Response:
@@ -122,7 +145,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-bill-payment-operation',
-                         json=request.model_dump(by_alias=True))
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_bill_payment_operation")
+                         )
 
     def make_cash_withdrawal_operation_api(self, request: MakeOperationRequestSchema) -> Response:
         """
@@ -132,67 +157,341 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(url='/api/v1/operations/make-cash-withdrawal-operation',
-                         json=request.model_dump(by_alias=True)
+                         json=request.model_dump(by_alias=True),
+                         extensions=HTTPClientExtensions(operation="make_cash_withdrawal_operation")
                          )
 
-    def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+    def get_operation(self, operation_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         response = self.get_operation_api(operation_id=operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+    def get_operation_receipt(self, operation_id: str) -> DecodedResponse[GetOperationReceiptResponseSchema]:
         response = self.get_operation_receipt_api(operation_id=operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationReceiptResponseSchema)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+    def get_operations(self, account_id: str) -> DecodedResponse[GetOperationsResponseSchema]:
         query = GetOperationsQuerySchema(accountId=account_id)
         response = self.get_operations_api(query=query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationsResponseSchema)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+    def get_operations_summary(self, account_id: str) -> DecodedResponse[GetOperationsSummaryResponseSchema]:
         query = GetOperationsSummaryQuerySchema(accountId=account_id)
         response = self.get_operations_summary_api(query=query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationsSummaryResponseSchema)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_fee_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_fee_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def make_top_up_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_top_up_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_top_up_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def make_cashback_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_cashback_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_cashback_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def make_transfer_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_transfer_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_transfer_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def make_purchase_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_purchase_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakePurchaseOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_purchase_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_bill_payment_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_bill_payment_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> GetOperationResponseSchema:
+    def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> DecodedResponse[GetOperationResponseSchema]:
         request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
         response = self.make_cash_withdrawal_operation_api(request=request)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
+
+    def submit_many(self, calls: Iterable[Callable[[], Any]], window: int = 100) -> Iterator[Future]:
+        """
+        Выполняет вызовы клиента конкурентно в пуле потоков (HTTP-аналог submit_many gRPC-клиента).
+
+        Окно не должно превышать max_connections профиля транспорта, иначе лишние
+        вызовы будут ждать соединение в пуле httpx.
+
+        :param calls: Функции без аргументов, например lambda: client.make_purchase_operation(card_id, account_id).
+        :param window: Максимальное количество одновременных вызовов.
+        :return: Итератор по завершённым concurrent.futures.Future в порядке завершения.
+        """
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            yield from iter_completed(executor.submit, calls, window)
+
+    def make_operations(
+            self,
+            operation: str,
+            card_id: str,
+            account_id: str,
+            count: int,
+            window: int = 100
+    ) -> Iterator[Future]:
+        """
+        Создаёт count операций по одной карте конкурентно. Тела запросов собираются
+        из шаблона (MakeOperationHTTPTemplates).
+
+        :param operation: Имя операции, например make_purchase_operation.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :param count: Количество операций.
+        :param window: Максимальное количество одновременных вызовов.
+        :return: Итератор по завершённым concurrent.futures.Future в порядке завершения.
+        """
+        if self.templates is None:
+            self.templates = MakeOperationHTTPTemplates(self)
+
+        def call() -> Any:
+            return self.templates.call(operation, card_id, account_id)
+
+        return self.submit_many((call for _ in range(count)), window)
 
 
-def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
+def build_operations_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> OperationsGatewayHTTPClient:
     """
         Функция создаёт экземпляр OperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+        :param profile: Профиль транспорта httpx.Client (лимиты пула, HTTP/2, общий пул).
+        :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
         :return: Готовый к использованию OperationsGatewayHTTPClient.
         """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+    return OperationsGatewayHTTPClient(client=build_gateway_http_client(profile), decode_mode=decode_mode)
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Получение информации об операции по operation_id.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(url=f'/api/v1/operations/{operation_id}',
+                              extensions=HTTPClientExtensions(operation="get_operation")
+                              )
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        """
+        Получение чека по операции по operation_id.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(url=f'/api/v1/operations/operation-receipt/{operation_id}',
+                              extensions=HTTPClientExtensions(operation="get_operation_receipt")
+                              )
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Получение списка операций для определенного счета.
+
+        :param query: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(url='/api/v1/operations',
+                              params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(operation="get_operations")
+                              )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Получение статистики по операциям для определенного счета.
+
+        :param query: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(url='/api/v1/operations/operations-summary',
+                              params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(operation="get_operations_summary")
+                              )
+
+    async def make_fee_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+        """
+        Создание операции комиссии.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-fee-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_fee_operation")
+                               )
+
+    async def make_top_up_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+        """
+        Создание операции пополнения.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-top-up-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_top_up_operation")
+                               )
+
+    async def make_cashback_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+        """
+        Создание операции кэшбэка.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-cashback-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_cashback_operation")
+                               )
+
+    async def make_transfer_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+        """
+        Создание операции перевода.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-transfer-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_transfer_operation")
+                               )
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        """
+        Создание операции покупки.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-purchase-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_purchase_operation")
+                               )
+
+    async def make_bill_payment_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+        """
+        Создание операции оплаты по счету.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-bill-payment-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_bill_payment_operation")
+                               )
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+        """
+        Создание операции снятия наличных денег.
+
+        :param request: Словарь с параметрами запроса
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(url='/api/v1/operations/make-cash-withdrawal-operation',
+                               json=request.model_dump(by_alias=True),
+                               extensions=HTTPClientExtensions(operation="make_cash_withdrawal_operation")
+                               )
+
+    async def get_operation(self, operation_id: str) -> DecodedResponse[GetOperationResponseSchema]:
+        response = await self.get_operation_api(operation_id=operation_id)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def get_operation_receipt(self, operation_id: str) -> DecodedResponse[GetOperationReceiptResponseSchema]:
+        response = await self.get_operation_receipt_api(operation_id=operation_id)
+        return self.decode(response, GetOperationReceiptResponseSchema)
+
+    async def get_operations(self, account_id: str) -> DecodedResponse[GetOperationsResponseSchema]:
+        query = GetOperationsQuerySchema(accountId=account_id)
+        response = await self.get_operations_api(query=query)
+        return self.decode(response, GetOperationsResponseSchema)
+
+    async def get_operations_summary(self, account_id: str) -> DecodedResponse[GetOperationsSummaryResponseSchema]:
+        query = GetOperationsSummaryQuerySchema(accountId=account_id)
+        response = await self.get_operations_summary_api(query=query)
+        return self.decode(response, GetOperationsSummaryResponseSchema)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_fee_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_top_up_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_cashback_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_transfer_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakePurchaseOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_purchase_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_bill_payment_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> DecodedResponse[GetOperationResponseSchema]:
+        request = MakeOperationRequestSchema(cardId=card_id, accountId=account_id)
+        response = await self.make_cash_withdrawal_operation_api(request=request)
+        return self.decode(response, GetOperationResponseSchema)
+
+
+def build_async_operations_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :param profile: Профиль транспорта httpx.AsyncClient (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_async_gateway_http_client(profile), decode_mode=decode_mode)
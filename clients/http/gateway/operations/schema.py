@@ -108,7 +108,7 @@ class GetOperationsResponseSchema(BaseModel):
     """
     Описание структуры ответа получения операций
     """
-    operations: OperationSchema
+    operations: list[OperationSchema]
 
 
 class GetOperationsSummaryResponseSchema(BaseModel):
@@ -0,0 +1,77 @@
+from typing import Any
+
+from httpx import Response
+
+from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.gateway.operations.schema import GetOperationResponseSchema, OperationStatus
+from clients.http.templates import JSONBodyTemplate
+from tools.fakers import fake
+
+# Имя операции -> URL эндпоинта
+MAKE_OPERATION_URLS = {
+    "make_fee_operation": "/api/v1/operations/make-fee-operation",
+    "make_top_up_operation": "/api/v1/operations/make-top-up-operation",
+    "make_cashback_operation": "/api/v1/operations/make-cashback-operation",
+    "make_transfer_operation": "/api/v1/operations/make-transfer-operation",
+    "make_purchase_operation": "/api/v1/operations/make-purchase-operation",
+    "make_bill_payment_operation": "/api/v1/operations/make-bill-payment-operation",
+    "make_cash_withdrawal_operation": "/api/v1/operations/make-cash-withdrawal-operation",
+}
+
+
+class MakeOperationHTTPTemplates:
+    """
+    Шаблоны JSON-тел запросов make_*_operation для горячего цикла нагрузки.
+
+    Аналог clients.grpc.gateway.operations.templates.MakeOperationGRPCTemplates для HTTP:
+    тело собирается из закэшированных байтов и уходит через HTTPClient.post(content=...).
+
+    :param client: HTTP-клиент шлюза (например, OperationsGatewayHTTPClient).
+    """
+
+    def __init__(self, client: HTTPClient):
+        self.client = client
+        self.template = JSONBodyTemplate(("cardId", "accountId"), ("status", "amount"))
+        self.purchase_template = JSONBodyTemplate(("cardId", "accountId"), ("status", "amount", "category"))
+        self.extensions = {
+            operation: HTTPClientExtensions(operation=operation) for operation in MAKE_OPERATION_URLS
+        }
+
+    def content(self, operation: str, card_id: str, account_id: str) -> bytes:
+        """
+        :param operation: Имя операции, например make_purchase_operation.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: JSON-тело запроса со случайными статусом, суммой и (для покупки) категорией.
+        """
+        if operation == "make_purchase_operation":
+            return self.purchase_template.encode(
+                (card_id, account_id),
+                fake.enum(OperationStatus),
+                fake.amount(),
+                fake.category()
+            )
+
+        return self.template.encode((card_id, account_id), fake.enum(OperationStatus), fake.amount())
+
+    def call_api(self, operation: str, card_id: str, account_id: str) -> Response:
+        """
+        :param operation: Имя операции.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return self.client.post(
+            MAKE_OPERATION_URLS[operation],
+            content=self.content(operation, card_id, account_id),
+            extensions=self.extensions[operation]
+        )
+
+    def call(self, operation: str, card_id: str, account_id: str) -> Any:
+        """
+        :param operation: Имя операции.
+        :param card_id: ID карты.
+        :param account_id: ID счета.
+        :return: Ответ, разобранный согласно decode_mode клиента.
+        """
+        return self.client.decode(self.call_api(operation, card_id, account_id), GetOperationResponseSchema)
@@ -2,8 +2,13 @@ import time
 
 from httpx import Response
 
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse, HTTPDecodeMode
+from clients.http.gateway.client import (
+    build_async_gateway_http_client,
+    build_gateway_http_client,
+    HTTPTransportProfile
+)
 from clients.http.gateway.users.schema import (  # Добавили импорт моделей
     GetUserResponseSchema,
     CreateUserRequestSchema,
@@ -23,7 +28,10 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param user_id: Идентификатор пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/users/{user_id}")
+        return self.get(
+            f"/api/v1/users/{user_id}",
+            extensions=HTTPClientExtensions(operation="get_user")
+        )
 
     def create_user_api(self, request: CreateUserRequestSchema) -> Response:
         """
@@ -32,22 +40,85 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/users",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="create_user")
+        )
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+    def get_user(self, user_id: str) -> DecodedResponse[GetUserResponseSchema]:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetUserResponseSchema)
 
-    def create_user(self) -> CreateUserResponseSchema:
+    def create_user(self) -> DecodedResponse[CreateUserResponseSchema]:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.decode(response, CreateUserResponseSchema)
 
 
-def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
+def build_users_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param profile: Профиль транспорта httpx.Client (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(client=build_gateway_http_client(profile), decode_mode=decode_mode)
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/users/{user_id}",
+            extensions=HTTPClientExtensions(operation="get_user")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Pydantic-модель с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/users",
+            json=request.model_dump(by_alias=True),
+            extensions=HTTPClientExtensions(operation="create_user")
+        )
+
+    async def get_user(self, user_id: str) -> DecodedResponse[GetUserResponseSchema]:
+        response = await self.get_user_api(user_id)
+        return self.decode(response, GetUserResponseSchema)
+
+    async def create_user(self) -> DecodedResponse[CreateUserResponseSchema]:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return self.decode(response, CreateUserResponseSchema)
+
+
+def build_async_users_gateway_http_client(
+        profile: HTTPTransportProfile | None = None,
+        decode_mode: HTTPDecodeMode = HTTPDecodeMode.VALIDATE
+) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :param profile: Профиль транспорта httpx.AsyncClient (лимиты пула, HTTP/2, общий пул).
+    :param decode_mode: Способ разбора ответов (полная валидация, без валидации или сырой JSON).
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_async_gateway_http_client(profile), decode_mode=decode_mode)
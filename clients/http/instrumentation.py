@@ -0,0 +1,142 @@
+from time import perf_counter
+
+from httpx import AsyncBaseTransport, BaseTransport, Request, Response
+
+from clients.instrumentation import Instrumentation, RequestRecord, Transport
+
+_START_KEY = "instrumentation_start"
+
+
+class HTTPInstrumentationHooks:
+    """
+    Event hooks httpx, которые отправляют RequestRecord в Instrumentation.
+
+    Логическое имя операции берётся из extensions запроса (см. HTTPClientExtensions),
+    если его нет — используется путь URL.
+
+    Запросы, завершившиеся исключением (таймаут, ошибка соединения), не доходят до response-хука:
+    о них сообщает HTTPInstrumentationTransport через on_error().
+
+    :param instrumentation: Точка подписки на записи о вызовах.
+    """
+
+    def __init__(self, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
+
+    def on_request(self, request: Request) -> None:
+        request.extensions[_START_KEY] = perf_counter()
+
+    def on_response(self, response: Response) -> None:
+        if not self.instrumentation.subscribers:
+            return
+
+        # Тело читается здесь, а не позже в клиенте: так end включает получение ответа целиком
+        try:
+            response.read()
+        except Exception as error:
+            self.on_error(response.request, error)
+            raise
+
+        self._emit(response)
+
+    async def on_async_request(self, request: Request) -> None:
+        request.extensions[_START_KEY] = perf_counter()
+
+    async def on_async_response(self, response: Response) -> None:
+        if not self.instrumentation.subscribers:
+            return
+
+        try:
+            await response.aread()
+        except Exception as error:
+            self.on_error(response.request, error)
+            raise
+
+        self._emit(response)
+
+    def on_error(self, request: Request, error: Exception) -> None:
+        """
+        Отправляет запись о вызове, который завершился исключением вместо ответа.
+
+        :param request: Запрос.
+        :param error: Исключение httpx (его имя попадает в status).
+        """
+        if not self.instrumentation.subscribers:
+            return
+
+        end = perf_counter()
+        extensions = request.extensions
+        self.instrumentation.emit(RequestRecord(
+            operation=extensions.get("operation") or request.url.path,
+            transport=Transport.HTTP,
+            status=type(error).__name__,
+            ok=False,
+            request_bytes=int(request.headers.get("content-length", 0)),
+            response_bytes=0,
+            start=extensions.get(_START_KEY, end),
+            end=end
+        ))
+
+    def _emit(self, response: Response) -> None:
+        end = perf_counter()
+        request = response.request
+        extensions = request.extensions
+
+        self.instrumentation.emit(RequestRecord(
+            operation=extensions.get("operation") or request.url.path,
+            transport=Transport.HTTP,
+            status=str(response.status_code),
+            ok=response.status_code < 400,
+            request_bytes=int(request.headers.get("content-length", 0)),
+            response_bytes=len(response.content),
+            start=extensions.get(_START_KEY, end),
+            end=end
+        ))
+
+
+class HTTPInstrumentationTransport(BaseTransport):
+    """
+    Транспорт httpx, который сообщает HTTPInstrumentationHooks о запросах, завершившихся исключением.
+
+    Успешные ответы учитывает response-хук, поэтому транспорт только пропускает их дальше.
+
+    :param transport: Транспорт, выполняющий запросы.
+    :param hooks: Хуки инструментирования клиента.
+    """
+
+    def __init__(self, transport: BaseTransport, hooks: HTTPInstrumentationHooks):
+        self.transport = transport
+        self.hooks = hooks
+
+    def handle_request(self, request: Request) -> Response:
+        try:
+            return self.transport.handle_request(request)
+        except Exception as error:
+            self.hooks.on_error(request, error)
+            raise
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncHTTPInstrumentationTransport(AsyncBaseTransport):
+    """
+    Асинхронный вариант HTTPInstrumentationTransport.
+
+    :param transport: Транспорт, выполняющий запросы.
+    :param hooks: Хуки инструментирования клиента.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport, hooks: HTTPInstrumentationHooks):
+        self.transport = transport
+        self.hooks = hooks
+
+    async def handle_async_request(self, request: Request) -> Response:
+        try:
+            return await self.transport.handle_async_request(request)
+        except Exception as error:
+            self.hooks.on_error(request, error)
+            raise
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,136 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from httpx import (
+    BaseTransport,
+    ByteStream,
+    NetworkError,
+    ReadTimeout,
+    RemoteProtocolError,
+    Request,
+    Response,
+    TimeoutException
+)
+
+from clients.instrumentation import Transport
+from clients.policies import CallPolicyExecutor, CallPolicySchema, CallPolicyStats, PolicyCall, policy_stats
+
+# Ответы перегруженного или недоступного шлюза, после которых запрос можно повторить
+RETRYABLE_HTTP_STATUSES = frozenset({429, 502, 503, 504})
+
+# Ошибки, при которых запрос заведомо не обработан или его результат неизвестен
+RETRYABLE_HTTP_ERRORS = (TimeoutException, NetworkError, RemoteProtocolError)
+
+
+class _HTTPPolicyCall(PolicyCall):
+    def __init__(self, transport: BaseTransport, request: Request, executor: ThreadPoolExecutor | None):
+        self.transport = transport
+        self.request = request
+        self.executor = executor
+
+    def with_timeout(self, timeout: float | None) -> Request:
+        if timeout is None:
+            return self.request
+
+        # У параллельных попыток свои таймауты, поэтому запрос копируется, а не изменяется
+        timeouts = {
+            name: timeout if value is None else min(value, timeout)
+            for name, value in self.request.extensions.get("timeout", {}).items()
+        }
+        return Request(
+            self.request.method,
+            self.request.url,
+            headers=self.request.headers,
+            stream=self.request.stream,
+            extensions={**self.request.extensions, "timeout": timeouts}
+        )
+
+    def attempt(self, timeout: float | None) -> Response:
+        """
+        Выполняет попытку и дочитывает тело ответа в её пределах.
+
+        Таймауты httpx ограничивают каждое чтение по отдельности, поэтому медленно отдаваемый ответ
+        уложился бы в них, превысив бюджет. Срок попытки проверяется между фрагментами тела:
+        он может быть превышен не больше чем на одно чтение, которое само ограничено timeout.
+
+        :param timeout: Ограничение попытки в секундах или None.
+        :return: Ответ с уже прочитанным (но не декодированным) телом.
+        :raises httpx.ReadTimeout: Тело не прочитано до истечения срока попытки.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        request = self.with_timeout(timeout)
+        response = self.transport.handle_request(request)
+        try:
+            chunks = []
+            for chunk in response.stream:
+                chunks.append(chunk)
+                if deadline is not None and time.monotonic() > deadline:
+                    raise ReadTimeout(f"Response was not received within {timeout:.3f}s", request=request)
+        finally:
+            response.close()
+
+        return Response(
+            response.status_code,
+            headers=response.headers,
+            stream=ByteStream(b"".join(chunks)),
+            extensions=response.extensions
+        )
+
+    def submit(self, timeout: float | None) -> Future:
+        return self.executor.submit(self.attempt, timeout)
+
+    def is_retryable(self, result: Response | None, error: BaseException | None) -> bool:
+        if error is not None:
+            return isinstance(error, RETRYABLE_HTTP_ERRORS)
+
+        return result.status_code in RETRYABLE_HTTP_STATUSES
+
+    def discard(self, result: Response) -> None:
+        result.close()
+
+
+class HTTPPolicyTransport(BaseTransport):
+    """
+    Транспорт httpx, выполняющий запросы по политикам CallPolicySchema поверх другого транспорта.
+
+    Операция определяется по расширению запроса "operation" (см. HTTPClientExtensions).
+    Транспорт работает под event hooks клиента, поэтому инструментирование видит один вызов
+    со всеми повторами, а сами повторы и дублирующие запросы учитываются в CallPolicyStats.
+
+    Тело ответа читается внутри попытки, чтобы deadline и attempt_timeout ограничивали весь ответ,
+    а не каждое чтение из сокета, как таймауты httpx. Поэтому ответы не отдаются потоком (client.stream()
+    получит тело целиком), а срок может быть превышен не больше чем на одно чтение из сокета.
+
+    Дублирующие запросы выполняются в пуле потоков: в нём одновременно оказываются и основной,
+    и дублирующий запросы, поэтому hedge_workers должен быть не меньше удвоенного числа
+    одновременных вызовов.
+
+    :param transport: Транспорт, выполняющий попытки (обычно httpx.HTTPTransport).
+    :param policy: Политики вызовов.
+    :param stats: Счетчики повторов и дублирующих запросов.
+    :param hedge_workers: Размер пула потоков для дублирующих запросов.
+    """
+
+    def __init__(
+            self,
+            transport: BaseTransport,
+            policy: CallPolicySchema,
+            stats: CallPolicyStats = policy_stats,
+            hedge_workers: int = 200
+    ):
+        self.transport = transport
+        self.executor = CallPolicyExecutor(policy, Transport.HTTP, stats)
+        hedging = policy.reads.hedge_delay is not None or any(
+            operation.hedge_delay is not None for operation in policy.operations.values()
+        )
+        self.hedge_executor = ThreadPoolExecutor(max_workers=hedge_workers) if hedging else None
+
+    def handle_request(self, request: Request) -> Response:
+        operation = request.extensions.get("operation", request.url.path)
+        return self.executor.execute(operation, _HTTPPolicyCall(self.transport, request, self.hedge_executor))
+
+    def close(self) -> None:
+        if self.hedge_executor is not None:
+            self.hedge_executor.shutdown(wait=False)
+
+        self.transport.close()
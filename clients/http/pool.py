@@ -0,0 +1,111 @@
+from time import perf_counter
+from typing import Any
+
+from httpx import Request
+from pydantic import BaseModel
+
+
+class HTTPPoolWaitSnapshot(BaseModel):
+    """
+    Снимок статистики ожидания свободного соединения в пуле httpx.
+    """
+    requests: int
+    saturated: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class HTTPPoolMonitor:
+    """
+    Измеряет время ожидания соединения из пула (client-side queueing).
+
+    Время считается от момента отправки запроса клиентом до первого trace-события httpcore.
+    Первое событие (connect_tcp или send_request_headers) возникает только после того,
+    как запросу выдан слот в пуле, поэтому разница — это очередь на стороне клиента,
+    а не задержка шлюза.
+
+    :param saturation_threshold: Порог ожидания (в секундах), начиная с которого запрос
+                                 считается упёршимся в лимиты пула.
+    """
+
+    def __init__(self, saturation_threshold: float = 0.001):
+        self.saturation_threshold = saturation_threshold
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Сбрасывает накопленную статистику.
+        """
+        self.requests = 0
+        self.saturated = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def observe(self, wait: float) -> None:
+        """
+        Учитывает время ожидания одного запроса.
+
+        :param wait: Время ожидания соединения в секундах.
+        """
+        self.requests += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+        if wait >= self.saturation_threshold:
+            self.saturated += 1
+
+    def on_request(self, request: Request) -> None:
+        """
+        Event hook httpx.Client: подписывается на trace-события httpcore для запроса.
+
+        :param request: Отправляемый запрос.
+        """
+        started = perf_counter()
+        parent = request.extensions.get("trace")
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal started
+            if started is not None:
+                self.observe(perf_counter() - started)
+                started = None
+            if parent is not None:
+                parent(event_name, info)
+
+        request.extensions["trace"] = trace
+
+    async def on_async_request(self, request: Request) -> None:
+        """
+        Event hook httpx.AsyncClient: то же, что on_request, но с асинхронным trace-колбэком.
+
+        :param request: Отправляемый запрос.
+        """
+        started = perf_counter()
+        parent = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal started
+            if started is not None:
+                self.observe(perf_counter() - started)
+                started = None
+            if parent is not None:
+                await parent(event_name, info)
+
+        request.extensions["trace"] = trace
+
+    def snapshot(self) -> HTTPPoolWaitSnapshot:
+        """
+        :return: Текущая статистика ожидания соединений.
+        """
+        return HTTPPoolWaitSnapshot(
+            requests=self.requests,
+            saturated=self.saturated,
+            total_wait=self.total_wait,
+            max_wait=self.max_wait
+        )
+
+
+pool_monitor = HTTPPoolMonitor()
@@ -0,0 +1,63 @@
+import json
+from typing import Any
+
+# Сколько закодированных значений поля хранить в кэше (статусы, категории и т.п.)
+MAX_CACHED_VALUES = 4096
+
+
+class JSONBodyTemplate:
+    """
+    Шаблон JSON-тела запроса с постоянной и переменной частью.
+
+    Постоянные поля (например, cardId и accountId из пула сущностей) кодируются один раз на набор
+    значений и кэшируются вместе с открывающей скобкой (не более MAX_CACHED_VALUES наборов).
+    Переменные поля дописываются к готовым байтам: строки и enum — из кэша закодированных значений, числа — через repr(). Ни pydantic model_dump,
+    ни json.dumps на каждый запрос не вызываются.
+
+    :param fixed_fields: Ключи постоянных полей (как в JSON, т.е. alias).
+    :param variable_fields: Ключи переменных полей.
+    """
+
+    def __init__(self, fixed_fields: tuple[str, ...], variable_fields: tuple[str, ...]):
+        self.fixed_fields = fixed_fields
+        self.variable_fields = variable_fields
+        self.keys = [f",{json.dumps(name)}:".encode() for name in variable_fields]
+        if not fixed_fields and self.keys:
+            self.keys[0] = self.keys[0][1:]
+        self.prefixes: dict[tuple, bytes] = {}
+        self.values: dict[Any, bytes] = {}
+
+    def encode_value(self, value: Any) -> bytes:
+        """
+        :param value: Значение переменного поля.
+        :return: Значение в формате JSON.
+        """
+        if type(value) is float or type(value) is int:
+            return repr(value).encode()
+
+        result = self.values.get(value)
+        if result is None:
+            result = json.dumps(value).encode()
+            if len(self.values) < MAX_CACHED_VALUES:
+                self.values[value] = result
+
+        return result
+
+    def encode(self, fixed: tuple, *values: Any) -> bytes:
+        """
+        :param fixed: Значения постоянных полей в порядке fixed_fields.
+        :param values: Значения переменных полей в порядке variable_fields.
+        :return: JSON-тело запроса.
+        """
+        prefix = self.prefixes.get(fixed)
+        if prefix is None:
+            prefix = json.dumps(dict(zip(self.fixed_fields, fixed)))[:-1].encode()
+            if len(self.prefixes) < MAX_CACHED_VALUES:
+                self.prefixes[fixed] = prefix
+
+        parts = [prefix]
+        for key, value in zip(self.keys, values):
+            parts.append(key)
+            parts.append(self.encode_value(value))
+        parts.append(b"}")
+        return b"".join(parts)
@@ -0,0 +1,122 @@
+import json
+from collections import deque
+from enum import StrEnum
+from typing import Any, Callable, NamedTuple, TextIO
+
+
+class Transport(StrEnum):
+    HTTP = "HTTP"
+    GRPC = "GRPC"
+
+
+class RequestRecord(NamedTuple):
+    """
+    Запись об одном вызове шлюза.
+
+    Время start/end берётся из time.perf_counter() (монотонные часы, секунды).
+    NamedTuple выбран намеренно: создание записи стоит доли микросекунды.
+    """
+    operation: str
+    transport: Transport
+    status: str
+    ok: bool
+    request_bytes: int
+    response_bytes: int
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+Subscriber = Callable[[RequestRecord], None]
+
+
+class Instrumentation:
+    """
+    Точка подписки на записи о вызовах HTTP и gRPC клиентов.
+
+    Хуки транспорта проверяют, есть ли подписчики, до того как собирать запись,
+    поэтому без подписчиков инструментирование почти ничего не стоит.
+    """
+
+    def __init__(self):
+        self.subscribers: list[Subscriber] = []
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """
+        :param subscriber: Функция, которая будет получать каждую RequestRecord.
+        """
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """
+        :param subscriber: Ранее подписанная функция.
+        """
+        self.subscribers.remove(subscriber)
+
+    def emit(self, record: RequestRecord) -> None:
+        """
+        Передаёт запись всем подписчикам.
+
+        :param record: Запись о вызове.
+        """
+        for subscriber in self.subscribers:
+            subscriber(record)
+
+
+class MemorySink:
+    """
+    Хранит последние записи в памяти (для отладки и коротких прогонов).
+
+    :param maxlen: Максимальное количество хранимых записей.
+    """
+
+    def __init__(self, maxlen: int | None = 100_000):
+        self.records: deque[RequestRecord] = deque(maxlen=maxlen)
+
+    def __call__(self, record: RequestRecord) -> None:
+        self.records.append(record)
+
+
+class FileSink:
+    """
+    Пишет записи в файл в формате JSON Lines.
+
+    :param file: Открытый на запись текстовый файл.
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+
+    def __call__(self, record: RequestRecord) -> None:
+        self.file.write(json.dumps(record._asdict()))
+        self.file.write("\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class LocustSink:
+    """
+    Пробрасывает записи в событие request Locust, чтобы вызовы попадали в его статистику.
+
+    :param environment: locust.env.Environment.
+    """
+
+    def __init__(self, environment: Any):
+        self.environment = environment
+
+    def __call__(self, record: RequestRecord) -> None:
+        self.environment.events.request.fire(
+            request_type=record.transport,
+            name=record.operation,
+            response_time=record.duration * 1000,
+            response_length=record.response_bytes,
+            exception=None if record.ok else RuntimeError(record.status),
+            context={}
+        )
+
+
+instrumentation = Instrumentation()
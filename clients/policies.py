@@ -0,0 +1,359 @@
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Self
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from clients.instrumentation import Transport
+
+# Операции только на чтение: их можно повторять и дублировать без побочных эффектов
+IDEMPOTENT_OPERATIONS = frozenset({
+    "get_user",
+    "get_accounts",
+    "get_operation",
+    "get_operations",
+    "get_operation_receipt",
+    "get_operations_summary",
+    "get_tariff_document",
+    "get_contract_document",
+})
+
+
+class OperationPolicySchema(BaseModel):
+    """
+    Политика вызова одной операции (все времена в секундах).
+
+    deadline        — бюджет на весь вызов вместе с повторами. None — без ограничения.
+    attempt_timeout — ограничение одной попытки. None — весь оставшийся бюджет.
+    max_attempts    — попыток всего, 1 — без повторов.
+    backoff         — пауза перед n-м повтором случайна в [0, min(max_backoff, backoff * 2 ** (n - 1))].
+    hedge_delay     — если ответа нет за hedge_delay, отправляется такой же запрос и берётся первый ответ.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    deadline: float | None = Field(default=None, gt=0)
+    attempt_timeout: float | None = Field(default=None, gt=0)
+    max_attempts: int = Field(default=1, ge=1, le=10)
+    backoff: float = Field(default=0.05, ge=0)
+    max_backoff: float = Field(default=1.0, ge=0)
+    hedge_delay: float | None = Field(default=None, gt=0)
+
+    @property
+    def repeats(self) -> bool:
+        """
+        :return: True, если политика может отправить запрос больше одного раза.
+        """
+        return self.max_attempts > 1 or self.hedge_delay is not None
+
+
+class CallPolicySchema(BaseModel):
+    """
+    Политики вызовов клиентов шлюза.
+
+    Политика операции берётся из operations, иначе reads для операций из idempotent, иначе default.
+    Повторы и дублирование разрешены только для идемпотентных операций.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    default: OperationPolicySchema = OperationPolicySchema()
+    reads: OperationPolicySchema = OperationPolicySchema()
+    operations: dict[str, OperationPolicySchema] = Field(default_factory=dict)
+    idempotent: frozenset[str] = IDEMPOTENT_OPERATIONS
+
+    @model_validator(mode="after")
+    def check_repeats(self) -> Self:
+        if self.default.repeats:
+            raise ValueError("Default policy must not retry or hedge: it applies to non-idempotent operations")
+
+        unsafe = sorted(
+            operation for operation, policy in self.operations.items()
+            if policy.repeats and operation not in self.idempotent
+        )
+        if unsafe:
+            raise ValueError(f"Operations {unsafe} are not idempotent and must not be retried or hedged")
+
+        return self
+
+    def get(self, operation: str) -> OperationPolicySchema:
+        """
+        :param operation: Имя операции (например, get_operation).
+        :return: Политика операции.
+        """
+        policy = self.operations.get(operation)
+        if policy is None:
+            policy = self.reads if operation in self.idempotent else self.default
+
+        return policy
+
+
+# Дедлайны для всех операций и до трёх попыток для чтения
+DEFAULT_CALL_POLICY = CallPolicySchema(
+    default=OperationPolicySchema(deadline=10),
+    reads=OperationPolicySchema(deadline=5, attempt_timeout=2, max_attempts=3, backoff=0.05, max_backoff=0.5)
+)
+
+
+class OperationPolicyStatsSchema(BaseModel):
+    """
+    Счетчики политики по операции.
+
+    attempts   — запросов, реально отправленных в шлюз: calls + retries + hedges.
+    hedge_wins — вызовов, в которых первым ответил дублирующий запрос.
+    """
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+    def merge(self, other: "OperationPolicyStatsSchema") -> "OperationPolicyStatsSchema":
+        """
+        :param other: Счетчики той же операции в другом воркере.
+        :return: Новые счетчики с суммой значений.
+        """
+        return OperationPolicyStatsSchema(
+            calls=self.calls + other.calls,
+            attempts=self.attempts + other.attempts,
+            retries=self.retries + other.retries,
+            hedges=self.hedges + other.hedges,
+            hedge_wins=self.hedge_wins + other.hedge_wins
+        )
+
+
+def merge_policy_stats(
+        left: dict[str, OperationPolicyStatsSchema],
+        right: dict[str, OperationPolicyStatsSchema]
+) -> dict[str, OperationPolicyStatsSchema]:
+    """
+    :param left: Счетчики одного воркера.
+    :param right: Счетчики другого воркера.
+    :return: Сумма счетчиков по операциям.
+    """
+    merged = dict(left)
+    for name, stats in right.items():
+        merged[name] = merged[name].merge(stats) if name in merged else stats
+
+    return merged
+
+
+class CallPolicyStats:
+    """
+    Счетчики повторов и дублирующих запросов по операциям "<transport>:<operation>",
+    чтобы дополнительная нагрузка на шлюз от политик была видна в отчётах.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations: dict[str, list[int]] = {}
+
+    def record(self, name: str, retries: int, hedges: int, hedge_wins: int) -> None:
+        """
+        Учитывает один завершённый вызов.
+
+        :param name: Имя операции.
+        :param retries: Количество повторов.
+        :param hedges: Количество дублирующих запросов.
+        :param hedge_wins: Сколько раз дублирующий запрос ответил первым.
+        """
+        with self.lock:
+            counters = self.operations.get(name)
+            if counters is None:
+                counters = self.operations[name] = [0, 0, 0, 0]
+
+            counters[0] += 1
+            counters[1] += retries
+            counters[2] += hedges
+            counters[3] += hedge_wins
+
+    def snapshot(self) -> dict[str, OperationPolicyStatsSchema]:
+        """
+        :return: Счетчики по операциям.
+        """
+        with self.lock:
+            return {
+                name: OperationPolicyStatsSchema(
+                    calls=calls,
+                    attempts=calls + retries + hedges,
+                    retries=retries,
+                    hedges=hedges,
+                    hedge_wins=hedge_wins
+                )
+                for name, (calls, retries, hedges, hedge_wins) in self.operations.items()
+            }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.operations.clear()
+
+
+policy_stats = CallPolicyStats()
+
+
+def _reset_policy_stats_after_fork() -> None:
+    # Воркер после fork считает только свои вызовы; блокировку мог держать другой поток родителя
+    policy_stats.lock = threading.Lock()
+    policy_stats.operations = {}
+
+
+os.register_at_fork(after_in_child=_reset_policy_stats_after_fork)
+
+
+class PolicyCall(ABC):
+    """
+    Один логический вызов, который CallPolicyExecutor может повторить или продублировать.
+
+    Реализуется транспортом: attempt() выполняет попытку в текущем потоке, submit() запускает её
+    в фоне и возвращает future (concurrent.futures.Future или grpc.Future).
+    """
+
+    @abstractmethod
+    def attempt(self, timeout: float | None) -> Any:
+        ...
+
+    @abstractmethod
+    def submit(self, timeout: float | None) -> Any:
+        ...
+
+    def resolve(self, future: Any) -> tuple[Any, BaseException | None]:
+        """
+        :param future: Завершённая попытка из submit().
+        :return: (результат, ошибка) — то же, что вернул бы или выбросил attempt().
+        """
+        error = future.exception()
+        return (None, error) if error is not None else (future.result(), None)
+
+    @abstractmethod
+    def is_retryable(self, result: Any, error: BaseException | None) -> bool:
+        ...
+
+    def discard(self, result: Any) -> None:
+        """
+        Освобождает ресурсы неиспользованного результата (например, закрывает HTTP-ответ).
+        """
+
+
+class CallPolicyExecutor:
+    """
+    Выполняет вызовы по CallPolicySchema: дедлайн на весь вызов, повторы с экспоненциальной паузой
+    со случайной составляющей (full jitter) и дублирующие запросы (hedging) для хвостовых задержек.
+
+    Если все попытки исчерпаны или бюджет кончился, вызывающий получает результат или ошибку
+    последней попытки — так же, как без политики.
+
+    :param policy: Политики вызовов.
+    :param transport: Транспорт (для имён операций в счетчиках).
+    :param stats: Счетчики повторов и дублирующих запросов.
+    """
+
+    def __init__(self, policy: CallPolicySchema, transport: Transport, stats: CallPolicyStats = policy_stats):
+        self.policy = policy
+        self.transport = transport
+        self.stats = stats
+
+    def get_timeout(self, policy: OperationPolicySchema, deadline: float | None) -> float | None:
+        """
+        :param policy: Политика операции.
+        :param deadline: Момент окончания бюджета (time.monotonic()) или None.
+        :return: Ограничение времени очередной попытки или None, если его нет.
+        """
+        timeout = policy.attempt_timeout
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        return timeout
+
+    def execute(self, operation: str, call: PolicyCall) -> Any:
+        """
+        :param operation: Имя операции (например, get_operation).
+        :param call: Вызов.
+        :return: Результат первой успешной (или последней) попытки.
+        :raises Exception: Ошибка последней попытки.
+        """
+        policy = self.policy.get(operation)
+        deadline = None if policy.deadline is None else time.monotonic() + policy.deadline
+        retries = hedges = hedge_wins = 0
+        try:
+            attempt = 1
+            while True:
+                timeout = self.get_timeout(policy, deadline)
+                if policy.hedge_delay is None:
+                    result, error = self.run(call, timeout)
+                else:
+                    result, error, hedged, hedge_won = self.run_hedged(call, policy, deadline, timeout)
+                    hedges += hedged
+                    hedge_wins += hedge_won
+
+                if attempt >= policy.max_attempts or not call.is_retryable(result, error):
+                    break
+
+                delay = random.uniform(0, min(policy.max_backoff, policy.backoff * 2 ** (attempt - 1)))
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    break
+
+                if result is not None:
+                    call.discard(result)
+
+                time.sleep(delay)
+                retries += 1
+                attempt += 1
+        finally:
+            self.stats.record(f"{self.transport}:{operation}", retries, hedges, hedge_wins)
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def run(self, call: PolicyCall, timeout: float | None) -> tuple[Any, BaseException | None]:
+        try:
+            return call.attempt(timeout), None
+        except Exception as error:
+            return None, error
+
+    def run_hedged(
+            self,
+            call: PolicyCall,
+            policy: OperationPolicySchema,
+            deadline: float | None,
+            timeout: float | None
+    ) -> tuple[Any, BaseException | None, bool, bool]:
+        """
+        Отправляет попытку и, если она не завершилась за hedge_delay, ещё одну такую же.
+
+        :return: (результат, ошибка, был ли дублирующий запрос, ответил ли он первым).
+        """
+        completed = threading.Event()
+        futures = [call.submit(timeout)]
+        futures[0].add_done_callback(lambda _: completed.set())
+
+        if not completed.wait(policy.hedge_delay):
+            hedge_timeout = self.get_timeout(policy, deadline)
+            if hedge_timeout is None or hedge_timeout > 0:
+                futures.append(call.submit(hedge_timeout))
+                futures[1].add_done_callback(lambda _: completed.set())
+
+        # Побеждает первый ответ, после которого повторять не нужно; если такого нет — ответ основного запроса
+        winner = None
+        while winner is None:
+            completed.wait()
+            completed.clear()
+            done = [future for future in futures if future.done()]
+            winner = next((future for future in done if not call.is_retryable(*call.resolve(future))), None)
+            if winner is None and len(done) == len(futures):
+                winner = futures[0]
+
+        for future in futures:
+            if future is not winner and not future.cancel():
+                future.add_done_callback(lambda loser: self.discard(call, loser))
+
+        result, error = call.resolve(winner)
+        return result, error, len(futures) > 1, winner is not futures[0]
+
+    def discard(self, call: PolicyCall, future: Any) -> None:
+        result, error = call.resolve(future)
+        if error is None and result is not None:
+            call.discard(result)
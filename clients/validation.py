@@ -0,0 +1,169 @@
+import threading
+from typing import Any
+
+from google.protobuf.message import Message
+from google.protobuf.unknown_fields import UnknownFieldSet
+from pydantic import BaseModel, ValidationError
+
+from clients.instrumentation import Transport
+
+
+class OperationContractReport(BaseModel):
+    """
+    Итоги проверки контракта одной операции.
+    """
+    name: str
+    checked: int
+    failed: int
+    errors: list[str]
+
+
+def find_unknown_fields(message: Message, path: str = "") -> list[str]:
+    """
+    Ищет в protobuf-сообщении поля, которых нет в дескрипторе клиента (рекурсивно).
+
+    Неизвестные поля означают, что сервер отвечает по более новой версии контракта.
+
+    :param message: Разобранное protobuf-сообщение.
+    :param path: Путь к сообщению от корня ответа.
+    :return: Описания найденных расхождений.
+    """
+    path = path or message.DESCRIPTOR.name
+    errors = []
+
+    unknown = UnknownFieldSet(message)
+    if len(unknown):
+        numbers = sorted({field.field_number for field in unknown})
+        errors.append(f"{path}: unknown fields {numbers}")
+
+    for field, value in message.ListFields():
+        if field.message_type is None or field.message_type.GetOptions().map_entry:
+            continue
+
+        if isinstance(value, Message):
+            errors.extend(find_unknown_fields(value, f"{path}.{field.name}"))
+        else:
+            for index, item in enumerate(value):
+                errors.extend(find_unknown_fields(item, f"{path}.{field.name}.{index}"))
+
+    return errors
+
+
+class ContractValidator:
+    """
+    Выборочная проверка ответов шлюза на соответствие контрактам.
+
+    Проверяется каждый sample_rate-й ответ каждой операции (первый — всегда):
+    HTTP — полной валидацией pydantic-схемы ответа, gRPC — поиском полей,
+    неизвестных дескриптору protobuf-сообщения. Ошибки не выбрасываются,
+    а накапливаются и попадают в report().
+
+    Для gRPC sample_rate нужно задать до создания каналов: перехватчик проверки подключается
+    к каналу, только если выборка включена.
+
+    :param sample_rate: Проверять 1 из sample_rate ответов. 0 — проверка выключена.
+    :param max_errors: Сколько различных текстов ошибок хранить на операцию.
+    """
+
+    def __init__(self, sample_rate: int = 0, max_errors: int = 10):
+        self.sample_rate = sample_rate
+        self.max_errors = max_errors
+        self.counters: dict[str, int] = {}
+        self.checked: dict[str, int] = {}
+        self.failures: dict[str, int] = {}
+        self.errors: dict[str, list[str]] = {}
+        self.lock = threading.Lock()
+
+    def sample(self, name: str) -> bool:
+        """
+        :param name: Имя операции ("<transport>:<operation>").
+        :return: True, если этот ответ нужно проверить.
+        """
+        if not self.sample_rate:
+            return False
+
+        # Счётчик без блокировки: при гонке потоков выборка может сместиться на один ответ
+        count = self.counters.get(name, 0)
+        self.counters[name] = count + 1
+        if count % self.sample_rate:
+            return False
+
+        self.checked[name] = self.checked.get(name, 0) + 1
+        return True
+
+    def validate_json(self, operation: str, schema: type[BaseModel], content: bytes) -> None:
+        """
+        Проверяет тело HTTP-ответа pydantic-схемой, если ответ попал в выборку.
+
+        :param operation: Имя операции.
+        :param schema: Pydantic-схема ответа.
+        :param content: Тело ответа.
+        """
+        name = f"{Transport.HTTP}:{operation}"
+        if not self.sample(name):
+            return
+
+        try:
+            schema.model_validate_json(content)
+        except ValidationError as error:
+            self.fail(name, [
+                f"{'.'.join(map(str, item['loc']))}: {item['msg']}" for item in error.errors(include_url=False)
+            ])
+
+    def validate_message(self, operation: str, message: Any) -> None:
+        """
+        Проверяет gRPC-ответ по дескриптору сообщения, если ответ попал в выборку.
+
+        :param operation: Имя операции.
+        :param message: Разобранное protobuf-сообщение.
+        """
+        name = f"{Transport.GRPC}:{operation}"
+        if not self.sample(name):
+            return
+
+        errors = find_unknown_fields(message)
+        if errors:
+            self.fail(name, errors)
+
+    def fail(self, name: str, errors: list[str]) -> None:
+        """
+        Учитывает непрошедшую проверку.
+
+        :param name: Имя операции.
+        :param errors: Описания расхождений.
+        """
+        with self.lock:
+            self.failures[name] = self.failures.get(name, 0) + 1
+            stored = self.errors.setdefault(name, [])
+            for error in errors:
+                if len(stored) >= self.max_errors:
+                    break
+                if error not in stored:
+                    stored.append(error)
+
+    def report(self) -> list[OperationContractReport]:
+        """
+        :return: Итоги проверки по каждой операции, отсортированные по имени.
+        """
+        return [
+            OperationContractReport(
+                name=name,
+                checked=count,
+                failed=self.failures.get(name, 0),
+                errors=list(self.errors.get(name, []))
+            )
+            for name, count in sorted(self.checked.items())
+        ]
+
+    def reset(self) -> None:
+        """
+        Удаляет все накопленные данные.
+        """
+        with self.lock:
+            self.counters.clear()
+            self.checked.clear()
+            self.failures.clear()
+            self.errors.clear()
+
+
+contract_validator = ContractValidator()
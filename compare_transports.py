@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from benchmarks.transports import format_transport_comparison, TransportComparison
+from load.schema import ArrivalDistribution, ArrivalProfileSchema
+from scenarios.flows import MAKE_PURCHASE_OPERATION_SCENARIO
+
+REPORT_PATH = Path("compare_transports.json")
+
+# Одна и та же смесь операций по HTTP и gRPC: 200 итераций в секунду для задержек и процессорного времени,
+# затем 5000 в секунду — заведомо больше, чем выдержит один процесс, чтобы найти предельную пропускную
+# способность. Шлюз (или fake_gateway_server.py) должен быть запущен отдельно на localhost:8003 и :9003.
+comparison = TransportComparison(
+    MAKE_PURCHASE_OPERATION_SCENARIO,
+    profile=ArrivalProfileSchema(rate=200, duration=30, distribution=ArrivalDistribution.POISSON, seed=0),
+    saturation=ArrivalProfileSchema(rate=5000, duration=30)
+).run()
+REPORT_PATH.write_text(comparison.model_dump_json(indent=2))
+
+print(format_transport_comparison(comparison))
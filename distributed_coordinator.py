@@ -0,0 +1,20 @@
+from redis import Redis
+
+from clients.instrumentation import Transport
+from load.schema import ArrivalProfileSchema
+from scenarios.distributed import DistributedCoordinator
+from scenarios.flows import MAKE_PURCHASE_OPERATION_SCENARIO
+
+coordinator = DistributedCoordinator(Redis(host="redis", port=6379))
+
+# Суммарные 2000 итераций в секунду делятся между 8 воркерами (distributed_worker.py) на разных машинах
+result = coordinator.run(
+    MAKE_PURCHASE_OPERATION_SCENARIO,
+    transport=Transport.GRPC,
+    profile=ArrivalProfileSchema(rate=2000, duration=60),
+    workers=8
+)
+print(result.report)
+
+for report in result.snapshot.report():
+    print(report)
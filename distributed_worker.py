@@ -0,0 +1,7 @@
+from redis import Redis
+
+from scenarios.distributed import DistributedWorker
+
+# Воркер забирает задания координатора из Redis; на машине генератора запускается по процессу на ядро
+worker = DistributedWorker(Redis(host="redis", port=6379))
+worker.serve()
@@ -0,0 +1,10 @@
+from stubs.gateway.faults import load_fault_profile
+from stubs.gateway.schema import GatewayStubSettingsSchema
+from stubs.gateway.server import serve_gateway_stub
+
+# Заглушка http-gateway (:8003) и grpc-gateway (:9003) для замеров накладных расходов клиентов
+# без настоящего банковского стека: 4 процесса на общих портах, задержки и ошибки — из профиля сбоев
+serve_gateway_stub(GatewayStubSettingsSchema(
+    workers=4,
+    faults=load_fault_profile("fault_profile.example.json")
+))
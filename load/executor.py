@@ -0,0 +1,220 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator
+
+from load.schema import ArrivalDistribution, ArrivalProfileSchema, OpenModelReportSchema
+from tools.metrics.aggregator import LatencyAggregator
+
+
+def iter_arrivals(profile: ArrivalProfileSchema) -> Iterator[float]:
+    """
+    Генерирует запланированные моменты запуска запросов.
+
+    :param profile: Профиль поступления запросов.
+    :return: Смещения от начала прогона в секундах, по возрастанию.
+    """
+    generator = random.Random(profile.seed)
+    offset = 0.0
+    while offset < profile.duration:
+        yield offset
+
+        rate = profile.rate_at(offset)
+        if profile.distribution == ArrivalDistribution.POISSON:
+            offset += generator.expovariate(rate)
+        else:
+            offset += 1 / rate
+
+
+class _OpenModelState:
+    def __init__(self, name: str, aggregator: LatencyAggregator, late_threshold: float):
+        self.name = name
+        self.service_name = f"{name}.service"
+        self.aggregator = aggregator
+        self.late_threshold = late_threshold
+        self.report = OpenModelReportSchema(name=name)
+        self.lock = threading.Lock()
+
+    def on_dispatch(self, intended: float) -> None:
+        lateness = perf_counter() - intended
+        self.report.dispatched += 1
+        if lateness > self.late_threshold:
+            self.report.late += 1
+        if lateness > self.report.max_lateness:
+            self.report.max_lateness = lateness
+
+    def on_done(self, intended: float, sent: float, ok: bool) -> None:
+        end = perf_counter()
+        # Время ответа считается от запланированного старта: так задержка клиента
+        # не маскирует деградацию шлюза (coordinated omission)
+        self.aggregator.record(self.name, end - intended, ok)
+        self.aggregator.record(self.service_name, end - sent, ok)
+        with self.lock:
+            if ok:
+                self.report.completed += 1
+            else:
+                self.report.failed += 1
+
+
+class OpenModelExecutor:
+    """
+    Генератор нагрузки по открытой модели: запросы запускаются по расписанию,
+    а не после завершения предыдущих.
+
+    В агрегатор пишутся две гистограммы: name — от запланированного момента до ответа,
+    name.service — от фактической отправки до ответа. Если все max_in_flight слотов заняты
+    дольше max_lateness, запрос отбрасывается и учитывается в dropped.
+
+    :param name: Имя нагрузки в агрегаторе.
+    :param task: Функция, выполняющая один вызов (например, lambda: client.get_operation(operation_id)).
+    :param aggregator: Агрегатор задержек.
+    :param max_in_flight: Максимальное количество одновременных вызовов.
+    :param late_threshold: Опоздание отправки (в секундах), после которого запрос считается late.
+    :param max_lateness: Опоздание (в секундах), после которого запрос отбрасывается.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            task: Callable[[], Any],
+            aggregator: LatencyAggregator,
+            max_in_flight: int = 100,
+            late_threshold: float = 0.01,
+            max_lateness: float = 1.0
+    ):
+        self.name = name
+        self.task = task
+        self.aggregator = aggregator
+        self.max_in_flight = max_in_flight
+        self.late_threshold = late_threshold
+        self.max_lateness = max_lateness
+
+    def run(self, profile: ArrivalProfileSchema) -> OpenModelReportSchema:
+        """
+        Выполняет прогон и дожидается завершения всех отправленных вызовов.
+
+        :param profile: Профиль поступления запросов.
+        :return: Итоги прогона.
+        """
+        state = _OpenModelState(self.name, self.aggregator, self.late_threshold)
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+
+        def execute(intended: float) -> None:
+            sent = perf_counter()
+            try:
+                self.task()
+                ok = True
+            except Exception:
+                ok = False
+            finally:
+                slots.release()
+
+            state.on_done(intended, sent, ok)
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            started = perf_counter()
+            for offset in iter_arrivals(profile):
+                intended = started + offset
+                state.report.scheduled += 1
+
+                delay = intended - perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                if not slots.acquire(blocking=False):
+                    remaining = intended + self.max_lateness - perf_counter()
+                    if remaining <= 0 or not slots.acquire(timeout=remaining):
+                        state.report.dropped += 1
+                        continue
+
+                state.on_dispatch(intended)
+                executor.submit(execute, intended)
+
+        return state.report
+
+
+class AsyncOpenModelExecutor:
+    """
+    Асинхронный вариант OpenModelExecutor для клиентов на asyncio (Async*GatewayHTTPClient,
+    Async*GatewayGRPCClient): каждый вызов — задача в event loop, а не поток.
+
+    :param name: Имя нагрузки в агрегаторе.
+    :param task: Корутинная функция, выполняющая один вызов.
+    :param aggregator: Агрегатор задержек.
+    :param max_in_flight: Максимальное количество одновременных вызовов.
+    :param late_threshold: Опоздание отправки (в секундах), после которого запрос считается late.
+    :param max_lateness: Опоздание (в секундах), после которого запрос отбрасывается.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            task: Callable[[], Awaitable[Any]],
+            aggregator: LatencyAggregator,
+            max_in_flight: int = 10_000,
+            late_threshold: float = 0.01,
+            max_lateness: float = 1.0
+    ):
+        self.name = name
+        self.task = task
+        self.aggregator = aggregator
+        self.max_in_flight = max_in_flight
+        self.late_threshold = late_threshold
+        self.max_lateness = max_lateness
+
+    async def run(self, profile: ArrivalProfileSchema) -> OpenModelReportSchema:
+        """
+        Выполняет прогон и дожидается завершения всех отправленных вызовов.
+
+        :param profile: Профиль поступления запросов.
+        :return: Итоги прогона.
+        """
+        state = _OpenModelState(self.name, self.aggregator, self.late_threshold)
+        slots = asyncio.Semaphore(self.max_in_flight)
+        tasks: set[asyncio.Task] = set()
+
+        async def execute(intended: float) -> None:
+            sent = perf_counter()
+            try:
+                await self.task()
+                ok = True
+            except Exception:
+                ok = False
+            finally:
+                slots.release()
+
+            state.on_done(intended, sent, ok)
+
+        started = perf_counter()
+        for offset in iter_arrivals(profile):
+            intended = started + offset
+            state.report.scheduled += 1
+
+            delay = intended - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if slots.locked():
+                remaining = intended + self.max_lateness - perf_counter()
+                try:
+                    if remaining <= 0:
+                        raise TimeoutError
+                    await asyncio.wait_for(slots.acquire(), remaining)
+                except TimeoutError:
+                    state.report.dropped += 1
+                    continue
+            else:
+                await slots.acquire()
+
+            state.on_dispatch(intended)
+            task = asyncio.create_task(execute(intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        return state.report
@@ -0,0 +1,158 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+from functools import reduce
+from multiprocessing.synchronize import Barrier
+from typing import Callable
+
+from clients.policies import merge_policy_stats, policy_stats
+from load.schema import (
+    ArrivalProfileSchema,
+    MultiProcessReportSchema,
+    OpenModelReportSchema,
+    WorkerResultSchema,
+    WorkerSchema
+)
+from tools.fakers import fake
+from tools.metrics.aggregator import LatencyAggregator, LatencySnapshot
+
+# Вызывается в процессе воркера: создаёт клиентов и возвращает функцию, выполняющую прогон
+Workload = Callable[[WorkerSchema, LatencyAggregator], Callable[[ArrivalProfileSchema], OpenModelReportSchema]]
+
+
+def merge_worker_results(results: list[WorkerResultSchema], workers: int) -> MultiProcessReportSchema:
+    """
+    Складывает результаты воркеров одного прогона.
+
+    :param results: Результаты воркеров.
+    :param workers: Количество воркеров, участвовавших в прогоне.
+    :return: Суммарные итоги и гистограммы.
+    :raises RuntimeError: Если хотя бы один воркер завершился с ошибкой.
+    """
+    # Отмененные воркеры — следствие сбоя, а не причина, поэтому в сообщение попадает первая настоящая ошибка
+    failed = sorted((result for result in results if result.error is not None), key=lambda result: result.aborted)
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {workers} load workers failed:\n{failed[0].error}")
+
+    results = sorted(results, key=lambda result: result.worker_id)
+    return MultiProcessReportSchema(
+        workers=workers,
+        report=reduce(OpenModelReportSchema.merge, (result.report for result in results)),
+        snapshot=reduce(LatencySnapshot.merge, (result.snapshot for result in results)),
+        policy=reduce(merge_policy_stats, (result.policy for result in results))
+    )
+
+
+def _run_worker(
+        workload: Workload,
+        worker: WorkerSchema,
+        profile: ArrivalProfileSchema,
+        barrier: Barrier,
+        results: multiprocessing.Queue
+) -> None:
+    aggregator = LatencyAggregator()
+    try:
+        fake.seed(worker.seed, worker_id=worker.worker_id, run_id=worker.run_id)
+        run = workload(worker, aggregator)
+
+        # Прогон начинается одновременно во всех воркерах, после создания клиентов и соединений
+        barrier.wait()
+        result = WorkerResultSchema(
+            worker_id=worker.worker_id,
+            report=run(profile.split(worker.workers, worker.worker_id)),
+            snapshot=aggregator.snapshot(),
+            policy=policy_stats.snapshot()
+        )
+    except threading.BrokenBarrierError:
+        result = WorkerResultSchema(worker_id=worker.worker_id, error=traceback.format_exc(), aborted=True)
+    except Exception:
+        barrier.abort()
+        result = WorkerResultSchema(worker_id=worker.worker_id, error=traceback.format_exc())
+
+    results.put(result.model_dump_json())
+
+
+class MultiProcessRunner:
+    """
+    Запускает нагрузку в нескольких процессах, чтобы генератор не упирался в одно ядро и GIL.
+
+    Каждый воркер — отдельный процесс (fork) со своими клиентами шлюза, своим потоком
+    фейковых данных (fake.seed(seed, worker_id)) и своей долей частоты (profile.split()).
+    Гистограммы воркеров складываются в родительском процессе.
+
+    Клиенты должны создаваться внутри workload, а не в родительском процессе:
+    gRPC-каналы и соединения httpx не переживают fork.
+
+    :param workload: Функция, вызываемая в каждом воркере (например, scenarios.engine.ScenarioWorkload).
+    :param workers: Количество процессов. По умолчанию — количество ядер.
+    :param seed: Зерно прогона, общее для всех воркеров.
+    :param start_timeout: Время (в секундах) на подготовку воркеров до общего старта.
+    """
+
+    def __init__(
+            self,
+            workload: Workload,
+            workers: int | None = None,
+            seed: int = 0,
+            start_timeout: float = 60.0
+    ):
+        self.workload = workload
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.start_timeout = start_timeout
+
+    def run(self, profile: ArrivalProfileSchema) -> MultiProcessReportSchema:
+        """
+        Выполняет прогон во всех воркерах и дожидается их завершения.
+
+        :param profile: Общий профиль поступления запросов (частота — суммарная по всем воркерам).
+        :return: Суммарные итоги и гистограммы.
+        """
+        context = multiprocessing.get_context("fork")
+        barrier = context.Barrier(self.workers, timeout=self.start_timeout)
+        results = context.Queue()
+        run_id = format(time.time_ns(), "x")
+
+        processes = [
+            context.Process(
+                target=_run_worker,
+                args=(
+                    self.workload,
+                    WorkerSchema(worker_id=worker_id, workers=self.workers, seed=self.seed, run_id=run_id),
+                    profile,
+                    barrier,
+                    results
+                ),
+                name=f"load-worker-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(self.workers)
+        ]
+
+        collected: dict[int, WorkerResultSchema] = {}
+        try:
+            for process in processes:
+                process.start()
+
+            while len(collected) < self.workers:
+                try:
+                    result = WorkerResultSchema.model_validate_json(results.get(timeout=1))
+                except queue.Empty:
+                    crashed = [process.name for process in processes if process.exitcode not in (None, 0)]
+                    if crashed:
+                        raise RuntimeError(f"Load workers exited without result: {crashed}")
+                    continue
+
+                collected[result.worker_id] = result
+
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        return merge_worker_results(list(collected.values()), self.workers)
@@ -0,0 +1,126 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+from clients.policies import OperationPolicyStatsSchema
+from tools.metrics.aggregator import LatencySnapshot
+
+
+class ArrivalDistribution(StrEnum):
+    CONSTANT = "CONSTANT"
+    POISSON = "POISSON"
+
+
+class ArrivalProfileSchema(BaseModel):
+    """
+    Профиль поступления запросов для открытой модели нагрузки.
+
+    Если указан target_rate, частота линейно меняется от rate до target_rate за duration секунд.
+    """
+    rate: float = Field(gt=0)
+    target_rate: float | None = Field(default=None, gt=0)
+    duration: float = Field(gt=0)
+    distribution: ArrivalDistribution = ArrivalDistribution.CONSTANT
+    seed: int | None = None
+
+    def rate_at(self, offset: float) -> float:
+        """
+        :param offset: Время от начала прогона в секундах.
+        :return: Целевая частота (запросов в секунду) в этот момент.
+        """
+        if self.target_rate is None:
+            return self.rate
+
+        return self.rate + (self.target_rate - self.rate) * min(offset / self.duration, 1.0)
+
+    def split(self, workers: int, worker_id: int) -> "ArrivalProfileSchema":
+        """
+        Делит профиль между воркерами: каждый получает rate / workers.
+
+        Сумма пуассоновских потоков воркеров — снова пуассоновский поток с исходной частотой.
+        Зерно воркера — seed + worker_id, чтобы расписания воркеров не совпадали.
+
+        :param workers: Общее количество воркеров.
+        :param worker_id: Номер воркера (с нуля).
+        :return: Профиль воркера.
+        """
+        return self.model_copy(update={
+            "rate": self.rate / workers,
+            "target_rate": None if self.target_rate is None else self.target_rate / workers,
+            "seed": None if self.seed is None else self.seed + worker_id
+        })
+
+
+class OpenModelReportSchema(BaseModel):
+    """
+    Итоги прогона открытой модели.
+
+    late    — запросы, отправленные позже запланированного больше чем на late_threshold.
+    dropped — запросы, которые так и не были отправлены: клиент не успевал за графиком.
+    """
+    name: str
+    scheduled: int = 0
+    dispatched: int = 0
+    completed: int = 0
+    failed: int = 0
+    late: int = 0
+    dropped: int = 0
+    max_lateness: float = 0.0
+
+    def merge(self, other: "OpenModelReportSchema") -> "OpenModelReportSchema":
+        """
+        :param other: Итоги того же прогона в другом воркере.
+        :return: Новый отчет с суммой счетчиков.
+        """
+        return OpenModelReportSchema(
+            name=self.name,
+            scheduled=self.scheduled + other.scheduled,
+            dispatched=self.dispatched + other.dispatched,
+            completed=self.completed + other.completed,
+            failed=self.failed + other.failed,
+            late=self.late + other.late,
+            dropped=self.dropped + other.dropped,
+            max_lateness=max(self.max_lateness, other.max_lateness)
+        )
+
+
+class WorkerSchema(BaseModel):
+    """
+    Параметры воркера многопроцессного прогона.
+
+    seed и run_id общие для всех воркеров, worker_id уникален: вместе они задают
+    поток фейковых данных воркера (см. tools.fakers.Fake.seed).
+    """
+    worker_id: int
+    workers: int
+    seed: int
+    run_id: str
+
+
+class WorkerResultSchema(BaseModel):
+    """
+    Результат воркера, передаваемый в родительский процесс.
+
+    aborted — воркер не начал прогон из-за сбоя другого воркера.
+    policy  — счетчики повторов и дублирующих запросов клиентов воркера (clients.policies).
+    """
+    worker_id: int
+    report: OpenModelReportSchema | None = None
+    snapshot: LatencySnapshot = Field(default_factory=LatencySnapshot)
+    policy: dict[str, OperationPolicyStatsSchema] = Field(default_factory=dict)
+    error: str | None = None
+    aborted: bool = False
+
+
+class MultiProcessReportSchema(BaseModel):
+    """
+    Итоги многопроцессного прогона.
+
+    report   — сумма отчетов воркеров.
+    snapshot — сумма гистограмм воркеров: перцентили считаются по ней, а не усредняются.
+    policy   — сумма счетчиков повторов и дублирующих запросов воркеров.
+    """
+    workers: int
+    report: OpenModelReportSchema
+    snapshot: LatencySnapshot
+    policy: dict[str, OperationPolicyStatsSchema] = Field(default_factory=dict)
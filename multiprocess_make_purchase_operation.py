@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from clients.gateway import build_grpc_gateway_clients
+from clients.http.gateway.accounts.schema import AccountType
+from load.runner import MultiProcessRunner
+from load.schema import ArrivalProfileSchema
+from scenarios.engine import ScenarioWorkload
+from scenarios.flows import SEEDED_MAKE_PURCHASE_OPERATION_SCENARIO
+from seeds.dataset import MappedSeedsDataset
+
+SEEDS_PATH = Path("seeds.jsonl")
+
+# Пул создаётся скриптом seeds_make_purchase_operation.py; файл открывается до fork,
+# поэтому страницы mmap общие для всех воркеров
+dataset = MappedSeedsDataset(SEEDS_PATH)
+
+workload = ScenarioWorkload(
+    SEEDED_MAKE_PURCHASE_OPERATION_SCENARIO,
+    build_clients=build_grpc_gateway_clients,
+    contexts=lambda worker: dataset.sampler(AccountType.CREDIT_CARD, seed=worker.seed + worker.worker_id)
+)
+
+# Суммарные 1000 итераций в секунду делятся поровну между процессами (по одному на ядро)
+result = MultiProcessRunner(workload, seed=0).run(ArrivalProfileSchema(rate=1000, duration=10))
+print(result.report)
+
+for report in result.snapshot.report():
+    print(report)
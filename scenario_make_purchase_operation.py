@@ -0,0 +1,16 @@
+from clients.gateway import build_grpc_gateway_clients, build_http_gateway_clients
+from load.schema import ArrivalProfileSchema
+from scenarios.engine import ScenarioRunner
+from scenarios.flows import MAKE_PURCHASE_OPERATION_SCENARIO
+from tools.metrics.aggregator import LatencyAggregator
+
+aggregator = LatencyAggregator()
+
+# Один и тот же сценарий create_user -> open_credit_card_account -> make_purchase_operation -> get_operation_receipt
+# прогоняем через HTTP- и gRPC-шлюз с одинаковой частотой запуска
+for clients in (build_http_gateway_clients(), build_grpc_gateway_clients()):
+    runner = ScenarioRunner(MAKE_PURCHASE_OPERATION_SCENARIO, clients=clients, aggregator=aggregator)
+    print(runner.run(ArrivalProfileSchema(rate=10, duration=10)))
+
+for report in aggregator.snapshot().report():
+    print(report)
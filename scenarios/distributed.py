@@ -0,0 +1,360 @@
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from functools import partial
+from typing import Any, Callable
+
+from clients.gateway import build_gateway_clients, GatewayClients
+from clients.instrumentation import Transport
+from clients.policies import CallPolicyStats
+from load.runner import merge_worker_results
+from load.schema import ArrivalProfileSchema, MultiProcessReportSchema, WorkerResultSchema, WorkerSchema
+from scenarios.engine import ScenarioWorkload
+from scenarios.schema import DistributedStartSchema, DistributedTaskSchema, ScenarioSchema
+from tools.fakers import fake
+from tools.metrics.aggregator import LatencyAggregator
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+
+    return str(value).encode()
+
+
+class InMemoryRedis:
+    """
+    Заменитель redis.Redis в пределах одного процесса.
+
+    Поддерживает только команды, которые используют DistributedCoordinator и DistributedWorker
+    (списки и счетчики), и хранит значения как bytes, как redis-py без decode_responses.
+    Координатор и воркеры в этом случае работают в потоках одного процесса.
+    """
+
+    def __init__(self):
+        self.values: dict[str, Any] = {}
+        self.condition = threading.Condition()
+
+    def _list(self, key: str) -> deque:
+        values = self.values.get(key)
+        if values is None:
+            values = self.values[key] = deque()
+
+        return values
+
+    def rpush(self, key: str, *values: Any) -> int:
+        with self.condition:
+            items = self._list(key)
+            items.extend(_encode(value) for value in values)
+            self.condition.notify_all()
+            return len(items)
+
+    def blpop(self, keys: str | list[str], timeout: float = 0) -> tuple[bytes, bytes] | None:
+        keys = [keys] if isinstance(keys, str) else keys
+        deadline = None if timeout == 0 else time.monotonic() + timeout
+        with self.condition:
+            while True:
+                for key in keys:
+                    items = self.values.get(key)
+                    if items:
+                        return key.encode(), items.popleft()
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+
+                self.condition.wait(remaining)
+
+    def lrem(self, key: str, count: int, value: Any) -> int:
+        with self.condition:
+            items = self.values.get(key)
+            if not items:
+                return 0
+
+            value = _encode(value)
+            removed = 0
+            for item in list(items):
+                if item == value and (count == 0 or removed < abs(count)):
+                    items.remove(item)
+                    removed += 1
+
+            return removed
+
+    def llen(self, key: str) -> int:
+        with self.condition:
+            return len(self.values.get(key) or ())
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        with self.condition:
+            value = int(self.values.get(key, b"0")) + amount
+            self.values[key] = _encode(value)
+            return value
+
+    def get(self, key: str) -> bytes | None:
+        with self.condition:
+            return self.values.get(key)
+
+    def delete(self, *keys: str) -> int:
+        with self.condition:
+            return sum(self.values.pop(key, None) is not None for key in keys)
+
+
+class _RunKeys:
+    def __init__(self, namespace: str, run_id: str):
+        self.ready = f"{namespace}:{run_id}:ready"
+        self.start = f"{namespace}:{run_id}:start"
+        self.results = f"{namespace}:{run_id}:results"
+
+
+class DistributedCoordinator:
+    """
+    Координатор распределённого прогона: воркеры на разных машинах получают задания через Redis.
+
+    Протокол (все ключи с префиксом namespace):
+    1. Координатор кладёт задания воркеров (DistributedTaskSchema) в список "<namespace>:tasks".
+    2. Воркер забирает задание, создаёт клиентов и увеличивает счетчик "<run_id>:ready".
+    3. Когда готовы все воркеры, координатор рассылает через список "<run_id>:start" общий момент старта.
+       Если кто-то из воркеров упал при подготовке или не успел за ready_timeout — рассылает отмену.
+    4. Воркеры выполняют свою долю профиля и кладут результаты со снимками гистограмм в "<run_id>:results".
+
+    Момент старта задаётся по часам координатора, поэтому часы машин должны быть синхронизированы (NTP).
+
+    :param redis: Клиент redis.Redis (или InMemoryRedis).
+    :param namespace: Префикс ключей.
+    :param ready_timeout: Время (в секундах) на подготовку всех воркеров.
+    :param result_timeout: Время (в секундах) сверх длительности прогона на получение результатов.
+    :param start_delay: Задержка старта после готовности (в секундах), чтобы сигнал успел дойти до всех воркеров.
+    """
+
+    def __init__(
+            self,
+            redis: Any,
+            namespace: str = "load",
+            ready_timeout: float = 60.0,
+            result_timeout: float = 60.0,
+            start_delay: float = 1.0
+    ):
+        self.redis = redis
+        self.namespace = namespace
+        self.tasks_key = f"{namespace}:tasks"
+        self.ready_timeout = ready_timeout
+        self.result_timeout = result_timeout
+        self.start_delay = start_delay
+
+    def wait_ready(self, keys: _RunKeys, workers: int) -> bool:
+        """
+        :param keys: Ключи прогона.
+        :param workers: Количество воркеров.
+        :return: True, если все воркеры готовы; False, если кто-то упал или истекло время ожидания.
+        """
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            if self.redis.llen(keys.results):
+                return False
+            if int(self.redis.get(keys.ready) or 0) >= workers:
+                return True
+
+            time.sleep(0.05)
+
+        return False
+
+    def collect(self, keys: _RunKeys, expected: int, timeout: float) -> list[WorkerResultSchema]:
+        """
+        :param keys: Ключи прогона.
+        :param expected: Количество ожидаемых результатов.
+        :param timeout: Время ожидания всех результатов в секундах.
+        :return: Полученные результаты воркеров.
+        """
+        results = []
+        deadline = time.monotonic() + timeout
+        while len(results) < expected:
+            remaining = deadline - time.monotonic()
+            item = self.redis.blpop(keys.results, timeout=remaining) if remaining > 0 else None
+            if item is None:
+                break
+
+            results.append(WorkerResultSchema.model_validate_json(item[1]))
+
+        return results
+
+    def run(
+            self,
+            scenario: ScenarioSchema,
+            transport: Transport,
+            profile: ArrivalProfileSchema,
+            workers: int,
+            seed: int = 0,
+            max_in_flight: int = 100
+    ) -> MultiProcessReportSchema:
+        """
+        Выполняет распределённый прогон и дожидается результатов всех воркеров.
+
+        :param scenario: Описание сценария.
+        :param transport: Транспорт шлюза.
+        :param profile: Общий профиль поступления итераций (частота — суммарная по всем воркерам).
+        :param workers: Количество воркеров.
+        :param seed: Зерно прогона, общее для всех воркеров.
+        :param max_in_flight: Максимальное количество одновременно выполняющихся итераций в одном воркере.
+        :return: Суммарные итоги и гистограммы.
+        :raises RuntimeError: Если воркер завершился с ошибкой или не прислал результат.
+        """
+        run_id = uuid.uuid4().hex
+        keys = _RunKeys(self.namespace, run_id)
+        tasks = [
+            DistributedTaskSchema(
+                run_id=run_id,
+                worker=WorkerSchema(worker_id=worker_id, workers=workers, seed=seed, run_id=run_id),
+                scenario=scenario,
+                transport=transport,
+                profile=profile,
+                max_in_flight=max_in_flight,
+                # Воркер ждёт старта дольше, чем координатор ждёт готовности, и всегда получает старт или отмену
+                start_timeout=self.ready_timeout + self.start_delay + 10
+            ).model_dump_json()
+            for worker_id in range(workers)
+        ]
+
+        self.redis.rpush(self.tasks_key, *tasks)
+        try:
+            if self.wait_ready(keys, workers):
+                start = DistributedStartSchema(start_at=time.time() + self.start_delay)
+                expected = workers
+                timeout = self.start_delay + profile.duration + self.result_timeout
+            else:
+                # Незабранные задания удаляются, чтобы их не взяли воркеры, освободившиеся позже
+                start = DistributedStartSchema()
+                expected = workers - sum(self.redis.lrem(self.tasks_key, 1, task) for task in tasks)
+                timeout = self.result_timeout
+
+            self.redis.rpush(keys.start, *[start.model_dump_json()] * workers)
+            results = self.collect(keys, expected, timeout)
+        finally:
+            self.redis.delete(keys.ready, keys.start, keys.results)
+
+        if start.start_at is None and all(result.aborted for result in results):
+            raise RuntimeError(
+                f"Load workers were not ready in {self.ready_timeout}s: {expected} of {workers} took a task"
+            )
+
+        if len(results) < expected and not any(result.error for result in results):
+            missing = sorted(set(range(workers)) - {result.worker_id for result in results})
+            raise RuntimeError(f"Load workers {missing} did not report results")
+
+        return merge_worker_results(results, workers)
+
+
+_fake_lock = threading.Lock()
+
+
+def seed_fake(worker: WorkerSchema) -> None:
+    """
+    Делает поток фейковых данных процесса детерминированным для воркера.
+
+    Клиенты шлюза берут данные из общего для процесса tools.fakers.fake, поэтому отдельный поток
+    данных есть только у воркера в своём процессе. Если воркеры одного прогона работают в потоках
+    одного процесса (InMemoryRedis), fake инициализируется один раз на прогон первым из них:
+    повторный seed() сбросил бы счетчик уникальных значений посреди работы остальных.
+
+    :param worker: Параметры воркера.
+    """
+    with _fake_lock:
+        if fake.run_id != worker.run_id:
+            fake.seed(worker.seed, worker_id=worker.worker_id, run_id=worker.run_id)
+
+
+class DistributedWorker:
+    """
+    Воркер распределённого прогона: забирает задания DistributedCoordinator из Redis и выполняет их.
+
+    На одной машине можно запустить несколько воркеров (по процессу на ядро).
+
+    :param redis: Клиент redis.Redis (или InMemoryRedis).
+    :param build_clients: Фабрика клиентов шлюза по транспорту и счетчикам политик задания
+                          (CallPolicyStats нужно передать в клиентов с политикой вызовов).
+    :param contexts: Фабрика источника начального контекста для воркера (см. ScenarioWorkload).
+    :param namespace: Префикс ключей, общий с координатором.
+    :param poll_timeout: Время ожидания нового задания (в секундах) между проверками stop().
+    """
+
+    def __init__(
+            self,
+            redis: Any,
+            build_clients: Callable[[Transport, CallPolicyStats], GatewayClients] = build_gateway_clients,
+            contexts: Callable[[WorkerSchema], Callable[[], dict[str, Any]]] | None = None,
+            namespace: str = "load",
+            poll_timeout: float = 1.0
+    ):
+        self.redis = redis
+        self.build_clients = build_clients
+        self.contexts = contexts
+        self.namespace = namespace
+        self.tasks_key = f"{namespace}:tasks"
+        self.poll_timeout = poll_timeout
+        self.stopped = threading.Event()
+
+    def run_task(self, task: DistributedTaskSchema) -> WorkerResultSchema:
+        """
+        Выполняет одно задание и отправляет результат координатору.
+
+        :param task: Задание воркера.
+        :return: Результат воркера.
+        """
+        keys = _RunKeys(self.namespace, task.run_id)
+        worker = task.worker
+        aggregator = LatencyAggregator()
+        # Свои счетчики у каждого задания: воркеры с InMemoryRedis работают в потоках одного процесса
+        stats = CallPolicyStats()
+        try:
+            seed_fake(worker)
+            workload = ScenarioWorkload(
+                task.scenario,
+                build_clients=partial(self.build_clients, task.transport, stats=stats),
+                max_in_flight=task.max_in_flight,
+                contexts=self.contexts
+            )
+            run = workload(worker, aggregator)
+
+            self.redis.incr(keys.ready)
+            item = self.redis.blpop(keys.start, timeout=task.start_timeout)
+            start = DistributedStartSchema() if item is None else DistributedStartSchema.model_validate_json(item[1])
+            if start.start_at is None:
+                result = WorkerResultSchema(worker_id=worker.worker_id, error="Run was cancelled", aborted=True)
+            else:
+                delay = start.start_at - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+
+                result = WorkerResultSchema(
+                    worker_id=worker.worker_id,
+                    report=run(task.profile.split(worker.workers, worker.worker_id)),
+                    snapshot=aggregator.snapshot(),
+                    policy=stats.snapshot()
+                )
+        except Exception:
+            result = WorkerResultSchema(worker_id=worker.worker_id, error=traceback.format_exc())
+
+        self.redis.rpush(keys.results, result.model_dump_json())
+        return result
+
+    def serve(self, max_tasks: int | None = None) -> None:
+        """
+        Забирает и выполняет задания, пока не будет вызван stop() или не выполнено max_tasks заданий.
+
+        :param max_tasks: Максимальное количество заданий. None — без ограничения.
+        """
+        completed = 0
+        while not self.stopped.is_set() and (max_tasks is None or completed < max_tasks):
+            item = self.redis.blpop(self.tasks_key, timeout=self.poll_timeout)
+            if item is None:
+                continue
+
+            self.run_task(DistributedTaskSchema.model_validate_json(item[1]))
+            completed += 1
+
+    def stop(self) -> None:
+        """
+        Останавливает serve() после текущего задания.
+        """
+        self.stopped.set()
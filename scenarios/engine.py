@@ -0,0 +1,149 @@
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable
+
+from clients.gateway import GatewayClients
+from load.executor import OpenModelExecutor
+from load.schema import ArrivalProfileSchema, OpenModelReportSchema, WorkerSchema
+from scenarios.schema import ScenarioSchema
+from tools.metrics.aggregator import LatencyAggregator
+
+
+def resolve_path(value: Any, path: str) -> Any:
+    """
+    Достаёт поле из ответа по пути вида "account.cards.0.id".
+
+    Работает одинаково для pydantic-моделей HTTP-клиентов, protobuf-сообщений gRPC-клиентов
+    и dict (HTTPDecodeMode.RAW).
+
+    :param value: Ответ клиента.
+    :param path: Путь к полю через точку, числа — индексы списков.
+    :return: Значение поля.
+    """
+    for part in path.split("."):
+        if part.isdigit():
+            value = value[int(part)]
+        elif isinstance(value, dict):
+            value = value[part]
+        else:
+            value = getattr(value, part)
+
+    return value
+
+
+class ScenarioRunner:
+    """
+    Выполняет сценарий поверх набора клиентов шлюза и замеряет время каждого шага.
+
+    Шаги записываются в агрегатор как "<transport>:<scenario>.<step>", а при запуске через run()
+    весь сценарий — как "<transport>:<scenario>" (от запланированного старта итерации),
+    поэтому один и тот же сценарий по HTTP и gRPC даёт сопоставимые гистограммы.
+
+    :param scenario: Описание сценария.
+    :param clients: Клиенты шлюза (HTTP или gRPC).
+    :param aggregator: Агрегатор задержек.
+    """
+
+    def __init__(self, scenario: ScenarioSchema, clients: GatewayClients, aggregator: LatencyAggregator):
+        self.scenario = scenario
+        self.clients = clients
+        self.aggregator = aggregator
+        self.prefix = f"{clients.transport}:{scenario.name}"
+
+        # Методы клиентов и пути ответов разрешаются один раз, а не на каждой итерации
+        self.steps = [
+            (
+                f"{self.prefix}.{step.name}",
+                getattr(clients.get(step.client), step.method),
+                step.inputs,
+                step.outputs
+            )
+            for step in scenario.steps
+        ]
+
+    def run_once(self, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Выполняет все шаги сценария один раз.
+
+        :param context: Начальный контекст (значения для scenario.inputs).
+        :return: Контекст со всеми значениями, сохранёнными шагами.
+        """
+        context = dict(context) if context else {}
+        for name, method, inputs, outputs in self.steps:
+            kwargs = {argument: context[key] for argument, key in inputs.items()}
+
+            start = perf_counter()
+            try:
+                response = method(**kwargs)
+            except Exception:
+                self.aggregator.record(name, perf_counter() - start, ok=False)
+                raise
+
+            self.aggregator.record(name, perf_counter() - start)
+            for key, path in outputs.items():
+                context[key] = resolve_path(response, path)
+
+        return context
+
+    def run(
+            self,
+            profile: ArrivalProfileSchema,
+            max_in_flight: int = 100,
+            contexts: Callable[[], dict[str, Any]] | None = None
+    ) -> OpenModelReportSchema:
+        """
+        Запускает итерации сценария по открытой модели с заданной частотой поступления.
+
+        :param profile: Профиль поступления итераций (частота, длительность, распределение).
+        :param max_in_flight: Максимальное количество одновременно выполняющихся итераций.
+        :param contexts: Источник начального контекста каждой итерации (например, SeedsDataset.sampler()).
+        :return: Итоги прогона (отправлено, опоздало, отброшено).
+        """
+        task = self.run_once if contexts is None else lambda: self.run_once(contexts())
+        executor = OpenModelExecutor(
+            name=self.prefix,
+            task=task,
+            aggregator=self.aggregator,
+            max_in_flight=max_in_flight
+        )
+        return executor.run(profile)
+
+
+class ScenarioWorkload:
+    """
+    Нагрузка для load.runner.MultiProcessRunner: прогон сценария через ScenarioRunner в каждом воркере.
+
+    Клиенты и источник контекстов создаются уже в процессе воркера.
+
+    :param scenario: Описание сценария.
+    :param build_clients: Фабрика клиентов шлюза (например, build_grpc_gateway_clients).
+    :param max_in_flight: Максимальное количество одновременно выполняющихся итераций в одном воркере.
+    :param contexts: Фабрика источника начального контекста для воркера,
+        например lambda worker: dataset.sampler(AccountType.CREDIT_CARD, seed=worker.seed + worker.worker_id).
+    """
+
+    def __init__(
+            self,
+            scenario: ScenarioSchema,
+            build_clients: Callable[[], GatewayClients],
+            max_in_flight: int = 100,
+            contexts: Callable[[WorkerSchema], Callable[[], dict[str, Any]]] | None = None
+    ):
+        self.scenario = scenario
+        self.build_clients = build_clients
+        self.max_in_flight = max_in_flight
+        self.contexts = contexts
+
+    def __call__(
+            self,
+            worker: WorkerSchema,
+            aggregator: LatencyAggregator
+    ) -> Callable[[ArrivalProfileSchema], OpenModelReportSchema]:
+        """
+        :param worker: Параметры воркера.
+        :param aggregator: Агрегатор задержек воркера.
+        :return: Функция, выполняющая прогон с профилем воркера.
+        """
+        runner = ScenarioRunner(self.scenario, clients=self.build_clients(), aggregator=aggregator)
+        contexts = None if self.contexts is None else self.contexts(worker)
+        return partial(runner.run, max_in_flight=self.max_in_flight, contexts=contexts)
@@ -0,0 +1,157 @@
+from scenarios.schema import ScenarioSchema, ScenarioStepSchema
+
+CREATE_USER_STEP = ScenarioStepSchema(
+    name="create_user",
+    client="users",
+    method="create_user",
+    outputs={"user_id": "user.id"}
+)
+
+# create_user -> open_credit_card_account -> make_purchase_operation -> get_operation_receipt
+MAKE_PURCHASE_OPERATION_SCENARIO = ScenarioSchema(
+    name="make_purchase_operation",
+    steps=[
+        CREATE_USER_STEP,
+        ScenarioStepSchema(
+            name="open_credit_card_account",
+            client="accounts",
+            method="open_credit_card_account",
+            inputs={"user_id": "user_id"},
+            outputs={"account_id": "account.id", "card_id": "account.cards.0.id"}
+        ),
+        ScenarioStepSchema(
+            name="make_purchase_operation",
+            client="operations",
+            method="make_purchase_operation",
+            inputs={"card_id": "card_id", "account_id": "account_id"},
+            outputs={"operation_id": "operation.id"}
+        ),
+        ScenarioStepSchema(
+            name="get_operation_receipt",
+            client="operations",
+            method="get_operation_receipt",
+            inputs={"operation_id": "operation_id"}
+        ),
+    ]
+)
+
+# create_user -> open_debit_card_account -> make_top_up_operation
+MAKE_TOP_UP_OPERATION_SCENARIO = ScenarioSchema(
+    name="make_top_up_operation",
+    steps=[
+        CREATE_USER_STEP,
+        ScenarioStepSchema(
+            name="open_debit_card_account",
+            client="accounts",
+            method="open_debit_card_account",
+            inputs={"user_id": "user_id"},
+            outputs={"account_id": "account.id", "card_id": "account.cards.0.id"}
+        ),
+        ScenarioStepSchema(
+            name="make_top_up_operation",
+            client="operations",
+            method="make_top_up_operation",
+            inputs={"card_id": "card_id", "account_id": "account_id"}
+        ),
+    ]
+)
+
+# create_user -> open_debit_card_account -> issue_physical_card
+ISSUE_PHYSICAL_CARD_SCENARIO = ScenarioSchema(
+    name="issue_physical_card",
+    steps=[
+        CREATE_USER_STEP,
+        ScenarioStepSchema(
+            name="open_debit_card_account",
+            client="accounts",
+            method="open_debit_card_account",
+            inputs={"user_id": "user_id"},
+            outputs={"account_id": "account.id"}
+        ),
+        ScenarioStepSchema(
+            name="issue_physical_card",
+            client="cards",
+            method="issue_physical_card",
+            inputs={"user_id": "user_id", "account_id": "account_id"}
+        ),
+    ]
+)
+
+# create_user -> open_credit_card_account -> get_tariff_document -> get_contract_document
+GET_DOCUMENTS_SCENARIO = ScenarioSchema(
+    name="get_documents",
+    steps=[
+        CREATE_USER_STEP,
+        ScenarioStepSchema(
+            name="open_credit_card_account",
+            client="accounts",
+            method="open_credit_card_account",
+            inputs={"user_id": "user_id"},
+            outputs={"account_id": "account.id"}
+        ),
+        ScenarioStepSchema(
+            name="get_tariff_document",
+            client="documents",
+            method="get_tariff_document",
+            inputs={"account_id": "account_id"}
+        ),
+        ScenarioStepSchema(
+            name="get_contract_document",
+            client="documents",
+            method="get_contract_document",
+            inputs={"account_id": "account_id"}
+        ),
+    ]
+)
+
+# Сценарии поверх пула сущностей (seeds): user_id, account_id и card_id приходят из SeedsDataset.sampler(),
+# поэтому нагрузка идёт только на целевые методы
+
+# make_purchase_operation -> get_operation_receipt
+SEEDED_MAKE_PURCHASE_OPERATION_SCENARIO = ScenarioSchema(
+    name="seeded_make_purchase_operation",
+    inputs=["user_id", "account_id", "card_id"],
+    steps=[
+        ScenarioStepSchema(
+            name="make_purchase_operation",
+            client="operations",
+            method="make_purchase_operation",
+            inputs={"card_id": "card_id", "account_id": "account_id"},
+            outputs={"operation_id": "operation.id"}
+        ),
+        ScenarioStepSchema(
+            name="get_operation_receipt",
+            client="operations",
+            method="get_operation_receipt",
+            inputs={"operation_id": "operation_id"}
+        ),
+    ]
+)
+
+# make_top_up_operation
+SEEDED_MAKE_TOP_UP_OPERATION_SCENARIO = ScenarioSchema(
+    name="seeded_make_top_up_operation",
+    inputs=["user_id", "account_id", "card_id"],
+    steps=[
+        ScenarioStepSchema(
+            name="make_top_up_operation",
+            client="operations",
+            method="make_top_up_operation",
+            inputs={"card_id": "card_id", "account_id": "account_id"}
+        ),
+    ]
+)
+
+# get_operations
+SEEDED_GET_OPERATIONS_SCENARIO = ScenarioSchema(
+    name="seeded_get_operations",
+    inputs=["user_id", "account_id", "card_id"],
+    steps=[
+        ScenarioStepSchema(
+            name="get_operations",
+            client="operations",
+            method="get_operations",
+            inputs={"account_id": "account_id"}
+        ),
+    ]
+)
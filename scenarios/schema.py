@@ -0,0 +1,67 @@
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+from clients.instrumentation import Transport
+from load.schema import ArrivalProfileSchema, WorkerSchema
+
+
+class ScenarioStepSchema(BaseModel):
+    """
+    Описание одного шага сценария.
+
+    inputs  — аргументы метода клиента: имя аргумента -> ключ в контексте сценария.
+    outputs — что сохранить в контекст: ключ -> путь к полю ответа (например, "account.cards.0.id").
+    """
+    name: str
+    client: str
+    method: str
+    inputs: dict[str, str] = Field(default_factory=dict)
+    outputs: dict[str, str] = Field(default_factory=dict)
+
+
+class ScenarioSchema(BaseModel):
+    """
+    Описание бизнес-сценария как цепочки шагов с зависимостями по данным.
+
+    inputs — ключи контекста, которые передаются в сценарий снаружи (например, из пула сущностей).
+    """
+    name: str
+    inputs: list[str] = Field(default_factory=list)
+    steps: list[ScenarioStepSchema]
+
+    @model_validator(mode="after")
+    def check_dependencies(self) -> Self:
+        available = set(self.inputs)
+        for step in self.steps:
+            missing = set(step.inputs.values()) - available
+            if missing:
+                raise ValueError(f"Step '{step.name}' depends on {sorted(missing)} which no previous step produces")
+
+            available.update(step.outputs)
+
+        return self
+
+
+class DistributedTaskSchema(BaseModel):
+    """
+    Задание распределённого прогона для одного воркера (см. scenarios.distributed).
+
+    Сценарий передаётся целиком, поэтому воркеру не нужен общий с координатором код сценариев.
+    """
+    run_id: str
+    worker: WorkerSchema
+    scenario: ScenarioSchema
+    transport: Transport
+    profile: ArrivalProfileSchema
+    max_in_flight: int = 100
+    start_timeout: float = 60.0
+
+
+class DistributedStartSchema(BaseModel):
+    """
+    Сигнал старта распределённого прогона.
+
+    start_at — момент старта по часам координатора (time.time()), None — прогон отменён.
+    """
+    start_at: float | None = None
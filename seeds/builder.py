@@ -0,0 +1,87 @@
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from typing import Any
+
+from clients.gateway import build_gateway_clients
+from clients.http.gateway.accounts.schema import AccountType
+from clients.instrumentation import Transport
+from seeds.dataset import SeedsDataset
+from seeds.schema import SeedAccountSchema, SeedsPlanSchema
+
+
+class SeedsBuilder:
+    """
+    Параллельно создаёт пользователей и их счета по плану.
+
+    Клиенты пользователей и счетов передаются отдельно, поэтому их транспорт можно выбирать
+    независимо (например, UsersGatewayHTTPClient и AccountsGatewayGRPCClient): у HTTP- и gRPC-клиентов
+    одинаковые методы и структура ответов.
+
+    :param users: Клиент UsersGatewayService (HTTP или gRPC).
+    :param accounts: Клиент AccountsGatewayService (HTTP или gRPC).
+    :param max_workers: Количество пользователей, создаваемых одновременно.
+    """
+
+    def __init__(self, users: Any, accounts: Any, max_workers: int = 32):
+        self.users = users
+        self.accounts = accounts
+        self.max_workers = max_workers
+        self.failed = 0
+
+        # open_deposit_account, open_savings_account, open_debit_card_account, open_credit_card_account
+        self.open_account = {
+            account_type: getattr(accounts, f"open_{account_type.lower()}_account")
+            for account_type in AccountType
+        }
+
+    def build_user(self, plan: SeedsPlanSchema) -> list[SeedAccountSchema]:
+        """
+        Создаёт одного пользователя и открывает ему счета из плана.
+
+        :param plan: План наполнения.
+        :return: Созданные счета пользователя.
+        """
+        user_id = self.users.create_user().user.id
+
+        result = []
+        for account_type in plan.accounts:
+            account = self.open_account[account_type](user_id).account
+            result.append(SeedAccountSchema(
+                user_id=user_id,
+                account_id=account.id,
+                card_id=account.cards[0].id if account.cards else None,
+                type=account_type
+            ))
+
+        return result
+
+    def build(self, plan: SeedsPlanSchema) -> SeedsDataset:
+        """
+        Выполняет план наполнения.
+
+        Пользователи, на которых шлюз вернул ошибку, пропускаются и учитываются в self.failed.
+
+        :param plan: План наполнения.
+        :return: Пул созданных сущностей.
+        """
+        accounts: list[SeedAccountSchema] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.build_user, plan) for _ in range(plan.users)]
+            for future in as_completed(futures):
+                try:
+                    accounts.extend(future.result())
+                except Exception:
+                    self.failed += 1
+
+        return SeedsDataset(accounts)
+
+
+def build_seeds_builder(transport: Transport = Transport.GRPC, max_workers: int = 32) -> SeedsBuilder:
+    """
+    Фабрика для создания экземпляра SeedsBuilder.
+
+    :param transport: Транспорт шлюза, через который создаются сущности.
+    :param max_workers: Количество пользователей, создаваемых одновременно.
+    :return: Инициализированный SeedsBuilder.
+    """
+    clients = build_gateway_clients(transport)
+    return SeedsBuilder(users=clients.users, accounts=clients.accounts, max_workers=max_workers)
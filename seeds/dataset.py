@@ -0,0 +1,159 @@
+import json
+import random
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from clients.http.gateway.accounts.schema import AccountType
+from seeds.schema import SeedAccountSchema
+from tools.datasets import JSONLDataset
+
+
+def get_seed_context(row: list[str | None]) -> dict[str, Any]:
+    """
+    :param row: Компактная строка счета [user_id, account_id, card_id, type].
+    :return: Контекст сценария с ключами user_id, account_id, card_id.
+    """
+    return {"user_id": row[0], "account_id": row[1], "card_id": row[2]}
+
+
+class SeedsDataset:
+    """
+    Пул заранее созданных сущностей шлюза (пользователи, счета, карты).
+
+    Нагрузочные прогоны берут данные из пула, а не создают их на каждой итерации,
+    поэтому нагрузка приходится на целевые методы (make_*_operation, get_operations),
+    а не на create_user / open_*_account.
+
+    :param accounts: Созданные счета.
+    """
+
+    def __init__(self, accounts: list[SeedAccountSchema]):
+        self.accounts = accounts
+        self.by_type: dict[AccountType, list[SeedAccountSchema]] = {}
+        for account in accounts:
+            self.by_type.setdefault(account.type, []).append(account)
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def filter(self, account_type: AccountType) -> list[SeedAccountSchema]:
+        """
+        :param account_type: Тип счета.
+        :return: Счета указанного типа.
+        """
+        return self.by_type.get(account_type, [])
+
+    def sampler(self, account_type: AccountType, seed: int | None = None) -> Callable[[], dict[str, Any]]:
+        """
+        Создаёт функцию, возвращающую контекст случайного счета указанного типа.
+
+        Результат подходит для ScenarioRunner.run(contexts=...): ключи user_id, account_id, card_id.
+
+        :param account_type: Тип счета.
+        :param seed: Зерно генератора случайных чисел.
+        :return: Функция без аргументов, возвращающая контекст сценария.
+        """
+        accounts = self.filter(account_type)
+        if not accounts:
+            raise ValueError(f"Dataset has no accounts of type {account_type}")
+
+        contexts = [get_seed_context(account.to_row()) for account in accounts]
+        generator = random.Random(seed)
+        return lambda: generator.choice(contexts)
+
+    def dump(self, path: str | Path) -> None:
+        """
+        Сохраняет пул в файл JSON Lines: одна компактная строка [user_id, account_id, card_id, type] на счет.
+
+        Строки отсортированы по типу счета, чтобы MappedSeedsDataset находил счета нужного типа
+        бинарным поиском, без чтения файла целиком.
+
+        :param path: Путь к файлу.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            for account in sorted(self.accounts, key=lambda account: account.type):
+                file.write(json.dumps(account.to_row(), separators=(",", ":")))
+                file.write("\n")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SeedsDataset":
+        """
+        :param path: Путь к файлу, созданному dump().
+        :return: Загруженный пул.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls([SeedAccountSchema.from_row(json.loads(line)) for line in file if line.strip()])
+
+
+class _AccountTypeColumn:
+    def __init__(self, dataset: JSONLDataset):
+        self.dataset = dataset
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def __getitem__(self, index: int) -> str:
+        return self.dataset[index][3]
+
+
+class MappedSeedsDataset:
+    """
+    Пул сущностей, читаемый из файла SeedsDataset.dump() через mmap (см. tools.datasets.JSONLDataset).
+
+    В отличие от SeedsDataset.load(), не создаёт объекты на каждую строку: воркер открывает пул
+    за миллисекунды, а страницы файла общие для всех процессов после fork.
+
+    :param path: Путь к файлу, созданному SeedsDataset.dump().
+    """
+
+    def __init__(self, path: str | Path):
+        self.dataset = JSONLDataset(path)
+        self.ranges: dict[AccountType, range] = {}
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def filter(self, account_type: AccountType) -> range:
+        """
+        :param account_type: Тип счета.
+        :return: Диапазон номеров строк со счетами указанного типа.
+        """
+        rows = self.ranges.get(account_type)
+        if rows is None:
+            column = _AccountTypeColumn(self.dataset)
+            rows = self.ranges[account_type] = range(
+                bisect_left(column, account_type),
+                bisect_right(column, account_type)
+            )
+
+        return rows
+
+    def shard(self, account_type: AccountType, worker: int, workers: int) -> Iterator[SeedAccountSchema]:
+        """
+        :param account_type: Тип счета.
+        :param worker: Номер воркера (с нуля).
+        :param workers: Общее количество воркеров.
+        :return: Счета указанного типа, принадлежащие воркеру.
+        """
+        rows = self.filter(account_type)
+        for row in self.dataset.shard(worker, workers, rows.start, rows.stop):
+            yield SeedAccountSchema.from_row(row)
+
+    def sampler(self, account_type: AccountType, seed: int | None = None) -> Callable[[], dict[str, Any]]:
+        """
+        Аналог SeedsDataset.sampler(): возвращает контекст случайного счета указанного типа.
+
+        :param account_type: Тип счета.
+        :param seed: Зерно генератора случайных чисел.
+        :return: Функция без аргументов, возвращающая контекст сценария.
+        """
+        rows = self.filter(account_type)
+        if not rows:
+            raise ValueError(f"Dataset has no accounts of type {account_type}")
+
+        sample = self.dataset.sampler(seed, rows.start, rows.stop)
+        return lambda: get_seed_context(sample())
+
+    def close(self) -> None:
+        self.dataset.close()
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+
+from clients.http.gateway.accounts.schema import AccountType
+
+
+class SeedsPlanSchema(BaseModel):
+    """
+    План наполнения шлюза тестовыми данными.
+
+    Для каждого из users пользователей открываются счета всех типов из accounts.
+    """
+    users: int = Field(gt=0)
+    accounts: list[AccountType] = Field(
+        default_factory=lambda: [AccountType.DEBIT_CARD, AccountType.CREDIT_CARD]
+    )
+
+
+class SeedAccountSchema(BaseModel):
+    """
+    Описание созданного счета вместе с владельцем и первой картой.
+
+    На диске хранится компактной строкой [user_id, account_id, card_id, type] (см. to_row / from_row).
+    """
+    user_id: str
+    account_id: str
+    card_id: str | None = None
+    type: AccountType
+
+    def to_row(self) -> list[str | None]:
+        return [self.user_id, self.account_id, self.card_id, self.type]
+
+    @classmethod
+    def from_row(cls, row: list[str | None]) -> "SeedAccountSchema":
+        user_id, account_id, card_id, account_type = row
+        return cls(user_id=user_id, account_id=account_id, card_id=card_id, type=account_type)
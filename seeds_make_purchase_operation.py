@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from clients.gateway import build_grpc_gateway_clients, build_http_gateway_clients
+from clients.http.gateway.accounts.schema import AccountType
+from load.schema import ArrivalProfileSchema
+from scenarios.engine import ScenarioRunner
+from scenarios.flows import SEEDED_MAKE_PURCHASE_OPERATION_SCENARIO
+from seeds.builder import build_seeds_builder
+from seeds.dataset import MappedSeedsDataset
+from seeds.schema import SeedsPlanSchema
+from tools.metrics.aggregator import LatencyAggregator
+
+SEEDS_PATH = Path("seeds.jsonl")
+
+# Пул пользователей с кредитными счетами создаётся один раз и переиспользуется между прогонами
+if not SEEDS_PATH.exists():
+    seeds = build_seeds_builder().build(SeedsPlanSchema(users=1000, accounts=[AccountType.CREDIT_CARD]))
+    seeds.dump(SEEDS_PATH)
+
+dataset = MappedSeedsDataset(SEEDS_PATH)
+
+aggregator = LatencyAggregator()
+
+# Нагрузка идёт только на make_purchase_operation -> get_operation_receipt
+for clients in (build_http_gateway_clients(), build_grpc_gateway_clients()):
+    runner = ScenarioRunner(SEEDED_MAKE_PURCHASE_OPERATION_SCENARIO, clients=clients, aggregator=aggregator)
+    print(runner.run(
+        ArrivalProfileSchema(rate=100, duration=10),
+        contexts=dataset.sampler(AccountType.CREDIT_CARD, seed=0)
+    ))
+
+for report in aggregator.snapshot().report():
+    print(report)
@@ -0,0 +1,205 @@
+import json
+import math
+import random
+from pathlib import Path
+from statistics import NormalDist
+from typing import NamedTuple
+
+from grpc import StatusCode
+
+from stubs.gateway.schema import (
+    DripProfileSchema,
+    FaultProfileSchema,
+    LatencyDistribution,
+    LatencyProfileSchema,
+    OperationFaultsSchema
+)
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML необязателен, без него профили читаются только из JSON
+    yaml = None
+
+# Соответствие gRPC-статусов HTTP-кодам, которые вернул бы http-gateway
+HTTP_STATUS_CODES: dict[StatusCode, int] = {
+    StatusCode.INVALID_ARGUMENT: 400,
+    StatusCode.FAILED_PRECONDITION: 400,
+    StatusCode.OUT_OF_RANGE: 400,
+    StatusCode.UNAUTHENTICATED: 401,
+    StatusCode.PERMISSION_DENIED: 403,
+    StatusCode.NOT_FOUND: 404,
+    StatusCode.ALREADY_EXISTS: 409,
+    StatusCode.ABORTED: 409,
+    StatusCode.RESOURCE_EXHAUSTED: 429,
+    StatusCode.CANCELLED: 499,
+    StatusCode.UNKNOWN: 500,
+    StatusCode.INTERNAL: 500,
+    StatusCode.DATA_LOSS: 500,
+    StatusCode.UNIMPLEMENTED: 501,
+    StatusCode.UNAVAILABLE: 503,
+    StatusCode.DEADLINE_EXCEEDED: 504,
+}
+
+
+class Fault(NamedTuple):
+    """
+    Сбой, который заглушка применяет к одному запросу.
+
+    delay — задержка ответа в секундах, error — код ошибки вместо ответа (None — обычный ответ),
+    drip  — медленная отдача ответа (None — ответ целиком).
+    """
+    delay: float
+    error: StatusCode | None
+    drip: DripProfileSchema | None
+
+
+def load_fault_profile(path: str | Path) -> FaultProfileSchema:
+    """
+    Загружает профиль сбоев из файла JSON (или YAML, если установлен PyYAML).
+
+    :param path: Путь к файлу .json, .yaml или .yml.
+    :return: Профиль сбоев.
+    """
+    path = Path(path)
+    content = path.read_text(encoding="utf-8")
+    if path.suffix in (".yaml", ".yml"):
+        if yaml is None:
+            raise RuntimeError("PyYAML is required to load YAML fault profiles")
+
+        return FaultProfileSchema.model_validate(yaml.safe_load(content))
+
+    return FaultProfileSchema.model_validate(json.loads(content))
+
+
+def sample_latency(profile: LatencyProfileSchema, generator: random.Random) -> float:
+    """
+    :param profile: Распределение задержки.
+    :param generator: Генератор случайных чисел.
+    :return: Задержка в секундах.
+    """
+    if profile.distribution == LatencyDistribution.FIXED or (profile.sigma == 0 and profile.slow_ratio == 0):
+        return profile.latency
+
+    median = profile.latency
+    if profile.distribution == LatencyDistribution.BIMODAL and generator.random() < profile.slow_ratio:
+        median = profile.slow_latency
+
+    return median * math.exp(profile.sigma * generator.gauss()) if median > 0 else 0.0
+
+
+def get_latency_quantile(profile: LatencyProfileSchema, quantile: float) -> float:
+    """
+    Точное значение квантиля распределения — эталон для проверки гистограмм задержек.
+
+    :param profile: Распределение задержки.
+    :param quantile: Квантиль от 0 до 1 (не включая границы), например 0.99.
+    :return: Задержка в секундах.
+    """
+    normal = NormalDist()
+    if profile.distribution == LatencyDistribution.FIXED:
+        return profile.latency
+
+    if profile.distribution == LatencyDistribution.LOGNORMAL:
+        return profile.latency * math.exp(profile.sigma * normal.inv_cdf(quantile))
+
+    # Мода с нулевой медианой или при sigma = 0 — точечная масса, остальные — логнормальные кривые
+    modes = [(profile.latency, 1 - profile.slow_ratio), (profile.slow_latency, profile.slow_ratio)]
+    points = sorted((median, weight) for median, weight in modes if median == 0 or profile.sigma == 0)
+    curves = [(median, weight) for median, weight in modes if median > 0 and profile.sigma > 0]
+    if not curves:
+        cumulative = 0.0
+        for median, weight in points:
+            cumulative += weight
+            if cumulative >= quantile:
+                return median
+
+        return points[-1][0]
+
+    # При sigma > 0 точечная масса может быть только в нуле и лежит левее любой кривой
+    zero_weight = sum(weight for _, weight in points)
+    if quantile <= zero_weight:
+        return 0.0
+
+    if len(curves) == 1:
+        median, weight = curves[0]
+        return median * math.exp(profile.sigma * normal.inv_cdf((quantile - zero_weight) / weight))
+
+    # Функция распределения смеси не обращается аналитически: бинарный поиск по логарифму задержки
+    def cdf(log_value: float) -> float:
+        return sum(
+            weight * normal.cdf((log_value - math.log(median)) / profile.sigma)
+            for median, weight in curves
+        )
+
+    low = math.log(min(median for median, _ in curves)) - 10 * profile.sigma
+    high = math.log(max(median for median, _ in curves)) + 10 * profile.sigma
+    for _ in range(100):
+        middle = (low + high) / 2
+        if cdf(middle) < quantile:
+            low = middle
+        else:
+            high = middle
+
+    return math.exp((low + high) / 2)
+
+
+class _OperationFaults(NamedTuple):
+    latency: LatencyProfileSchema | None
+    errors: list[tuple[float, StatusCode]]
+    drip: DripProfileSchema | None
+
+
+def _compile(faults: OperationFaultsSchema) -> _OperationFaults | None:
+    latency = faults.latency
+    if latency is not None and latency.latency == 0 and (latency.slow_latency == 0 or latency.slow_ratio == 0):
+        latency = None
+
+    # Накопленные доли: один random() выбирает код ошибки или её отсутствие
+    errors, threshold = [], 0.0
+    for code, rate in faults.errors.items():
+        if rate > 0:
+            threshold += rate
+            errors.append((threshold, StatusCode[code]))
+
+    if latency is None and not errors and faults.drip is None:
+        return None
+
+    return _OperationFaults(latency=latency, errors=errors, drip=faults.drip)
+
+
+class FaultInjector:
+    """
+    Решает, какой сбой применить к запросу, одинаково для HTTP- и gRPC-заглушки.
+
+    Настройки операций разбираются один раз; для операций без сбоев sample() возвращает None
+    без обращений к генератору случайных чисел.
+
+    :param profile: Профиль сбоев.
+    """
+
+    def __init__(self, profile: FaultProfileSchema):
+        self.profile = profile
+        self.random = random.Random(profile.seed)
+        self.default = _compile(profile.default)
+        self.operations = {name: _compile(faults) for name, faults in profile.operations.items()}
+        self.enabled = self.default is not None or any(faults is not None for faults in self.operations.values())
+
+    def sample(self, operation: str) -> Fault | None:
+        """
+        :param operation: Имя операции в snake_case (get_user, make_purchase_operation).
+        :return: Сбой для запроса или None, если запрос обрабатывается без изменений.
+        """
+        faults = self.operations.get(operation, self.default)
+        if faults is None:
+            return None
+
+        error = None
+        if faults.errors:
+            value = self.random.random()
+            for threshold, code in faults.errors:
+                if value < threshold:
+                    error = code
+                    break
+
+        delay = 0.0 if faults.latency is None else sample_latency(faults.latency, self.random)
+        return Fault(delay=delay, error=error, drip=faults.drip)
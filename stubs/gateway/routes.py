@@ -0,0 +1,295 @@
+import base64
+import json
+import os
+from typing import Any, Callable
+from urllib.parse import parse_qsl
+
+from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+from grpc import StatusCode
+
+from clients.http.decoding import loads
+from contracts.services.accounts.account_pb2 import AccountStatus, AccountType
+from contracts.services.cards.card_pb2 import Card, CardPaymentSystem, CardStatus, CardType
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.operations.operation_pb2 import Operation, OperationStatus, OperationType
+from contracts.services.users.user_pb2 import User
+from stubs.gateway.faults import HTTP_STATUS_CODES
+from stubs.gateway.state import GatewayState, NotFoundError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен, без него используется стандартный json
+    orjson = None
+
+Handler = Callable[[dict[str, str], Any, str | None], dict[str, Any]]
+
+
+def dumps(value: Any) -> bytes:
+    """
+    :param value: JSON-совместимое значение.
+    :return: Сериализованный JSON.
+    """
+    return orjson.dumps(value) if orjson is not None else json.dumps(value, separators=(",", ":")).encode()
+
+
+def get_enum_names(value: EnumTypeWrapper) -> dict[int, str]:
+    """
+    :param value: protobuf-enum, например AccountType.
+    :return: Номер значения -> имя без общего префикса ("ACCOUNT_TYPE_DEBIT_CARD" -> "DEBIT_CARD").
+    """
+    names = value.keys()
+    prefix = os.path.commonprefix(names)
+    prefix = prefix[:prefix.rfind("_") + 1]
+    return {value.Value(name): name.removeprefix(prefix) for name in names}
+
+
+ACCOUNT_TYPES = get_enum_names(AccountType)
+ACCOUNT_STATUSES = get_enum_names(AccountStatus)
+CARD_TYPES = get_enum_names(CardType)
+CARD_STATUSES = get_enum_names(CardStatus)
+CARD_PAYMENT_SYSTEMS = get_enum_names(CardPaymentSystem)
+OPERATION_TYPES = get_enum_names(OperationType)
+OPERATION_STATUSES = get_enum_names(OperationStatus)
+OPERATION_STATUS_VALUES = {name: number for number, name in OPERATION_STATUSES.items()}
+
+
+def user_to_json(user: User) -> dict[str, Any]:
+    return {
+        "id": user.id,
+        "email": user.email,
+        "lastName": user.last_name,
+        "firstName": user.first_name,
+        "middleName": user.middle_name,
+        "phoneNumber": user.phone_number
+    }
+
+
+def card_to_json(card: Card) -> dict[str, Any]:
+    return {
+        "id": card.id,
+        "pin": card.pin,
+        "cvv": card.cvv,
+        "type": CARD_TYPES[card.type],
+        "status": CARD_STATUSES[card.status],
+        "accountId": card.account_id,
+        "cardNumber": card.card_number,
+        "cardHolder": card.card_holder,
+        "expiryDate": card.expiry_date,
+        "paymentSystem": CARD_PAYMENT_SYSTEMS[card.payment_system]
+    }
+
+
+def account_to_json(account: AccountView) -> dict[str, Any]:
+    return {
+        "id": account.id,
+        "type": ACCOUNT_TYPES[account.type],
+        "cards": [card_to_json(card) for card in account.cards],
+        "status": ACCOUNT_STATUSES[account.status],
+        "balance": account.balance
+    }
+
+
+def operation_to_json(operation: Operation) -> dict[str, Any]:
+    return {
+        "id": operation.id,
+        "type": OPERATION_TYPES[operation.type],
+        "status": OPERATION_STATUSES[operation.status],
+        "amount": operation.amount,
+        "cardId": operation.card_id,
+        "category": operation.category,
+        "createdAt": operation.created_at,
+        "accountId": operation.account_id
+    }
+
+
+def document_to_json(url: str, document: bytes) -> dict[str, Any]:
+    return {"url": url, "document": base64.b64encode(document).decode()}
+
+
+class HTTPError(Exception):
+    """
+    Ошибка обработки запроса с HTTP-кодом ответа.
+    """
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class GatewayRoutes:
+    """
+    Маршруты /api/v1/* http-gateway поверх GatewayState.
+
+    Не зависит от сетевого слоя: один и тот же объект обслуживает asyncio-сервер
+    (stubs.gateway.server) и httpx.MockTransport (build_gateway_mock_transport), поэтому
+    клиентов можно гонять и по сети, и без неё.
+
+    :param state: Состояние заглушки.
+    """
+
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+        # (метод, путь) -> (операция, обработчик); имена операций совпадают с методами клиентов
+        self.exact: dict[tuple[str, str], tuple[str, Handler]] = {
+            ("POST", "/api/v1/users"): ("create_user", self.create_user),
+            ("GET", "/api/v1/accounts"): ("get_accounts", self.get_accounts),
+            ("GET", "/api/v1/operations"): ("get_operations", self.get_operations),
+            ("GET", "/api/v1/operations/operations-summary"): ("get_operations_summary", self.get_operations_summary),
+            ("POST", "/api/v1/cards/issue-virtual-card"): (
+                "issue_virtual_card", self.issue_card(CardType.CARD_TYPE_VIRTUAL)
+            ),
+            ("POST", "/api/v1/cards/issue-physical-card"): (
+                "issue_physical_card", self.issue_card(CardType.CARD_TYPE_PHYSICAL)
+            ),
+        }
+        for account_type in (AccountType.ACCOUNT_TYPE_DEPOSIT, AccountType.ACCOUNT_TYPE_SAVINGS,
+                             AccountType.ACCOUNT_TYPE_DEBIT_CARD, AccountType.ACCOUNT_TYPE_CREDIT_CARD):
+            name = ACCOUNT_TYPES[account_type].lower()
+            self.exact[("POST", f"/api/v1/accounts/open-{name.replace('_', '-')}-account")] = (
+                f"open_{name}_account", self.open_account(account_type)
+            )
+        for operation_type, name in OPERATION_TYPES.items():
+            if operation_type == OperationType.OPERATION_TYPE_UNSPECIFIED:
+                continue
+
+            name = name.lower()
+            self.exact[("POST", f"/api/v1/operations/make-{name.replace('_', '-')}-operation")] = (
+                f"make_{name}_operation", self.make_operation(operation_type)
+            )
+
+        # Маршруты с идентификатором в последнем сегменте пути: (метод, путь до него) -> (операция, обработчик)
+        self.prefixed: dict[tuple[str, str], tuple[str, Handler]] = {
+            ("GET", "/api/v1/users/"): ("get_user", self.get_user),
+            ("GET", "/api/v1/operations/"): ("get_operation", self.get_operation),
+            ("GET", "/api/v1/operations/operation-receipt/"): ("get_operation_receipt", self.get_operation_receipt),
+            ("GET", "/api/v1/documents/tariff-document/"): ("get_tariff_document", self.get_tariff_document),
+            ("GET", "/api/v1/documents/contract-document/"): ("get_contract_document", self.get_contract_document),
+        }
+
+    def resolve(self, method: str, path: str) -> tuple[str, Handler, str | None] | None:
+        """
+        :param method: HTTP-метод.
+        :param path: Путь без строки запроса.
+        :return: (операция, обработчик, идентификатор из пути) или None, если маршрут не найден.
+        """
+        route = self.exact.get((method, path))
+        if route is not None:
+            return route[0], route[1], None
+
+        head, _, tail = path.rpartition("/")
+        route = self.prefixed.get((method, f"{head}/"))
+        if route is not None and tail:
+            return route[0], route[1], tail
+
+        return None
+
+    def handle(self, method: str, target: str, body: bytes) -> tuple[int, bytes]:
+        """
+        Обрабатывает запрос целиком.
+
+        :param method: HTTP-метод.
+        :param target: Путь со строкой запроса.
+        :param body: Тело запроса.
+        :return: (HTTP-код, тело ответа).
+        """
+        path, _, query = target.partition("?")
+        route = self.resolve(method, path)
+        if route is None:
+            return 404, dumps({"detail": f"Route {method} {path} not found"})
+
+        return self.call(route[1], query, body, route[2])
+
+    def call(self, handler: Handler, query: str, body: bytes, param: str | None) -> tuple[int, bytes]:
+        """
+        :param handler: Обработчик из resolve().
+        :param query: Строка запроса.
+        :param body: Тело запроса.
+        :param param: Идентификатор из пути.
+        :return: (HTTP-код, тело ответа).
+        """
+        try:
+            payload = loads(body) if body else None
+            return 200, dumps(handler(dict(parse_qsl(query)), payload, param))
+        except NotFoundError as error:
+            return HTTP_STATUS_CODES[StatusCode.NOT_FOUND], dumps({"detail": error.args[0]})
+        except HTTPError as error:
+            return error.status, dumps({"detail": error.detail})
+        except (KeyError, TypeError, ValueError) as error:
+            return HTTP_STATUS_CODES[StatusCode.INVALID_ARGUMENT], dumps({"detail": f"Invalid request: {error!r}"})
+
+    def create_user(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        user = self.state.create_user(
+            email=body["email"],
+            last_name=body["lastName"],
+            first_name=body["firstName"],
+            middle_name=body["middleName"],
+            phone_number=body["phoneNumber"]
+        )
+        return {"user": user_to_json(user)}
+
+    def get_user(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        return {"user": user_to_json(self.state.get_user(param))}
+
+    def get_accounts(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        return {"accounts": [account_to_json(account) for account in self.state.get_accounts(query["userId"])]}
+
+    def open_account(self, account_type: int) -> Handler:
+        def handler(query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+            return {"account": account_to_json(self.state.open_account(body["userId"], account_type))}
+
+        return handler
+
+    def issue_card(self, card_type: int) -> Handler:
+        def handler(query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+            return {"card": card_to_json(self.state.issue_card(body["userId"], body["accountId"], card_type))}
+
+        return handler
+
+    def make_operation(self, operation_type: int) -> Handler:
+        def handler(query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+            status = OPERATION_STATUS_VALUES.get(body["status"])
+            if status is None:
+                raise HTTPError(400, f"Unknown operation status {body['status']!r}")
+
+            operation = self.state.make_operation(
+                operation_type,
+                status=status,
+                amount=float(body["amount"]),
+                card_id=body["cardId"],
+                account_id=body["accountId"],
+                category=body.get("category", "")
+            )
+            return {"operation": operation_to_json(operation)}
+
+        return handler
+
+    def get_operation(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        return {"operation": operation_to_json(self.state.get_operation(param))}
+
+    def get_operations(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        operations = self.state.get_operations(query["accountId"])
+        return {"operations": [operation_to_json(operation) for operation in operations]}
+
+    def get_operations_summary(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        summary = self.state.get_operations_summary(query["accountId"])
+        return {
+            "summary": {
+                "spentAmount": summary.spent_amount,
+                "receivedAmount": summary.received_amount,
+                "cashbackAmount": summary.cashback_amount
+            }
+        }
+
+    def get_operation_receipt(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        receipt = self.state.get_operation_receipt(param)
+        return {"receipt": document_to_json(receipt.url, receipt.document)}
+
+    def get_tariff_document(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        tariff = self.state.get_tariff_document(param)
+        return {"tariff": document_to_json(tariff.url, tariff.document)}
+
+    def get_contract_document(self, query: dict[str, str], body: Any, param: str | None) -> dict[str, Any]:
+        contract = self.state.get_contract_document(param)
+        return {"contract": document_to_json(contract.url, contract.document)}
@@ -0,0 +1,96 @@
+from enum import StrEnum
+
+from grpc import StatusCode
+from pydantic import BaseModel, Field, field_validator
+
+
+class LatencyDistribution(StrEnum):
+    FIXED = "FIXED"
+    LOGNORMAL = "LOGNORMAL"
+    BIMODAL = "BIMODAL"
+
+
+class LatencyProfileSchema(BaseModel):
+    """
+    Распределение задержки ответа (значения в секундах).
+
+    FIXED     — всегда latency.
+    LOGNORMAL — логнормальное распределение с медианой latency и параметром формы sigma.
+    BIMODAL   — смесь двух логнормальных мод с одинаковой sigma: быстрой (медиана latency)
+                и медленной (медиана slow_latency, доля slow_ratio). Моделирует хвост
+                из-за GC-пауз, холодного кэша и т.п.
+    """
+    distribution: LatencyDistribution = LatencyDistribution.FIXED
+    latency: float = Field(default=0.0, ge=0)
+    sigma: float = Field(default=0.0, ge=0)
+    slow_latency: float = Field(default=0.0, ge=0)
+    slow_ratio: float = Field(default=0.0, ge=0, le=1)
+
+
+class DripProfileSchema(BaseModel):
+    """
+    Медленная отдача ответа: тело уходит порциями по chunk_size байт раз в interval секунд.
+
+    В gRPC унарный ответ нельзя отдать по частям, поэтому заглушка сразу отправляет
+    заголовки (initial metadata), а сообщение — через то же суммарное время.
+    """
+    chunk_size: int = Field(default=64, gt=0)
+    interval: float = Field(default=0.01, ge=0)
+
+
+class OperationFaultsSchema(BaseModel):
+    """
+    Сбои одной операции.
+
+    errors — доля запросов по gRPC-коду, например {"UNAVAILABLE": 0.01, "DEADLINE_EXCEEDED": 0.001};
+    в HTTP код переводится в соответствующий статус (stubs.gateway.faults.HTTP_STATUS_CODES).
+    """
+    latency: LatencyProfileSchema | None = None
+    errors: dict[str, float] = Field(default_factory=dict)
+    drip: DripProfileSchema | None = None
+
+    @field_validator("errors")
+    @classmethod
+    def check_errors(cls, errors: dict[str, float]) -> dict[str, float]:
+        for code, rate in errors.items():
+            if code not in StatusCode.__members__ or code == "OK":
+                raise ValueError(f"Unknown gRPC error status code {code!r}")
+            if rate < 0:
+                raise ValueError(f"Error rate for {code} must not be negative")
+
+        if sum(errors.values()) > 1:
+            raise ValueError("Total error rate must not exceed 1")
+
+        return errors
+
+
+class FaultProfileSchema(BaseModel):
+    """
+    Профиль сбоев заглушки шлюза.
+
+    operations — настройки по операциям (get_user, make_purchase_operation — имена как у методов клиентов,
+    одинаковые для HTTP и gRPC); операция без своей записи получает default.
+    """
+    default: OperationFaultsSchema = Field(default_factory=OperationFaultsSchema)
+    operations: dict[str, OperationFaultsSchema] = Field(default_factory=dict)
+    seed: int | None = None
+
+
+class GatewayStubSettingsSchema(BaseModel):
+    """
+    Настройки заглушки шлюза.
+
+    http_port / grpc_port — порты HTTP- и gRPC-шлюза (None — не запускать).
+    workers — количество процессов: все слушают одни и те же порты (SO_REUSEPORT),
+    соединения распределяет ядро. У каждого процесса своё состояние.
+    strict  — отвечать 404 / NOT_FOUND на неизвестные идентификаторы (см. GatewayState).
+    max_entities / max_listed — сколько сущностей каждого вида и элементов списков хранить в процессе.
+    """
+    host: str = "0.0.0.0"
+    http_port: int | None = 8003
+    grpc_port: int | None = 9003
+    workers: int = Field(default=1, ge=1)
+    strict: bool = False
+    max_entities: int = Field(default=100_000, ge=1)
+    max_listed: int = Field(default=100, ge=1)
+    faults: FaultProfileSchema = Field(default_factory=FaultProfileSchema)
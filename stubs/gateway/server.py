@@ -0,0 +1,479 @@
+import asyncio
+import math
+import multiprocessing
+import signal
+import sys
+import threading
+import time
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, Iterator
+
+import grpc
+from grpc.aio import ServerInterceptor
+from httpx import MockTransport, Request, Response
+
+from clients.grpc.instrumentation import get_operation_name
+from stubs.gateway.faults import Fault, FaultInjector, HTTP_STATUS_CODES
+from stubs.gateway.routes import dumps, GatewayRoutes
+from stubs.gateway.schema import DripProfileSchema, FaultProfileSchema, GatewayStubSettingsSchema
+from stubs.gateway.servicers import add_gateway_servicers_to_server
+from stubs.gateway.state import GatewayState
+
+INJECTED_FAULT_BODY = dumps({"detail": "Injected fault"})
+
+
+@lru_cache(maxsize=None)
+def get_status_line(status: int) -> bytes:
+    """
+    :param status: HTTP-код.
+    :return: Строка статуса ответа, например b"HTTP/1.1 200 OK\\r\\n".
+    """
+    try:
+        reason = HTTPStatus(status).phrase
+    except ValueError:
+        reason = "Error"
+
+    return f"HTTP/1.1 {status} {reason}\r\n".encode()
+
+
+def get_drip_chunks(body: bytes, drip: DripProfileSchema) -> list[bytes]:
+    """
+    :param body: Тело ответа.
+    :param drip: Настройки медленной отдачи.
+    :return: Порции тела ответа.
+    """
+    return [body[index:index + drip.chunk_size] for index in range(0, len(body), drip.chunk_size)]
+
+
+def get_fault_response(fault: Fault) -> tuple[int, bytes] | None:
+    """
+    :param fault: Сбой из FaultInjector.
+    :return: Ответ вместо обработчика или None, если сбой — только задержка.
+    """
+    if fault.error is None:
+        return None
+
+    return HTTP_STATUS_CODES.get(fault.error, 500), INJECTED_FAULT_BODY
+
+
+class HTTPGatewayProtocol(asyncio.Protocol):
+    """
+    Минимальный HTTP/1.1-сервер заглушки на asyncio.Protocol: keep-alive, Content-Length, конвейер запросов.
+
+    Без сбоев ответ пишется прямо в data_received, без создания задач; запросы со сбоями
+    обрабатываются задачами по очереди, чтобы ответы в соединении не менялись местами.
+
+    :param routes: Маршруты /api/v1/*.
+    :param injector: Источник сбоев.
+    :param connections: Открытые соединения сервера; протокол добавляет себя при подключении
+                        и удаляет при отключении, чтобы GatewayStub.stop мог их закрыть.
+    """
+
+    def __init__(
+            self,
+            routes: GatewayRoutes,
+            injector: FaultInjector,
+            connections: set["HTTPGatewayProtocol"] | None = None
+    ):
+        self.routes = routes
+        self.injector = injector
+        self.connections = connections if connections is not None else set()
+        self.transport: asyncio.Transport | None = None
+        self.buffer = b""
+        self.pending: asyncio.Task | None = None
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.connections.add(self)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.transport = None
+        self.connections.discard(self)
+        if self.pending is not None:
+            self.pending.cancel()
+
+    def close(self) -> asyncio.Task | None:
+        """
+        Закрывает соединение и отменяет отложенные ответы.
+
+        :return: Отменённая задача (её нужно дождаться) или None.
+        """
+        pending = self.pending
+        if pending is not None:
+            # Отмена последней задачи отменяет и всю цепочку: каждая ждёт предыдущую
+            pending.cancel()
+        if self.transport is not None:
+            self.transport.close()
+
+        return pending
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        while self.transport is not None:
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                return
+
+            try:
+                lines = self.buffer[:end].decode("latin-1").split("\r\n")
+                method, target, version = lines[0].split(" ", 2)
+                length = 0
+                keep_alive = version == "HTTP/1.1"
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    name = name.strip().lower()
+                    if name == "content-length":
+                        length = int(value)
+                    elif name == "connection":
+                        keep_alive = value.strip().lower() == "keep-alive"
+            except ValueError:
+                self.write(400, dumps({"detail": "Malformed request"}), keep_alive=False)
+                return
+
+            total = end + 4 + length
+            if len(self.buffer) < total:
+                return
+
+            body = self.buffer[end + 4:total]
+            self.buffer = self.buffer[total:]
+            self.dispatch(method, target, body, keep_alive)
+
+    def dispatch(self, method: str, target: str, body: bytes, keep_alive: bool) -> None:
+        path, _, query = target.partition("?")
+        route = self.routes.resolve(method, path)
+        fault = None if route is None else self.injector.sample(route[0])
+
+        if fault is None and self.pending is None:
+            self.write(*self.handle(method, path, query, body, route), keep_alive=keep_alive)
+            return
+
+        self.pending = asyncio.ensure_future(
+            self.respond_later(self.pending, fault, (method, path, query, body, route), keep_alive)
+        )
+
+    def handle(self, method: str, path: str, query: str, body: bytes, route: Any) -> tuple[int, bytes]:
+        if route is None:
+            return 404, dumps({"detail": f"Route {method} {path} not found"})
+
+        return self.routes.call(route[1], query, body, route[2])
+
+    async def respond_later(
+            self,
+            previous: asyncio.Task | None,
+            fault: Fault | None,
+            request: tuple,
+            keep_alive: bool
+    ) -> None:
+        if previous is not None:
+            await previous
+
+        if fault is not None and fault.delay > 0:
+            await asyncio.sleep(fault.delay)
+
+        status, body = (None if fault is None else get_fault_response(fault)) or self.handle(*request)
+        if fault is None or fault.drip is None:
+            self.write(status, body, keep_alive=keep_alive)
+        else:
+            self.write_head(status, len(body), keep_alive=keep_alive)
+            for chunk in get_drip_chunks(body, fault.drip):
+                await asyncio.sleep(fault.drip.interval)
+                if self.transport is None:
+                    break
+
+                self.transport.write(chunk)
+
+            self.finish(keep_alive)
+
+        if self.pending is asyncio.current_task():
+            self.pending = None
+
+    def write_head(self, status: int, length: int, keep_alive: bool) -> None:
+        if self.transport is None:
+            return
+
+        headers = b"content-type: application/json\r\ncontent-length: %d\r\n" % length
+        if not keep_alive:
+            headers += b"connection: close\r\n"
+
+        self.transport.write(get_status_line(status) + headers + b"\r\n")
+
+    def write(self, status: int, body: bytes, keep_alive: bool) -> None:
+        if self.transport is None:
+            return
+
+        self.write_head(status, len(body), keep_alive)
+        self.transport.write(body)
+        self.finish(keep_alive)
+
+    def finish(self, keep_alive: bool) -> None:
+        if self.transport is not None and not keep_alive:
+            self.transport.close()
+
+
+class FaultInjectionInterceptor(ServerInterceptor):
+    """
+    Серверный перехватчик grpc.aio, добавляющий задержки и ошибки из FaultInjector.
+
+    Обработчики оборачиваются один раз на метод, а не на каждый вызов.
+
+    :param injector: Источник сбоев.
+    """
+
+    def __init__(self, injector: FaultInjector):
+        self.injector = injector
+        self.handlers: dict[str, grpc.RpcMethodHandler] = {}
+
+    async def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method
+        handler = self.handlers.get(method)
+        if handler is not None:
+            return handler
+
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        operation = get_operation_name(method)
+        behavior = handler.unary_unary
+
+        async def unary_unary(request, context):
+            fault = self.injector.sample(operation)
+            if fault is None:
+                return await behavior(request, context)
+
+            if fault.delay > 0:
+                await asyncio.sleep(fault.delay)
+            if fault.error is not None:
+                await context.abort(fault.error, "Injected fault")
+            if fault.drip is None:
+                return await behavior(request, context)
+
+            # Унарный ответ нельзя отдать по частям: заголовки уходят сразу, сообщение — за время отдачи порциями
+            await context.send_initial_metadata(())
+            response = await behavior(request, context)
+            chunks = max(1, math.ceil(response.ByteSize() / fault.drip.chunk_size))
+            await asyncio.sleep(chunks * fault.drip.interval)
+            return response
+
+        handler = self.handlers[method] = grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+        return handler
+
+
+class GatewayStub:
+    """
+    HTTP- и gRPC-заглушка шлюза в текущем event loop поверх общего GatewayState.
+
+    Подходит для тестов и бенчмарков в одном процессе:
+
+        stub = GatewayStub(GatewayStubSettingsSchema(host="localhost"))
+        await stub.start()
+        ...
+        await stub.stop()
+
+    Порт 0 в настройках означает свободный порт, выбранный системой; фактические порты
+    после start() — в http_port и grpc_port.
+
+    :param settings: Настройки заглушки (workers здесь не используется, см. serve_gateway_stub).
+    :param state: Состояние. По умолчанию — новое пустое.
+    """
+
+    def __init__(self, settings: GatewayStubSettingsSchema, state: GatewayState | None = None):
+        self.settings = settings
+        self.state = state or GatewayState(
+            strict=settings.strict,
+            max_entities=settings.max_entities,
+            max_listed=settings.max_listed
+        )
+        self.injector = FaultInjector(settings.faults)
+        self.routes = GatewayRoutes(self.state)
+        self.http_server: asyncio.Server | None = None
+        self.connections: set[HTTPGatewayProtocol] = set()
+        self.grpc_server: grpc.aio.Server | None = None
+        self.http_port: int | None = None
+        self.grpc_port: int | None = None
+
+    async def start(self) -> None:
+        if self.settings.http_port is not None:
+            self.http_server = await asyncio.get_running_loop().create_server(
+                lambda: HTTPGatewayProtocol(self.routes, self.injector, self.connections),
+                host=self.settings.host,
+                port=self.settings.http_port,
+                reuse_port=True
+            )
+            self.http_port = self.http_server.sockets[0].getsockname()[1]
+
+        if self.settings.grpc_port is not None:
+            interceptors = [FaultInjectionInterceptor(self.injector)] if self.injector.enabled else []
+            self.grpc_server = grpc.aio.server(interceptors=interceptors)
+            add_gateway_servicers_to_server(self.state, self.grpc_server)
+            self.grpc_port = self.grpc_server.add_insecure_port(f"{self.settings.host}:{self.settings.grpc_port}")
+            await self.grpc_server.start()
+
+    async def stop(self, grace: float | None = None) -> None:
+        if self.http_server is not None:
+            self.http_server.close()
+            # wait_closed ждёт закрытия всех соединений, поэтому сначала закрываем их сами
+            tasks = [task for connection in list(self.connections) if (task := connection.close()) is not None]
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await self.http_server.wait_closed()
+
+        if self.grpc_server is not None:
+            await self.grpc_server.stop(grace)
+
+    async def serve(self) -> None:
+        """
+        Запускает заглушку и работает до отмены.
+        """
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+
+class ThreadedGatewayStub:
+    """
+    GatewayStub в фоновом потоке со своим event loop — для синхронного кода (бенчмарков, скриптов).
+
+        with ThreadedGatewayStub(GatewayStubSettingsSchema(host="localhost", http_port=None, grpc_port=0)) as stub:
+            clients = build_grpc_gateway_clients(target=f"localhost:{stub.grpc_port}")
+
+    :param settings: Настройки заглушки.
+    :param state: Состояние. По умолчанию — новое пустое.
+    """
+
+    def __init__(self, settings: GatewayStubSettingsSchema, state: GatewayState | None = None):
+        self.stub = GatewayStub(settings, state)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+
+    @property
+    def http_port(self) -> int | None:
+        return self.stub.http_port
+
+    @property
+    def grpc_port(self) -> int | None:
+        return self.stub.grpc_port
+
+    def start(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="gateway-stub", daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.stub.start(), self.loop).result()
+
+    def stop(self) -> None:
+        if self.loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.stub.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.loop = self.thread = None
+
+    def __enter__(self) -> "ThreadedGatewayStub":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+def _serve_worker(settings: GatewayStubSettingsSchema, worker: int = 0) -> None:
+    # У каждого процесса свой поток сбоев, иначе все процессы выдавали бы одинаковую последовательность
+    if settings.faults.seed is not None:
+        faults = settings.faults.model_copy(update={"seed": settings.faults.seed + worker})
+        settings = settings.model_copy(update={"faults": faults})
+
+    try:
+        asyncio.run(GatewayStub(settings).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def serve_gateway_stub(settings: GatewayStubSettingsSchema) -> None:
+    """
+    Запускает заглушку шлюза в settings.workers процессах и ждёт их завершения.
+
+    Процессы создаются через fork до создания каких-либо gRPC-объектов, поэтому каждый
+    получает свой event loop и свой gRPC-сервер на общем порту.
+
+    gRPC-каналы одного клиентского процесса по умолчанию делят одно TCP-соединение (глобальный пул
+    подканалов), поэтому чтобы нагрузить все процессы заглушки, нужен пул каналов:
+    build_grpc_gateway_clients(pool_size=N).
+
+    :param settings: Настройки заглушки.
+    """
+    if settings.workers == 1:
+        _serve_worker(settings)
+        return
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_serve_worker, args=(settings, worker), name=f"gateway-stub-{worker}", daemon=True)
+        for worker in range(settings.workers)
+    ]
+    for process in processes:
+        process.start()
+
+    # SIGTERM завершает родителя через finally, иначе процессы-воркеры переживут его
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+
+def build_gateway_mock_transport(
+        state: GatewayState | None = None,
+        faults: FaultProfileSchema | None = None
+) -> MockTransport:
+    """
+    Создаёт httpx.MockTransport, который обслуживает маршруты /api/v1/* без сети.
+
+    Задержки и медленная отдача из faults выполняются через time.sleep, поэтому транспорт
+    подходит только для httpx.Client.
+
+    :param state: Состояние заглушки. По умолчанию — новое пустое.
+    :param faults: Сбои.
+    :return: Транспорт для httpx.Client(transport=..., base_url="http://localhost:8003").
+    """
+    routes = GatewayRoutes(state or GatewayState())
+    injector = FaultInjector(faults or FaultProfileSchema())
+    headers = {"content-type": "application/json"}
+
+    def handler(request: Request) -> Response:
+        target = request.url.raw_path.decode("ascii")
+        path, _, query = target.partition("?")
+        route = routes.resolve(request.method, path)
+        if route is None:
+            return Response(404, content=dumps({"detail": f"Route {request.method} {path} not found"}), headers=headers)
+
+        fault = injector.sample(route[0])
+        if fault is not None and fault.delay > 0:
+            time.sleep(fault.delay)
+
+        response = None if fault is None else get_fault_response(fault)
+        status, content = response or routes.call(route[1], query, request.content, route[2])
+        if fault is None or fault.drip is None:
+            return Response(status, content=content, headers=headers)
+
+        def drip(chunks: list[bytes], interval: float) -> Iterator[bytes]:
+            for chunk in chunks:
+                time.sleep(interval)
+                yield chunk
+
+        return Response(status, content=drip(get_drip_chunks(content, fault.drip), fault.drip.interval), headers=headers)
+
+    return MockTransport(handler)
@@ -0,0 +1,234 @@
+import functools
+from typing import Any, Callable
+
+from grpc import StatusCode
+from grpc.aio import Server, ServicerContext
+
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import (
+    AccountsGatewayServiceServicer,
+    add_AccountsGatewayServiceServicer_to_server
+)
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import (
+    add_CardsGatewayServiceServicer_to_server,
+    CardsGatewayServiceServicer
+)
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardResponse
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardResponse
+from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import (
+    add_DocumentsGatewayServiceServicer_to_server,
+    DocumentsGatewayServiceServicer
+)
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import GetContractDocumentResponse
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import GetTariffDocumentResponse
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import (
+    add_OperationsGatewayServiceServicer_to_server,
+    OperationsGatewayServiceServicer
+)
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationResponse
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import GetOperationReceiptResponse
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import GetOperationsResponse
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import GetOperationsSummaryResponse
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import MakeBillPaymentOperationResponse
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import MakeCashbackOperationResponse
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import MakeFeeOperationResponse
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationResponse
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationResponse
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserResponse
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import (
+    add_UsersGatewayServiceServicer_to_server,
+    UsersGatewayServiceServicer
+)
+from contracts.services.operations.operation_pb2 import OperationType
+from stubs.gateway.state import GatewayState, NotFoundError
+
+
+def handle_errors(method: Callable[[Any, Any, ServicerContext], Any]) -> Callable:
+    """
+    Превращает синхронный обработчик в метод grpc.aio-сервиса, а NotFoundError — в статус NOT_FOUND.
+
+    Обработчики заглушки не ждут ввода-вывода, поэтому сами остаются синхронными.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, request: Any, context: ServicerContext) -> Any:
+        try:
+            return method(self, request, context)
+        except NotFoundError as error:
+            await context.abort(StatusCode.NOT_FOUND, error.args[0])
+
+    return wrapper
+
+
+class UsersGatewayServicer(UsersGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    @handle_errors
+    def GetUser(self, request, context):
+        return GetUserResponse(user=self.state.get_user(request.id))
+
+    @handle_errors
+    def CreateUser(self, request, context):
+        user = self.state.create_user(
+            email=request.email,
+            last_name=request.last_name,
+            first_name=request.first_name,
+            middle_name=request.middle_name,
+            phone_number=request.phone_number
+        )
+        return CreateUserResponse(user=user)
+
+
+class AccountsGatewayServicer(AccountsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    @handle_errors
+    def GetAccounts(self, request, context):
+        return GetAccountsResponse(accounts=self.state.get_accounts(request.user_id))
+
+    @handle_errors
+    def OpenDepositAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.ACCOUNT_TYPE_DEPOSIT)
+        return OpenDepositAccountResponse(account=account)
+
+    @handle_errors
+    def OpenSavingsAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.ACCOUNT_TYPE_SAVINGS)
+        return OpenSavingsAccountResponse(account=account)
+
+    @handle_errors
+    def OpenDebitCardAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.ACCOUNT_TYPE_DEBIT_CARD)
+        return OpenDebitCardAccountResponse(account=account)
+
+    @handle_errors
+    def OpenCreditCardAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.ACCOUNT_TYPE_CREDIT_CARD)
+        return OpenCreditCardAccountResponse(account=account)
+
+
+class CardsGatewayServicer(CardsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    @handle_errors
+    def IssueVirtualCard(self, request, context):
+        card = self.state.issue_card(request.user_id, request.account_id, CardType.CARD_TYPE_VIRTUAL)
+        return IssueVirtualCardResponse(card=card)
+
+    @handle_errors
+    def IssuePhysicalCard(self, request, context):
+        card = self.state.issue_card(request.user_id, request.account_id, CardType.CARD_TYPE_PHYSICAL)
+        return IssuePhysicalCardResponse(card=card)
+
+
+class DocumentsGatewayServicer(DocumentsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    @handle_errors
+    def GetTariffDocument(self, request, context):
+        return GetTariffDocumentResponse(tariff=self.state.get_tariff_document(request.account_id))
+
+    @handle_errors
+    def GetContractDocument(self, request, context):
+        return GetContractDocumentResponse(contract=self.state.get_contract_document(request.account_id))
+
+
+class OperationsGatewayServicer(OperationsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    def make_operation(self, operation_type: int, request: Any) -> Any:
+        return self.state.make_operation(
+            operation_type,
+            status=request.status,
+            amount=request.amount,
+            card_id=request.card_id,
+            account_id=request.account_id
+        )
+
+    @handle_errors
+    def GetOperation(self, request, context):
+        return GetOperationResponse(operation=self.state.get_operation(request.id))
+
+    @handle_errors
+    def GetOperations(self, request, context):
+        return GetOperationsResponse(operations=self.state.get_operations(request.account_id))
+
+    @handle_errors
+    def GetOperationReceipt(self, request, context):
+        return GetOperationReceiptResponse(receipt=self.state.get_operation_receipt(request.operation_id))
+
+    @handle_errors
+    def GetOperationsSummary(self, request, context):
+        return GetOperationsSummaryResponse(summary=self.state.get_operations_summary(request.account_id))
+
+    @handle_errors
+    def MakeFeeOperation(self, request, context):
+        operation = self.make_operation(OperationType.OPERATION_TYPE_FEE, request)
+        return MakeFeeOperationResponse(operation=operation)
+
+    @handle_errors
+    def MakeTopUpOperation(self, request, context):
+        operation = self.make_operation(OperationType.OPERATION_TYPE_TOP_UP, request)
+        return MakeTopUpOperationResponse(operation=operation)
+
+    @handle_errors
+    def MakeCashbackOperation(self, request, context):
+        operation = self.make_operation(OperationType.OPERATION_TYPE_CASHBACK, request)
+        return MakeCashbackOperationResponse(operation=operation)
+
+    @handle_errors
+    def MakePurchaseOperation(self, request, context):
+        operation = self.state.make_operation(
+            OperationType.OPERATION_TYPE_PURCHASE,
+            status=request.status,
+            amount=request.amount,
+            card_id=request.card_id,
+            account_id=request.account_id,
+            category=request.category
+        )
+        return MakePurchaseOperationResponse(operation=operation)
+
+    @handle_errors
+    def MakeTransferOperation(self, request, context):
+        operation = self.make_operation(OperationType.OPERATION_TYPE_TRANSFER, request)
+        return MakeTransferOperationResponse(operation=operation)
+
+    @handle_errors
+    def MakeBillPaymentOperation(self, request, context):
+        operation = self.make_operation(OperationType.OPERATION_TYPE_BILL_PAYMENT, request)
+        return MakeBillPaymentOperationResponse(operation=operation)
+
+    @handle_errors
+    def MakeCashWithdrawalOperation(self, request, context):
+        operation = self.make_operation(OperationType.OPERATION_TYPE_CASH_WITHDRAWAL, request)
+        return MakeCashWithdrawalOperationResponse(operation=operation)
+
+
+def add_gateway_servicers_to_server(state: GatewayState, server: Server) -> None:
+    """
+    Регистрирует на сервере все сервисы шлюза поверх общего состояния.
+
+    :param state: Состояние заглушки.
+    :param server: grpc.aio-сервер.
+    """
+    add_UsersGatewayServiceServicer_to_server(UsersGatewayServicer(state), server)
+    add_AccountsGatewayServiceServicer_to_server(AccountsGatewayServicer(state), server)
+    add_CardsGatewayServiceServicer_to_server(CardsGatewayServicer(state), server)
+    add_DocumentsGatewayServiceServicer_to_server(DocumentsGatewayServicer(state), server)
+    add_OperationsGatewayServiceServicer_to_server(OperationsGatewayServicer(state), server)
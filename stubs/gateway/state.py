@@ -0,0 +1,303 @@
+import itertools
+import os
+from collections import deque, OrderedDict
+from typing import Any
+
+from contracts.services.accounts.account_pb2 import AccountStatus, AccountType
+from contracts.services.cards.card_pb2 import Card, CardPaymentSystem, CardStatus, CardType
+from contracts.services.documents.contracts.contract_pb2 import Contract
+from contracts.services.documents.receipts.receipt_pb2 import Receipt
+from contracts.services.documents.tariffs.tariff_pb2 import Tariff
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.operations.operation_pb2 import Operation, OperationStatus, OperationType
+from contracts.services.operations.operations_summary_pb2 import OperationsSummary
+from contracts.services.users.user_pb2 import User
+
+# Операции, уменьшающие и увеличивающие баланс счета
+SPENDING_OPERATION_TYPES = frozenset({
+    OperationType.OPERATION_TYPE_FEE,
+    OperationType.OPERATION_TYPE_PURCHASE,
+    OperationType.OPERATION_TYPE_TRANSFER,
+    OperationType.OPERATION_TYPE_BILL_PAYMENT,
+    OperationType.OPERATION_TYPE_CASH_WITHDRAWAL,
+})
+RECEIVING_OPERATION_TYPES = frozenset({
+    OperationType.OPERATION_TYPE_TOP_UP,
+    OperationType.OPERATION_TYPE_CASHBACK,
+})
+
+CARD_ACCOUNT_TYPES = frozenset({AccountType.ACCOUNT_TYPE_DEBIT_CARD, AccountType.ACCOUNT_TYPE_CREDIT_CARD})
+
+DOCUMENT = b"%PDF-1.4 fake gateway document"
+
+
+class NotFoundError(KeyError):
+    """
+    Сущность не найдена (NOT_FOUND в gRPC, 404 в HTTP).
+    """
+
+
+class BoundedDict(OrderedDict):
+    """
+    Словарь, который при превышении maxlen удаляет самые старые записи.
+
+    :param maxlen: Максимальное количество записей.
+    """
+
+    def __init__(self, maxlen: int):
+        super().__init__()
+        self.maxlen = maxlen
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        if len(self) > self.maxlen:
+            self.popitem(last=False)
+
+
+def add_to_summary(summary: OperationsSummary, operation: Operation) -> None:
+    """
+    Учитывает завершённую операцию в сводке по счету.
+
+    :param summary: Сводка.
+    :param operation: Операция.
+    """
+    if operation.status != OperationStatus.OPERATION_STATUS_COMPLETED:
+        return
+
+    if operation.type == OperationType.OPERATION_TYPE_CASHBACK:
+        summary.cashback_amount += operation.amount
+    elif operation.type in RECEIVING_OPERATION_TYPES:
+        summary.received_amount += operation.amount
+    else:
+        summary.spent_amount += operation.amount
+
+
+class GatewayState:
+    """
+    Состояние заглушки шлюза в памяти процесса: пользователи, счета, карты и операции.
+
+    Сущности хранятся в виде protobuf-сообщений contracts.services.*, поэтому gRPC-ответы
+    собираются без преобразований, а HTTP-ответы — из тех же сообщений (stubs.gateway.routes).
+
+    В нестрогом режиме (strict=False) запросы к неизвестным идентификаторам не падают:
+    недостающие пользователи и операции создаются на лету. Это нужно, когда заглушка запущена
+    в нескольких процессах: у каждого процесса своё состояние, а соединения клиента
+    распределяются между процессами ядром (SO_REUSEPORT).
+
+    Чтобы память и время ответа не росли на длинных прогонах, хранятся только последние
+    max_entities сущностей каждого вида и последние max_listed счетов пользователя и операций счета.
+    Сводка по операциям считается по мере их создания и учитывает все операции счета.
+    В строгом режиме вытесненные сущности отвечают NotFoundError.
+
+    :param strict: Отвечать NotFoundError на неизвестные идентификаторы.
+    :param max_entities: Сколько пользователей, счетов и операций хранить.
+    :param max_listed: Сколько последних счетов пользователя и операций счета возвращать в списках.
+    """
+
+    def __init__(self, strict: bool = False, max_entities: int = 100_000, max_listed: int = 100):
+        self.strict = strict
+        self.max_listed = max_listed
+        self.prefix = format(os.getpid(), "x")
+        self.counter = itertools.count(1)
+        self.users: BoundedDict = BoundedDict(max_entities)
+        self.accounts: BoundedDict = BoundedDict(max_entities)
+        self.accounts_by_user: BoundedDict = BoundedDict(max_entities)
+        self.operations: BoundedDict = BoundedDict(max_entities)
+        self.operations_by_account: BoundedDict = BoundedDict(max_entities)
+        self.summaries: BoundedDict = BoundedDict(max_entities)
+
+    def next_id(self) -> str:
+        """
+        :return: Идентификатор, уникальный в пределах всех процессов заглушки.
+        """
+        return f"{self.prefix}-{next(self.counter)}"
+
+    def create_user(
+            self,
+            email: str,
+            last_name: str,
+            first_name: str,
+            middle_name: str,
+            phone_number: str
+    ) -> User:
+        user = User(
+            id=self.next_id(),
+            email=email,
+            last_name=last_name,
+            first_name=first_name,
+            middle_name=middle_name,
+            phone_number=phone_number
+        )
+        self.users[user.id] = user
+        return user
+
+    def get_user(self, user_id: str) -> User:
+        user = self.users.get(user_id)
+        if user is None:
+            if self.strict:
+                raise NotFoundError(f"User {user_id} not found")
+
+            user = self.users[user_id] = User(
+                id=user_id,
+                email=f"{user_id}@example.com",
+                last_name="Ivanov",
+                first_name="Ivan",
+                middle_name="Ivanovich",
+                phone_number="+70000000000"
+            )
+
+        return user
+
+    def build_card(self, user: User, account_id: str, card_type: int) -> Card:
+        number = next(self.counter)
+        return Card(
+            id=self.next_id(),
+            pin=f"{number % 10_000:04d}",
+            cvv=f"{number % 1_000:03d}",
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=f"4000{number:012d}",
+            card_holder=f"{user.first_name} {user.last_name}",
+            expiry_date="2030-12-31",
+            payment_system=CardPaymentSystem.CARD_PAYMENT_SYSTEM_VISA
+        )
+
+    def open_account(self, user_id: str, account_type: int) -> AccountView:
+        """
+        Открывает счет. К карточным счетам сразу выпускаются виртуальная и физическая карты.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_type: contracts.services.accounts.AccountType.
+        :return: Открытый счет.
+        """
+        user = self.get_user(user_id)
+        account = AccountView(
+            id=self.next_id(),
+            type=account_type,
+            status=AccountStatus.ACCOUNT_STATUS_ACTIVE,
+            balance=0.0
+        )
+        if account_type in CARD_ACCOUNT_TYPES:
+            account.cards.append(self.build_card(user, account.id, CardType.CARD_TYPE_VIRTUAL))
+            account.cards.append(self.build_card(user, account.id, CardType.CARD_TYPE_PHYSICAL))
+
+        self.accounts[account.id] = account
+        accounts = self.accounts_by_user.get(user_id)
+        if accounts is None:
+            accounts = self.accounts_by_user[user_id] = deque(maxlen=self.max_listed)
+        accounts.append(account)
+        return account
+
+    def get_accounts(self, user_id: str) -> list[AccountView]:
+        return list(self.accounts_by_user.get(user_id, ()))
+
+    def get_account(self, account_id: str) -> AccountView | None:
+        account = self.accounts.get(account_id)
+        if account is None and self.strict:
+            raise NotFoundError(f"Account {account_id} not found")
+
+        return account
+
+    def issue_card(self, user_id: str, account_id: str, card_type: int) -> Card:
+        user = self.get_user(user_id)
+        card = self.build_card(user, account_id, card_type)
+
+        account = self.get_account(account_id)
+        if account is not None:
+            account.cards.append(card)
+
+        return card
+
+    def make_operation(
+            self,
+            operation_type: int,
+            status: int,
+            amount: float,
+            card_id: str,
+            account_id: str,
+            category: str = ""
+    ) -> Operation:
+        """
+        Создаёт операцию и меняет баланс счета, если операция завершена.
+
+        :param operation_type: contracts.services.operations.OperationType.
+        :param status: contracts.services.operations.OperationStatus.
+        :param amount: Сумма операции.
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :param category: Категория (только для покупок).
+        :return: Созданная операция.
+        """
+        account = self.get_account(account_id)
+        operation = Operation(
+            id=self.next_id(),
+            type=operation_type,
+            status=status,
+            amount=amount,
+            card_id=card_id,
+            category=category,
+            created_at="2025-01-01T00:00:00",
+            account_id=account_id
+        )
+        self.operations[operation.id] = operation
+        operations = self.operations_by_account.get(account_id)
+        if operations is None:
+            operations = self.operations_by_account[account_id] = deque(maxlen=self.max_listed)
+        operations.append(operation)
+
+        summary = self.summaries.get(account_id)
+        if summary is None:
+            summary = self.summaries[account_id] = OperationsSummary()
+        add_to_summary(summary, operation)
+
+        if account is not None and status == OperationStatus.OPERATION_STATUS_COMPLETED:
+            if operation_type in SPENDING_OPERATION_TYPES:
+                account.balance -= amount
+            elif operation_type in RECEIVING_OPERATION_TYPES:
+                account.balance += amount
+
+        return operation
+
+    def get_operation(self, operation_id: str) -> Operation:
+        operation = self.operations.get(operation_id)
+        if operation is None:
+            if self.strict:
+                raise NotFoundError(f"Operation {operation_id} not found")
+
+            operation = self.operations[operation_id] = Operation(
+                id=operation_id,
+                type=OperationType.OPERATION_TYPE_PURCHASE,
+                status=OperationStatus.OPERATION_STATUS_COMPLETED,
+                amount=100.0,
+                card_id=operation_id,
+                category="supermarkets",
+                created_at="2025-01-01T00:00:00",
+                account_id=operation_id
+            )
+
+        return operation
+
+    def get_operations(self, account_id: str) -> list[Operation]:
+        return list(self.operations_by_account.get(account_id, ()))
+
+    def get_operations_summary(self, account_id: str) -> OperationsSummary:
+        summary = OperationsSummary()
+        stored = self.summaries.get(account_id)
+        if stored is not None:
+            # Копия: ответ не должен меняться вместе с сохранённой сводкой
+            summary.CopyFrom(stored)
+
+        return summary
+
+    def get_operation_receipt(self, operation_id: str) -> Receipt:
+        operation = self.get_operation(operation_id)
+        return Receipt(url=f"http://localhost:8003/receipts/{operation.id}.pdf", document=DOCUMENT)
+
+    def get_tariff_document(self, account_id: str) -> Tariff:
+        self.get_account(account_id)
+        return Tariff(url=f"http://localhost:8003/tariffs/{account_id}.pdf", document=DOCUMENT)
+
+    def get_contract_document(self, account_id: str) -> Contract:
+        self.get_account(account_id)
+        return Contract(url=f"http://localhost:8003/contracts/{account_id}.pdf", document=DOCUMENT)
@@ -0,0 +1,163 @@
+import math
+import os
+from enum import StrEnum
+from typing import Any, Callable, Self
+
+import numpy
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from tools.fakers import CATEGORIES
+
+
+class AmountDistribution(StrEnum):
+    UNIFORM = "UNIFORM"
+    LOGNORMAL = "LOGNORMAL"
+
+
+class OperationBatchProfileSchema(BaseModel):
+    """
+    Форма трафика операций: распределение сумм и веса статусов и категорий.
+
+    statuses и categories — веса по имени значения (например, {"COMPLETED": 0.9, "FAILED": 0.1}).
+    Значения, которых нет в словаре, не генерируются; пустой словарь — равномерный выбор.
+    """
+    amount_distribution: AmountDistribution = AmountDistribution.LOGNORMAL
+    amount_min: float = Field(default=1, gt=0)
+    amount_max: float = Field(default=1000, gt=0)
+    amount_median: float = Field(default=50, gt=0)
+    amount_sigma: float = Field(default=1.0, gt=0)
+    statuses: dict[str, float] = Field(default_factory=dict)
+    categories: dict[str, float] = Field(default_factory=dict)
+
+    @field_validator("statuses", "categories")
+    @classmethod
+    def check_weights(cls, weights: dict[str, float]) -> dict[str, float]:
+        for name, weight in weights.items():
+            if weight < 0:
+                raise ValueError(f"Weight of {name} must not be negative")
+
+        if weights and sum(weights.values()) <= 0:
+            raise ValueError("Sum of weights must be positive")
+
+        return weights
+
+    @model_validator(mode="after")
+    def check_amounts(self) -> Self:
+        if self.amount_min >= self.amount_max:
+            raise ValueError("amount_min must be less than amount_max")
+
+        return self
+
+
+def get_weights(names: list[str], weights: dict[str, float]) -> numpy.ndarray | None:
+    """
+    :param names: Имена значений.
+    :param weights: Веса по имени.
+    :return: Нормированные вероятности или None, если веса не относятся к этим значениям (равномерный выбор).
+    :raises ValueError: Если у всех значений из names нулевой вес.
+    """
+    if not weights or not any(name in weights for name in names):
+        return None
+
+    probabilities = numpy.array([weights.get(name, 0.0) for name in names], dtype=float)
+    total = probabilities.sum()
+    if total <= 0:
+        raise ValueError(f"Weights {weights} give zero probability to all of {names}")
+
+    return probabilities / total
+
+
+class OperationBatchGenerator:
+    """
+    Генерирует статусы, суммы и категории операций блоками через NumPy.
+
+    Одиночные значения (amount(), category(), status()) выдаются из заранее сгенерированного
+    блока размера batch_size, поэтому на запрос приходится только взятие следующего элемента.
+
+    :param profile: Форма трафика.
+    :param seed: Зерно генератора (например, из faker.random, чтобы поток оставался детерминированным).
+    :param batch_size: Размер блока.
+    """
+
+    def __init__(self, profile: OperationBatchProfileSchema, seed: int | None = None, batch_size: int = 4096):
+        self.profile = profile
+        self.batch_size = batch_size
+        self.generator = numpy.random.default_rng(seed)
+        self.buffers: dict[Any, Any] = {}
+        self.enum_types: dict[Any, tuple[list[str], list[Any]]] = {}
+        self.category_probabilities = get_weights(list(CATEGORIES), profile.categories)
+
+    def amounts(self, size: int) -> list[float]:
+        """
+        :param size: Количество значений.
+        :return: Суммы, округлённые до копеек, в диапазоне [amount_min, amount_max].
+        """
+        profile = self.profile
+        if profile.amount_distribution == AmountDistribution.LOGNORMAL:
+            values = self.generator.lognormal(math.log(profile.amount_median), profile.amount_sigma, size)
+            values = numpy.clip(values, profile.amount_min, profile.amount_max)
+        else:
+            values = self.generator.uniform(profile.amount_min, profile.amount_max, size)
+
+        return numpy.round(values, 2).tolist()
+
+    def categories(self, size: int) -> list[str]:
+        """
+        :param size: Количество значений.
+        :return: Категории покупок с учётом весов профиля.
+        """
+        indexes = self.generator.choice(len(CATEGORIES), size, p=self.category_probabilities)
+        return [CATEGORIES[index] for index in indexes.tolist()]
+
+    def statuses(self, value: Any, size: int) -> list[Any]:
+        """
+        :param value: Enum-класс (например, OperationStatus из схем HTTP) или proto enum.
+        :param size: Количество значений.
+        :return: Значения перечисления с учётом весов профиля.
+        """
+        names, values = self.get_enum(value)
+        indexes = self.generator.choice(len(values), size, p=get_weights(names, self.profile.statuses))
+        return [values[index] for index in indexes.tolist()]
+
+    def batch(self, value: Any, size: int) -> list[tuple[Any, float, str]]:
+        """
+        Генерирует блок параметров операций.
+
+        :param value: Enum статуса операции (StrEnum схем HTTP или proto enum).
+        :param size: Количество операций.
+        :return: Список кортежей (status, amount, category).
+        """
+        return list(zip(self.statuses(value, size), self.amounts(size), self.categories(size)))
+
+    def amount(self) -> float:
+        return self.next("amount", self.amounts)
+
+    def category(self) -> str:
+        return self.next("category", self.categories)
+
+    def status(self, value: Any) -> Any:
+        return self.next(value, lambda size: self.statuses(value, size))
+
+    def get_enum(self, value: Any) -> tuple[list[str], list[Any]]:
+        result = self.enum_types.get(value)
+        if result is None:
+            if isinstance(value, type):
+                result = [member.name for member in value], list(value)
+            else:
+                # В proto enum имена с префиксом типа (OPERATION_STATUS_COMPLETED): веса профиля
+                # задаются без него, одинаково для HTTP и gRPC
+                names = list(value.keys())
+                prefix = os.path.commonprefix(names)
+                prefix = prefix[:prefix.rfind("_") + 1]
+                result = [name.removeprefix(prefix) for name in names], list(value.values())
+            self.enum_types[value] = result
+
+        return result
+
+    def next(self, key: Any, generate: Callable[[int], list]) -> Any:
+        buffer = self.buffers.get(key)
+        if buffer:
+            return buffer.pop()
+
+        buffer = self.buffers[key] = generate(self.batch_size)
+        return buffer.pop()
@@ -0,0 +1,177 @@
+import json
+import mmap
+import os
+import random
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# Заголовок индекса: сигнатура, размер и время изменения исходного файла (для проверки актуальности)
+# и количество смещений (для проверки, что индекс записан целиком)
+INDEX_HEADER = struct.Struct("<8sQQQ")
+INDEX_MAGIC = b"JSONLIX2"
+
+
+def build_jsonl_index(path: str | Path, index_path: str | Path) -> None:
+    """
+    Строит бинарный индекс JSONL-файла: смещения начала каждой непустой строки (uint64)
+    и смещение конца последней строки.
+
+    Индекс пишется во временный файл рядом и заменяет старый через os.replace(), поэтому
+    другие процессы видят либо прежний индекс, либо новый целиком.
+
+    :param path: Путь к JSONL-файлу.
+    :param index_path: Путь, по которому сохранить индекс.
+    """
+    stat = os.stat(path)
+    offsets = array("Q")
+    with open(path, "rb") as file:
+        offset = 0
+        for line in file:
+            if line.strip():
+                offsets.append(offset)
+            offset += len(line)
+        end = offset
+
+    offsets.append(end)
+    index_path = Path(index_path)
+    descriptor, temp_path = tempfile.mkstemp(dir=index_path.parent, prefix=f"{index_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(INDEX_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)))
+            offsets.tofile(file)
+        os.replace(temp_path, index_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def is_jsonl_index_fresh(path: str | Path, index_path: str | Path) -> bool:
+    """
+    :param path: Путь к JSONL-файлу.
+    :param index_path: Путь к индексу.
+    :return: True, если индекс существует, записан целиком и построен по текущей версии файла.
+    """
+    if not os.path.exists(index_path):
+        return False
+
+    stat = os.stat(path)
+    with open(index_path, "rb") as file:
+        header = file.read(INDEX_HEADER.size)
+        size = os.fstat(file.fileno()).st_size
+
+    if len(header) != INDEX_HEADER.size:
+        return False
+
+    magic, source_size, source_mtime, count = INDEX_HEADER.unpack(header)
+    return (
+        (magic, source_size, source_mtime) == (INDEX_MAGIC, stat.st_size, stat.st_mtime_ns)
+        and count > 0
+        and size == INDEX_HEADER.size + count * 8
+    )
+
+
+class JSONLDataset:
+    """
+    Датасет в формате JSON Lines, открытый через mmap.
+
+    Файл и его бинарный индекс (<path>.idx) отображаются в память только на чтение, поэтому:
+    - открытие не читает файл целиком и занимает миллисекунды;
+    - доступ к строке по номеру — O(1): смещение берётся из индекса;
+    - после fork воркеры используют те же страницы page cache, копии датасета не создаются.
+
+    Индекс строится при первом открытии и перестраивается, если файл изменился.
+
+    :param path: Путь к JSONL-файлу.
+    :param index_path: Путь к индексу. По умолчанию — <path>.idx.
+    """
+
+    def __init__(self, path: str | Path, index_path: str | Path | None = None):
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else self.path.with_name(f"{self.path.name}.idx")
+
+        if not is_jsonl_index_fresh(self.path, self.index_path):
+            build_jsonl_index(self.path, self.index_path)
+
+        with open(self.index_path, "rb") as file:
+            self.index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        count = INDEX_HEADER.unpack_from(self.index_map)[3]
+        if len(self.index_map) != INDEX_HEADER.size + count * 8:
+            raise ValueError(f"Dataset index {self.index_path} is incomplete")
+        self.offsets = memoryview(self.index_map)[INDEX_HEADER.size:].cast("Q")
+
+        # mmap нельзя создать для пустого файла
+        self.data_map = None
+        if len(self.offsets) > 1:
+            with open(self.path, "rb") as file:
+                self.data_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        return json.loads(self.row(index))
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.shard(0, 1)
+
+    def row(self, index: int) -> bytes:
+        """
+        :param index: Номер строки (поддерживаются отрицательные индексы).
+        :return: Строка датасета без разбора JSON.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Dataset row {index} is out of range")
+
+        return self.data_map[self.offsets[index]:self.offsets[index + 1]]
+
+    def shard(self, worker: int, workers: int, start: int = 0, stop: int | None = None) -> Iterator[Any]:
+        """
+        Последовательно читает строки, принадлежащие воркеру: start + worker, start + worker + workers, ...
+
+        :param worker: Номер воркера (с нуля).
+        :param workers: Общее количество воркеров.
+        :param start: Начало диапазона строк.
+        :param stop: Конец диапазона строк (не включительно). По умолчанию — конец датасета.
+        :return: Итератор по разобранным строкам.
+        """
+        stop = len(self) if stop is None else stop
+        for index in range(start + worker, stop, workers):
+            yield self[index]
+
+    def sampler(
+            self,
+            seed: int | None = None,
+            start: int = 0,
+            stop: int | None = None
+    ) -> Callable[[], Any]:
+        """
+        Создаёт функцию, возвращающую случайную строку из диапазона.
+
+        :param seed: Зерно генератора случайных чисел.
+        :param start: Начало диапазона строк.
+        :param stop: Конец диапазона строк (не включительно). По умолчанию — конец датасета.
+        :return: Функция без аргументов, возвращающая разобранную строку.
+        """
+        stop = len(self) if stop is None else stop
+        if start >= stop:
+            raise ValueError(f"Dataset range [{start}, {stop}) is empty")
+
+        generator = random.Random(seed)
+        return lambda: self[generator.randrange(start, stop)]
+
+    def close(self) -> None:
+        self.offsets.release()
+        self.index_map.close()
+        if self.data_map is not None:
+            self.data_map.close()
+
+    def __enter__(self) -> "JSONLDataset":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,13 +1,94 @@
+import itertools
+import os
 import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from tools.batches import OperationBatchGenerator, OperationBatchProfileSchema
+
+CATEGORIES = (
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+)
+
+
+class FakePool(BaseModel):
+    """
+    Заранее сгенерированные значения для Fake в режиме пула.
+    """
+    emails: list[str]
+    last_names: list[str]
+    first_names: list[str]
+    phone_numbers: list[str]
+
+    @property
+    def size(self) -> int:
+        return len(self.emails)
+
+
+def build_fake_pool(faker: Faker, size: int = 10_000, cache_path: str | Path | None = None) -> FakePool:
+    """
+    Генерирует пул значений через Faker или загружает его из кэша на диске.
+
+    :param faker: Экземпляр Faker, которым генерируется пул.
+    :param size: Количество значений каждого вида.
+    :param cache_path: Путь к JSON-файлу кэша. Если файл есть и размер совпадает, пул читается из него,
+                       иначе генерируется и сохраняется.
+    :return: Пул значений.
+    """
+    if cache_path and os.path.exists(cache_path):
+        pool = FakePool.model_validate_json(Path(cache_path).read_bytes())
+        if pool.size == size:
+            return pool
+
+    pool = FakePool(
+        emails=[faker.email() for _ in range(size)],
+        last_names=[faker.last_name() for _ in range(size)],
+        first_names=[faker.first_name() for _ in range(size)],
+        phone_numbers=[faker.phone_number() for _ in range(size)]
+    )
+    if cache_path:
+        Path(cache_path).write_text(pool.model_dump_json())
+
+    return pool
 
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    В режиме пула (use_pool) имена, телефоны и email берутся случайным выбором из заранее
+    сгенерированного FakePool, а суммы и enum генерируются через faker.random без провайдеров Faker.
+    Режим включается на существующем экземпляре, поэтому default_factory схем
+    (Field(default_factory=fake.email)) тоже начинают брать значения из пула.
+
+    После seed() экземпляр выдаёт детерминированный поток данных воркера: два прогона
+    с одинаковыми seed и worker_id генерируют одинаковые запросы (кроме run_id в email).
+
+    Клиенты шлюза и default_factory схем запросов берут данные из общего для процесса
+    экземпляра fake, поэтому для них поток воркера задаётся вызовом fake.seed(seed, worker_id=...)
+    в каждом процессе (так делают load.runner.MultiProcessRunner и scenarios.distributed).
     """
 
     def __init__(self, faker: Faker):
@@ -15,6 +96,71 @@ class Fake:
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
         """
         self.faker = faker
+        self.pool: FakePool | None = None
+        self.counter = itertools.count()
+        self.enum_values: dict[type, tuple] = {}
+        self.worker_id: int | None = None
+        self.run_id: str | None = None
+        self.batches: "OperationBatchGenerator | None" = None
+
+    def seed(self, seed: int, worker_id: int = 0, run_id: str | None = None) -> None:
+        """
+        Делает поток данных детерминированным для пары (seed, worker_id).
+
+        Поток детерминирован в пределах одного потока выполнения: если экземпляр делят
+        несколько потоков или гринлетов, порядок их обращений к нему не фиксирован. Отдельный поток
+        на каждый из них даёт только свой экземпляр build_fake() в коде, который сам собирает запросы.
+
+        :param seed: Зерно прогона, общее для всех воркеров.
+        :param worker_id: Номер воркера, уникальный в пределах прогона (в том числе на разных машинах).
+        :param run_id: Идентификатор прогона для уникальных значений. По умолчанию — время вызова.
+        """
+        self.faker.seed_instance(f"{seed}:{worker_id}")
+        self.worker_id = worker_id
+        self.run_id = run_id or format(time.time_ns(), "x")
+        self.counter = itertools.count()
+
+    def use_pool(self, pool: FakePool | None) -> None:
+        """
+        Включает режим пула (или выключает, если передан None).
+
+        :param pool: Пул значений, например build_fake_pool(faker, size=100_000, cache_path="fakes.json").
+        """
+        self.pool = pool
+
+    def use_batches(self, profile: "OperationBatchProfileSchema | None" = None, batch_size: int = 4096) -> None:
+        """
+        Включает блочную генерацию сумм, категорий и значений enum через NumPy (tools.batches).
+
+        Генератор блоков получает зерно из faker.random, поэтому после seed() поток остаётся детерминированным.
+
+        Блок целиком доступен через fake.batches.batch(OperationStatus, size) -> [(status, amount, category), ...].
+
+        :param profile: Форма трафика. None — выключить блочную генерацию.
+        :param batch_size: Размер блока.
+        """
+        if profile is None:
+            self.batches = None
+            return
+
+        # NumPy нужен только для блочной генерации, поэтому импортируется здесь
+        from tools.batches import OperationBatchGenerator
+
+        self.batches = OperationBatchGenerator(profile, seed=self.faker.random.getrandbits(64), batch_size=batch_size)
+
+    def unique_id(self) -> str:
+        """
+        Генерирует идентификатор, уникальный в пределах прогона.
+
+        После seed() — "<run_id>.<worker_id>.<номер>": не зависит от часов и не пересекается
+        между процессами и машинами с разными worker_id. До seed() — "<time.time()>.<номер>".
+
+        :return: Уникальный идентификатор.
+        """
+        if self.worker_id is None:
+            return f"{time.time()}.{next(self.counter)}"
+
+        return f"{self.run_id}.{self.worker_id}.{next(self.counter)}"
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -23,6 +169,15 @@ class Fake:
         :param value: Enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
+        if self.batches is not None:
+            return self.batches.status(value)
+
+        if self.pool is not None:
+            values = self.enum_values.get(value)
+            if values is None:
+                values = self.enum_values[value] = tuple(value)
+            return self.faker.random.choice(values)
+
         return self.faker.enum(value)
 
     def email(self) -> str:
@@ -30,9 +185,13 @@ class Fake:
         Генерирует случайный email.
 
         Если не указан, будет использован случайный домен.
+        Уникальность обеспечивает префикс unique_id().
         :return: Случайный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        if self.pool is not None:
+            return f"{self.unique_id()}.{self.faker.random.choice(self.pool.emails)}"
+
+        return f"{self.unique_id()}.{self.faker.email()}"
 
     def category(self) -> str:
         """
@@ -43,25 +202,10 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        if self.batches is not None:
+            return self.batches.category()
+
+        return self.faker.random.choice(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -69,6 +213,9 @@ class Fake:
 
         :return: Случайная фамилия.
         """
+        if self.pool is not None:
+            return self.faker.random.choice(self.pool.last_names)
+
         return self.faker.last_name()
 
     def first_name(self) -> str:
@@ -77,6 +224,9 @@ class Fake:
 
         :return: Случайное имя.
         """
+        if self.pool is not None:
+            return self.faker.random.choice(self.pool.first_names)
+
         return self.faker.first_name()
 
     def middle_name(self) -> str:
@@ -85,6 +235,9 @@ class Fake:
 
         :return: Случайное отчество.
         """
+        if self.pool is not None:
+            return self.faker.random.choice(self.pool.first_names)
+
         return self.faker.first_name()
 
     def phone_number(self) -> str:
@@ -93,6 +246,9 @@ class Fake:
 
         :return: Случайный номер телефона.
         """
+        if self.pool is not None:
+            return self.faker.random.choice(self.pool.phone_numbers)
+
         return self.faker.phone_number()
 
     def float(self, start: int = 1, end: int = 100) -> float:
@@ -103,14 +259,20 @@ class Fake:
         :param end: Конец диапазона (включительно).
         :return: Случайное число с плавающей запятой.
         """
+        if self.pool is not None:
+            return round(self.faker.random.uniform(start, end), 2)
+
         return self.faker.pyfloat(min_value=start, max_value=end, right_digits=2)
 
     def amount(self) -> float:
         """
         Генерирует случайную денежную сумму.
 
-        :return: Сумма от 1 до 1000.
+        :return: Сумма от 1 до 1000 (при блочной генерации — по распределению профиля).
         """
+        if self.batches is not None:
+            return self.batches.amount()
+
         return self.float(1, 1000)
 
     def proto_enum(self, value: EnumTypeWrapper) -> int:
@@ -120,7 +282,35 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
+        if self.batches is not None:
+            return self.batches.status(value)
+
+        if self.pool is not None:
+            values = self.enum_values.get(value)
+            if values is None:
+                values = self.enum_values[value] = tuple(value.values())
+            return self.faker.random.choice(values)
+
         return self.faker.random_element(value.values())
 
 
+def build_fake(seed: int, worker_id: int = 0, run_id: str | None = None, pool: FakePool | None = None) -> Fake:
+    """
+    Создаёт отдельный детерминированный поток фейковых данных (например, для гринлета или потока).
+
+    Клиенты шлюза такой экземпляр не используют (они берут данные из fake): он нужен коду,
+    который сам собирает запросы, например grpcio_*.py или собственные шаги нагрузки.
+
+    :param seed: Зерно прогона.
+    :param worker_id: Номер воркера, уникальный в пределах прогона.
+    :param run_id: Идентификатор прогона для уникальных значений.
+    :param pool: Пул значений для режима пула.
+    :return: Инициализированный экземпляр Fake.
+    """
+    result = Fake(faker=Faker())
+    result.seed(seed, worker_id=worker_id, run_id=run_id)
+    result.use_pool(pool)
+    return result
+
+
 fake = Fake(faker=Faker())
@@ -0,0 +1,146 @@
+import threading
+
+from pydantic import BaseModel
+
+from clients.instrumentation import RequestRecord
+from tools.metrics.histogram import DEFAULT_PERCENTILES, HistogramSnapshot, LatencyHistogram
+
+
+class OperationLatencyReport(BaseModel):
+    """
+    Итоговая статистика задержек одной операции (значения в микросекундах).
+    """
+    name: str
+    count: int
+    errors: int
+    min: int
+    mean: float
+    max: int
+    percentiles: dict[str, int]
+
+
+class LatencySnapshot(BaseModel):
+    """
+    Снимок агрегатора: гистограммы и количество ошибок по операциям.
+
+    Снимки воркеров складываются через merge(), а перцентили считаются уже по сумме
+    гистограмм — усреднять перцентили разных воркеров нельзя.
+    """
+    histograms: dict[str, HistogramSnapshot] = {}
+    errors: dict[str, int] = {}
+
+    def merge(self, other: "LatencySnapshot") -> "LatencySnapshot":
+        """
+        :param other: Снимок другого воркера.
+        :return: Новый снимок с суммой гистограмм и ошибок.
+        """
+        histograms = dict(self.histograms)
+        for name, histogram in other.histograms.items():
+            histograms[name] = histograms[name].merge(histogram) if name in histograms else histogram
+
+        errors = dict(self.errors)
+        for name, count in other.errors.items():
+            errors[name] = errors.get(name, 0) + count
+
+        return LatencySnapshot(histograms=histograms, errors=errors)
+
+    def report(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> list[OperationLatencyReport]:
+        """
+        :param percentiles: Перцентили, которые нужно посчитать.
+        :return: Статистика по каждой операции, отсортированная по имени.
+        """
+        reports = []
+        for name in sorted(self.histograms):
+            histogram = LatencyHistogram.from_snapshot(self.histograms[name])
+            reports.append(OperationLatencyReport(
+                name=name,
+                count=histogram.total_count,
+                errors=self.errors.get(name, 0),
+                min=histogram.min_value,
+                mean=histogram.mean,
+                max=histogram.max_value,
+                percentiles={f"p{percentile:g}": value for percentile, value in histogram.percentiles(percentiles).items()}
+            ))
+
+        return reports
+
+
+class LatencyAggregator:
+    """
+    Собирает задержки вызовов в HDR-гистограммы по операциям.
+
+    Экземпляр можно подписать на clients.instrumentation.instrumentation:
+    каждая RequestRecord попадает в гистограмму "<transport>:<operation>".
+    Записывать можно из нескольких потоков одновременно.
+
+    :param lowest: Минимальное различимое значение в микросекундах.
+    :param highest: Максимальное отслеживаемое значение в микросекундах.
+    :param significant_figures: Количество значащих цифр точности.
+    """
+
+    def __init__(self, lowest: int = 1, highest: int = 60_000_000, significant_figures: int = 3):
+        self.lowest = lowest
+        self.highest = highest
+        self.significant_figures = significant_figures
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.errors: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, record: RequestRecord) -> None:
+        self.record(f"{record.transport}:{record.operation}", record.end - record.start, record.ok)
+
+    def record(self, name: str, seconds: float, ok: bool = True) -> None:
+        """
+        Записывает задержку операции.
+
+        :param name: Имя операции.
+        :param seconds: Задержка в секундах.
+        :param ok: Успешно ли завершился вызов.
+        """
+        value = int(seconds * 1_000_000)
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram(
+                    lowest=self.lowest,
+                    highest=self.highest,
+                    significant_figures=self.significant_figures
+                )
+
+            histogram.record(value)
+            if not ok:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def merge(self, snapshot: LatencySnapshot) -> None:
+        """
+        Добавляет к агрегатору данные из снимка (например, от другого воркера).
+
+        :param snapshot: Снимок агрегатора.
+        """
+        with self.lock:
+            for name, histogram in snapshot.histograms.items():
+                if name in self.histograms:
+                    self.histograms[name].merge(histogram)
+                else:
+                    self.histograms[name] = LatencyHistogram.from_snapshot(histogram)
+
+            for name, count in snapshot.errors.items():
+                self.errors[name] = self.errors.get(name, 0) + count
+
+    def snapshot(self) -> LatencySnapshot:
+        """
+        :return: Сериализуемый снимок всех гистограмм.
+        """
+        with self.lock:
+            return LatencySnapshot(
+                histograms={name: histogram.snapshot() for name, histogram in self.histograms.items()},
+                errors=dict(self.errors)
+            )
+
+    def reset(self) -> None:
+        """
+        Удаляет все накопленные данные.
+        """
+        with self.lock:
+            self.histograms.clear()
+            self.errors.clear()
@@ -0,0 +1,252 @@
+import math
+from array import array
+
+from pydantic import BaseModel
+
+DEFAULT_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9, 99.99)
+
+
+class HistogramSnapshot(BaseModel):
+    """
+    Сериализуемый снимок гистограммы задержек.
+
+    Счётчики хранятся разреженно (только непустые ячейки), поэтому снимок компактен
+    и его можно передать между процессами и машинами как JSON.
+    Снимки с одинаковыми параметрами складываются без потери точности.
+    """
+    lowest: int
+    highest: int
+    significant_figures: int
+    total_count: int = 0
+    total_sum: int = 0
+    min_value: int = 0
+    max_value: int = 0
+    counts: list[tuple[int, int]] = []
+
+    def merge(self, other: "HistogramSnapshot") -> "HistogramSnapshot":
+        """
+        Складывает два снимка.
+
+        :param other: Снимок с теми же lowest/highest/significant_figures.
+        :return: Новый снимок с суммой счётчиков.
+        """
+        histogram = LatencyHistogram.from_snapshot(self)
+        histogram.merge(other)
+        return histogram.snapshot()
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в стиле HdrHistogram.
+
+    Значения (в микросекундах) раскладываются по логарифмическим корзинам с линейными
+    подкорзинами, поэтому относительная погрешность не превышает 10^-significant_figures
+    на всём диапазоне, а память фиксирована и не зависит от количества замеров.
+
+    :param lowest: Минимальное различимое значение в микросекундах.
+    :param highest: Максимальное отслеживаемое значение в микросекундах (большие значения обрезаются).
+    :param significant_figures: Количество значащих цифр точности (1–5).
+    """
+
+    def __init__(self, lowest: int = 1, highest: int = 60_000_000, significant_figures: int = 3):
+        if lowest < 1:
+            raise ValueError("lowest must be >= 1")
+        if highest < 2 * lowest:
+            raise ValueError("highest must be >= 2 * lowest")
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+
+        self.lowest = lowest
+        self.highest = highest
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        sub_bucket_count_magnitude = max(math.ceil(math.log2(largest_single_unit)), 1)
+        self.sub_bucket_half_count_magnitude = sub_bucket_count_magnitude - 1
+        self.sub_bucket_count = 1 << sub_bucket_count_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.unit_magnitude = int(math.floor(math.log2(lowest)))
+        self.sub_bucket_mask = (self.sub_bucket_count - 1) << self.unit_magnitude
+
+        smallest_untrackable = self.sub_bucket_count << self.unit_magnitude
+        bucket_count = 1
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+
+        self.bucket_count = bucket_count
+        self.counts = array("q", bytes(8 * (bucket_count + 1) * self.sub_bucket_half_count))
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Обнуляет все счётчики.
+        """
+        for index in range(len(self.counts)):
+            self.counts[index] = 0
+
+        self.total_count = 0
+        self.total_sum = 0
+        self.min_value = 0
+        self.max_value = 0
+
+    def _index_of(self, value: int) -> int:
+        bucket_index = (
+                (value | self.sub_bucket_mask).bit_length()
+                - self.unit_magnitude
+                - (self.sub_bucket_half_count_magnitude + 1)
+        )
+        sub_bucket_index = value >> (bucket_index + self.unit_magnitude)
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + (
+                sub_bucket_index - self.sub_bucket_half_count
+        )
+
+    def _value_at_index(self, index: int) -> int:
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+
+        return sub_bucket_index << (bucket_index + self.unit_magnitude)
+
+    def _highest_equivalent_value(self, index: int) -> int:
+        value = self._value_at_index(index)
+        bucket_index = max((index >> self.sub_bucket_half_count_magnitude) - 1, 0)
+        return value + (1 << (bucket_index + self.unit_magnitude)) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Записывает значение.
+
+        :param value: Задержка в микросекундах.
+        :param count: Сколько раз значение встретилось.
+        """
+        if value < 0:
+            value = 0
+        elif value > self.highest:
+            value = self.highest
+
+        self.counts[self._index_of(value)] += count
+        if self.total_count == 0 or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+        self.total_count += count
+        self.total_sum += value * count
+
+    def record_seconds(self, seconds: float) -> None:
+        """
+        Записывает задержку, измеренную в секундах (например, разницу perf_counter()).
+
+        :param seconds: Задержка в секундах.
+        """
+        self.record(int(seconds * 1_000_000))
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        :param percentile: Перцентиль от 0 до 100.
+        :return: Значение в микросекундах, не меньше которого percentile% замеров.
+        """
+        if self.total_count == 0:
+            return 0
+
+        target = max(math.ceil(min(percentile, 100.0) / 100 * self.total_count), 1)
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self._highest_equivalent_value(index), self.max_value)
+
+        return self.max_value
+
+    @property
+    def mean(self) -> float:
+        return self.total_sum / self.total_count if self.total_count else 0.0
+
+    def percentiles(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[float, int]:
+        """
+        Считает несколько перцентилей за один проход по счётчикам.
+
+        :param percentiles: Перцентили от 0 до 100.
+        :return: Словарь перцентиль -> значение в микросекундах.
+        """
+        result = {percentile: 0 for percentile in percentiles}
+        if self.total_count == 0:
+            return result
+
+        targets = sorted(
+            (max(math.ceil(min(percentile, 100.0) / 100 * self.total_count), 1), percentile)
+            for percentile in percentiles
+        )
+        cumulative, position = 0, 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+
+            cumulative += count
+            while position < len(targets) and cumulative >= targets[position][0]:
+                result[targets[position][1]] = min(self._highest_equivalent_value(index), self.max_value)
+                position += 1
+
+            if position == len(targets):
+                break
+
+        return result
+
+    def merge(self, snapshot: HistogramSnapshot) -> None:
+        """
+        Добавляет к гистограмме счётчики из снимка.
+
+        :param snapshot: Снимок с теми же параметрами точности и диапазона.
+        """
+        if (snapshot.lowest, snapshot.highest, snapshot.significant_figures) != (
+                self.lowest, self.highest, self.significant_figures
+        ):
+            raise ValueError("Cannot merge histograms with different lowest/highest/significant_figures")
+
+        if snapshot.total_count == 0:
+            return
+
+        for index, count in snapshot.counts:
+            self.counts[index] += count
+
+        if self.total_count == 0 or snapshot.min_value < self.min_value:
+            self.min_value = snapshot.min_value
+        if snapshot.max_value > self.max_value:
+            self.max_value = snapshot.max_value
+
+        self.total_count += snapshot.total_count
+        self.total_sum += snapshot.total_sum
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        :return: Сериализуемый снимок текущего состояния.
+        """
+        return HistogramSnapshot(
+            lowest=self.lowest,
+            highest=self.highest,
+            significant_figures=self.significant_figures,
+            total_count=self.total_count,
+            total_sum=self.total_sum,
+            min_value=self.min_value,
+            max_value=self.max_value,
+            counts=[(index, count) for index, count in enumerate(self.counts) if count]
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: HistogramSnapshot) -> "LatencyHistogram":
+        """
+        Восстанавливает гистограмму из снимка.
+
+        :param snapshot: Снимок гистограммы.
+        :return: Новая гистограмма с теми же счётчиками.
+        """
+        histogram = cls(
+            lowest=snapshot.lowest,
+            highest=snapshot.highest,
+            significant_figures=snapshot.significant_figures
+        )
+        histogram.merge(snapshot)
+        return histogram